@@ -4,19 +4,25 @@ from ._version import get_versions  # isort:skip
 __version__ = get_versions()["version"]  # isort:skip
 del get_versions  # isort:skip
 
-from great_expectations.data_context import DataContext
+from great_expectations.lazy_loading import set_lazy_attributes
 
-from .util import (
-    from_pandas,
-    measure_execution_time,
-    read_csv,
-    read_excel,
-    read_feather,
-    read_json,
-    read_parquet,
-    read_pickle,
-    read_table,
-    validate,
+# DataContext and the helpers from util import pandas, sqlalchemy and the renderers, so they are only imported
+# when first used rather than with great_expectations, e.g. for every CLI command
+set_lazy_attributes(
+    __name__,
+    {
+        "DataContext": "great_expectations.data_context",
+        "from_pandas": "great_expectations.util",
+        "measure_execution_time": "great_expectations.util",
+        "read_csv": "great_expectations.util",
+        "read_excel": "great_expectations.util",
+        "read_feather": "great_expectations.util",
+        "read_json": "great_expectations.util",
+        "read_parquet": "great_expectations.util",
+        "read_pickle": "great_expectations.util",
+        "read_table": "great_expectations.util",
+        "validate": "great_expectations.util",
+    },
 )
 
 rtd_url_ge_version = __version__.replace(".", "_")
@@ -111,20 +111,32 @@
 
 import os
 import sys
+from typing import TYPE_CHECKING
 
 import click
 from ruamel.yaml import YAML
 
-from great_expectations import DataContext
-from great_expectations.cli import toolkit
+from great_expectations.cli.checkpoint_server import (
+    DEFAULT_CHECKPOINT_SERVER_HOST,
+    DEFAULT_CHECKPOINT_SERVER_PORT,
+    CheckpointRunner,
+    CheckpointServer,
+    run_checkpoint_on_server,
+    summarize_validation_operator_result,
+)
 from great_expectations.cli.mark import Mark as mark
 from great_expectations.cli.util import cli_message, cli_message_list
-from great_expectations.core import ExpectationSuite
-from great_expectations.core.usage_statistics.usage_statistics import send_usage_message
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.exceptions import DataContextError
-from great_expectations.util import lint_code
-from great_expectations.validation_operators.types.validation_operator_result import ValidationOperatorResult
+
+# The toolkit, the Data Context and usage statistics import most of great_expectations, so they are imported by the
+# commands that need them, and running a checkpoint on a server imports none of them
+if TYPE_CHECKING:
+    from great_expectations.core import ExpectationSuite
+    from great_expectations.data_context import DataContext
+    from great_expectations.validation_operators.types.validation_operator_result import (
+        ValidationOperatorResult,
+    )
 
 try:
     from sqlalchemy.exc import SQLAlchemyError
@@ -171,18 +183,24 @@ datasources paired with one or more Expectation Suites each.
 @mark.cli_as_experimental
 def checkpoint_new(checkpoint, suite, directory, datasource):
     """Create a new checkpoint for easy deployments. (Experimental)"""
+    from great_expectations.cli import toolkit
+    from great_expectations.cli.datasource import get_batch_kwargs
+    from great_expectations.core.usage_statistics.usage_statistics import (
+        send_usage_message,
+    )
+
     suite_name = suite
     usage_event = "cli.checkpoint.new"
     context = toolkit.load_data_context_with_error_handling(directory)
     _verify_checkpoint_does_not_exist(context, checkpoint, usage_event)
-    suite: ExpectationSuite = toolkit.load_expectation_suite(
+    suite: "ExpectationSuite" = toolkit.load_expectation_suite(
         context, suite_name, usage_event
     )
     datasource = toolkit.select_datasource(context, datasource_name=datasource)
     if datasource is None:
         send_usage_message(context, usage_event, success=False)
         sys.exit(1)
-    _, _, _, batch_kwargs = toolkit.get_batch_kwargs(context, datasource.name)
+    _, _, _, batch_kwargs = get_batch_kwargs(context, datasource.name)
 
     template = _load_checkpoint_yml_template()
     # This picky update helps template comments stay in place
@@ -199,8 +217,10 @@ def checkpoint_new(checkpoint, suite, directory, datasource):
 
 
 def _verify_checkpoint_does_not_exist(
-    context: DataContext, checkpoint: str, usage_event: str
+    context: "DataContext", checkpoint: str, usage_event: str
 ) -> None:
+    from great_expectations.cli import toolkit
+
     if checkpoint in context.list_checkpoints():
         toolkit.exit_with_failure_message_and_stats(
             context,
@@ -210,7 +230,7 @@ def _verify_checkpoint_does_not_exist(
 
 
 def _write_checkpoint_to_disk(
-    context: DataContext, checkpoint: dict, checkpoint_name: str
+    context: "DataContext", checkpoint: dict, checkpoint_name: str
 ) -> str:
     # TODO this should be the responsibility of the DataContext
     checkpoint_dir = os.path.join(context.root_directory, context.CHECKPOINTS_DIR,)
@@ -241,6 +261,11 @@ def _load_checkpoint_yml_template() -> dict:
 @mark.cli_as_experimental
 def checkpoint_list(directory):
     """List configured checkpoints. (Experimental)"""
+    from great_expectations.cli import toolkit
+    from great_expectations.core.usage_statistics.usage_statistics import (
+        send_usage_message,
+    )
+
     context = toolkit.load_data_context_with_error_handling(directory)
     checkpoints = context.list_checkpoints()
     if not checkpoints:
@@ -267,9 +292,22 @@ def checkpoint_list(directory):
     default=None,
     help="The project's great_expectations directory.",
 )
+@click.option(
+    "--server",
+    default=None,
+    help="The URL of a checkpoint server to run the checkpoint on, such as http://127.0.0.1:8765.",
+)
 @mark.cli_as_experimental
-def checkpoint_run(checkpoint, directory):
+def checkpoint_run(checkpoint, directory, server):
     """Run a checkpoint. (Experimental)"""
+    if server:
+        _run_checkpoint_on_server(checkpoint, server)
+
+    from great_expectations.cli import toolkit
+    from great_expectations.core.usage_statistics.usage_statistics import (
+        send_usage_message,
+    )
+
     context = toolkit.load_data_context_with_error_handling(directory)
     usage_event = "cli.checkpoint.run"
 
@@ -319,27 +357,101 @@ def checkpoint_run(checkpoint, directory):
     sys.exit(0)
 
 
-def print_validation_operator_results_details(results: ValidationOperatorResult) -> None:
+def _run_checkpoint_on_server(checkpoint: str, server: str) -> None:
+    # The Data Context is loaded by the server, so none is loaded here
+    try:
+        summary = run_checkpoint_on_server(checkpoint, server)
+    except DataContextError as e:
+        cli_message(f"<red>{e}</red>")
+        sys.exit(1)
+
+    if not summary["success"]:
+        cli_message("Validation failed!")
+        print_validation_results_summary(summary["validation_results"])
+        sys.exit(1)
+
+    cli_message("Validation succeeded!")
+    print_validation_results_summary(summary["validation_results"])
+    sys.exit(0)
+
+
+def print_validation_operator_results_details(results: "ValidationOperatorResult") -> None:
+    print_validation_results_summary(
+        summarize_validation_operator_result(results)["validation_results"]
+    )
+
+
+def print_validation_results_summary(validation_results: list) -> None:
     max_suite_display_width = 40
-    toolkit.cli_message(f"""
+    cli_message(f"""
 {'Suite Name'.ljust(max_suite_display_width)}     Status     Expectations met""")
-    for id, result in results.run_results.items():
-        vr = result['validation_result']
-        stats = vr.statistics
+    for vr in validation_results:
+        stats = vr['statistics']
         passed = stats['successful_expectations']
         evaluated = stats['evaluated_expectations']
         percentage_slug = f"{round(passed / evaluated * 100, 2)} %"
         stats_slug = f"{passed} of {evaluated} ({percentage_slug})"
-        if vr.success:
+        if vr['success']:
             status_slug = "<green>✔ Passed</green>"
         else:
             status_slug = "<red>✖ Failed</red>"
-        suite_name = str(vr.meta['expectation_suite_name'])
+        suite_name = str(vr['expectation_suite_name'])
         if len(suite_name) > max_suite_display_width:
             suite_name = suite_name[0:max_suite_display_width]
             suite_name = suite_name[:-1] + "…"
         status_line = f"- {suite_name.ljust(max_suite_display_width)}   {status_slug}   {stats_slug}"
-        toolkit.cli_message(status_line)
+        cli_message(status_line)
+
+
+@checkpoint.command(name="serve")
+@click.option(
+    "--directory",
+    "-d",
+    default=None,
+    help="The project's great_expectations directory.",
+)
+@click.option(
+    "--host",
+    default=DEFAULT_CHECKPOINT_SERVER_HOST,
+    show_default=True,
+    help="The address to listen on.",
+)
+@click.option(
+    "--port",
+    default=DEFAULT_CHECKPOINT_SERVER_PORT,
+    show_default=True,
+    help="The port to listen on.",
+)
+@mark.cli_as_experimental
+def checkpoint_serve(directory, host, port):
+    """Run checkpoints for clients, keeping the Data Context loaded. (Experimental)
+
+    Checkpoints are run on the server with `great_expectations checkpoint run CHECKPOINT --server URL`.
+    """
+    from great_expectations.cli import toolkit
+    from great_expectations.core.usage_statistics.usage_statistics import (
+        send_usage_message,
+    )
+
+    context = toolkit.load_data_context_with_error_handling(directory)
+    usage_event = "cli.checkpoint.serve"
+
+    checkpoint_runner = CheckpointRunner(context.root_directory, data_context=context)
+    try:
+        server = CheckpointServer(checkpoint_runner, host=host, port=port)
+    except OSError as e:
+        toolkit.exit_with_failure_message_and_stats(
+            context, usage_event, f"<red>Could not start the checkpoint server: {e}</red>"
+        )
+    send_usage_message(context, event=usage_event, success=True)
+
+    cli_message(f"Serving checkpoints at <green>{server.url}</green>. Press Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
 
 @checkpoint.command(name="script")
@@ -360,6 +472,11 @@ def checkpoint_script(checkpoint, directory):
 
     This script is provided for those who wish to run checkpoints via python.
     """
+    from great_expectations.cli import toolkit
+    from great_expectations.core.usage_statistics.usage_statistics import (
+        send_usage_message,
+    )
+
     context = toolkit.load_data_context_with_error_handling(directory)
     usage_event = "cli.checkpoint.script"
     # Attempt to load the checkpoint and deal with errors
@@ -388,8 +505,10 @@ def checkpoint_script(checkpoint, directory):
 
 
 def _validate_at_least_one_suite_is_listed(
-    context: DataContext, batch: dict, checkpoint_file: str
+    context: "DataContext", batch: dict, checkpoint_file: str
 ) -> None:
+    from great_expectations.cli import toolkit
+
     batch_kwargs = batch["batch_kwargs"]
     suites = batch["expectation_suite_names"]
     if not suites:
@@ -412,6 +531,8 @@ def _write_checkpoint_script_to_disk(
     context_directory: str, checkpoint_name: str, script_path: str
 ) -> None:
     script_full_path = os.path.abspath(os.path.join(script_path))
+    from great_expectations.util import lint_code
+
     template = _load_script_template().format(checkpoint_name, context_directory)
     linted_code = lint_code(template)
     with open(script_full_path, "w") as f:
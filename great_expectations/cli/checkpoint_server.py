@@ -0,0 +1,249 @@
+"""
+A checkpoint server keeps a Data Context loaded between checkpoint runs.
+
+Loading a Data Context parses its configuration, builds its stores, datasources and validation operators, and
+starts its usage statistics thread, which usually takes much longer than validating a small batch. A checkpoint
+server pays for it once: it runs the checkpoints requested by its clients with the same Data Context, so its
+datasources also keep their database connection pools open between runs.
+
+The server listens on a local HTTP address. Clients request a checkpoint run by posting
+``{"checkpoint": <checkpoint name>}`` to ``/checkpoints/run`` and receive a summary of the validation results, for
+example with ``great_expectations checkpoint run <checkpoint name> --server <server url>``.
+"""
+
+import http.client
+import json
+import logging
+import os
+import socket
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from great_expectations.core import convert_to_json_serializable
+from great_expectations.exceptions import CheckpointError, DataContextError
+
+try:
+    from sqlalchemy.exc import SQLAlchemyError
+except ImportError:
+    SQLAlchemyError = RuntimeError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_SERVER_HOST = "127.0.0.1"
+DEFAULT_CHECKPOINT_SERVER_PORT = 8765
+CHECKPOINT_RUN_PATH = "/checkpoints/run"
+
+
+class CheckpointRunner:
+    """
+    Runs the checkpoints of a Data Context, which is loaded once and reloaded only when its configuration file
+    changes.
+
+    A Data Context is not thread safe, so checkpoints must be run one at a time.
+    """
+
+    def __init__(self, context_root_dir=None, data_context=None):
+        """
+        :param context_root_dir: *optional* the root directory of the Data Context, found like DataContext does \
+        if not given
+        :param data_context: *optional* an already loaded Data Context of context_root_dir to start with
+        """
+        # The Data Context imports most of great_expectations, which clients of a checkpoint server do not need
+        from great_expectations.data_context import DataContext
+
+        if context_root_dir is None:
+            context_root_dir = DataContext.find_context_root_dir()
+        self._context_root_dir = os.path.abspath(context_root_dir)
+        self._context = data_context
+        self._context_config_file_stat = (
+            None if data_context is None else self._get_context_config_file_stat()
+        )
+
+    def _get_context_config_file_stat(self):
+        from great_expectations.data_context import DataContext
+
+        stat = os.stat(os.path.join(self._context_root_dir, DataContext.GE_YML))
+        return stat.st_mtime_ns, stat.st_size
+
+    def get_data_context(self) -> "DataContext":
+        from great_expectations.data_context import DataContext
+
+        context_config_file_stat = self._get_context_config_file_stat()
+        if (
+            self._context is None
+            or context_config_file_stat != self._context_config_file_stat
+        ):
+            logger.debug("Loading Data Context from {}".format(self._context_root_dir))
+            self._context = DataContext(self._context_root_dir)
+            self._context_config_file_stat = context_config_file_stat
+        return self._context
+
+    def run_checkpoint(self, checkpoint_name):
+        """
+        Run a checkpoint.
+
+        :param checkpoint_name: the name of the checkpoint
+        :return: the ValidationOperatorResult of the validation operator of the checkpoint
+        """
+        context = self.get_data_context()
+        checkpoint = context.get_checkpoint(checkpoint_name)
+
+        batches_to_validate = []
+        for batch in checkpoint["batches"]:
+            batch_kwargs = batch["batch_kwargs"]
+            for suite_name in batch["expectation_suite_names"]:
+                suite = context.get_expectation_suite(suite_name)
+                batches_to_validate.append(context.get_batch(batch_kwargs, suite))
+
+        return context.run_validation_operator(
+            checkpoint["validation_operator_name"],
+            assets_to_validate=batches_to_validate,
+        )
+
+
+def summarize_validation_operator_result(results) -> dict:
+    """Return a JSON serializable summary of the result of a checkpoint run."""
+    validation_results = []
+    for result in results.run_results.values():
+        validation_result = result["validation_result"]
+        validation_results.append(
+            {
+                "expectation_suite_name": validation_result.meta[
+                    "expectation_suite_name"
+                ],
+                "success": validation_result.success,
+                "statistics": convert_to_json_serializable(
+                    validation_result.statistics
+                ),
+            }
+        )
+    return {"success": results.success, "validation_results": validation_results}
+
+
+class CheckpointRequestHandler(BaseHTTPRequestHandler):
+    # Seconds to wait for a client to send its request
+    timeout = 60
+
+    def do_POST(self):
+        if self.path != CHECKPOINT_RUN_PATH:
+            self._send_json(404, {"error": "Unknown path {}".format(self.path)})
+            return
+
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+            checkpoint_name = json.loads(self.rfile.read(content_length).decode())[
+                "checkpoint"
+            ]
+        except (ValueError, TypeError, KeyError):
+            self._send_json(
+                400,
+                {
+                    "error": 'Expected a JSON request body such as {"checkpoint": "my_checkpoint"}'
+                },
+            )
+            return
+
+        try:
+            results = self.server.checkpoint_runner.run_checkpoint(checkpoint_name)
+        except CheckpointError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except (FileNotFoundError, SQLAlchemyError, OSError, DataContextError) as e:
+            logger.exception("Error running checkpoint {}".format(checkpoint_name))
+            self._send_json(500, {"error": str(e)})
+            return
+        except Exception as e:
+            # Any other error must still get a response, or the client would only see the connection closed
+            logger.exception(
+                "Unexpected error running checkpoint {}".format(checkpoint_name)
+            )
+            self._send_json(
+                500,
+                {
+                    "error": "Unexpected error running checkpoint {}: {}".format(
+                        checkpoint_name, repr(e)
+                    )
+                },
+            )
+            return
+
+        self._send_json(200, summarize_validation_operator_result(results))
+
+    def _send_json(self, status, body):
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class CheckpointServer(HTTPServer):
+    """
+    An HTTP server running checkpoints with a CheckpointRunner.
+
+    Requests are handled one at a time, in the order they are received, since they share a Data Context.
+    """
+
+    def __init__(
+        self,
+        checkpoint_runner,
+        host=DEFAULT_CHECKPOINT_SERVER_HOST,
+        port=DEFAULT_CHECKPOINT_SERVER_PORT,
+    ):
+        self.checkpoint_runner = checkpoint_runner
+        super().__init__((host, port), CheckpointRequestHandler)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+
+def run_checkpoint_on_server(checkpoint_name, server_url, timeout=None) -> dict:
+    """
+    Run a checkpoint on a checkpoint server.
+
+    :param checkpoint_name: the name of the checkpoint
+    :param server_url: the URL of the server, such as http://127.0.0.1:8765
+    :param timeout: *optional* seconds to wait for the checkpoint run
+    :return: a summary of the validation results, as returned by summarize_validation_operator_result
+    """
+    request = urllib.request.Request(
+        server_url.rstrip("/") + CHECKPOINT_RUN_PATH,
+        data=json.dumps({"checkpoint": checkpoint_name}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+    except urllib.error.HTTPError as e:
+        try:
+            message = json.loads(e.read().decode("utf-8"))["error"]
+        except (ValueError, KeyError):
+            message = str(e)
+        if e.code == 400:
+            raise CheckpointError(message)
+        raise DataContextError(message)
+    except urllib.error.URLError as e:
+        raise DataContextError(
+            "Could not reach the checkpoint server at {}: {}".format(
+                server_url, e.reason
+            )
+        )
+    except (ConnectionError, http.client.HTTPException, socket.timeout) as e:
+        raise DataContextError(
+            "The checkpoint server at {} did not send a valid response: {}".format(
+                server_url, repr(e)
+            )
+        )
+    except ValueError as e:
+        raise DataContextError(
+            "The checkpoint server at {} sent an invalid JSON response: {}".format(
+                server_url, e
+            )
+        )
@@ -1,17 +1,10 @@
+import importlib
 import logging
 
 import click
 
 from great_expectations import __version__ as ge_version
-from great_expectations.cli.checkpoint import checkpoint
 from great_expectations.cli.cli_logging import _set_up_logger
-from great_expectations.cli.datasource import datasource
-from great_expectations.cli.docs import docs
-from great_expectations.cli.init import init
-from great_expectations.cli.project import project
-from great_expectations.cli.store import store
-from great_expectations.cli.suite import suite
-from great_expectations.cli.validation_operator import validation_operator
 
 try:
     from colorama import init as init_colorama
@@ -24,7 +17,43 @@ except ImportError:
 # TODO: consider using a specified-order supporting class for help (but wasn't working with python 2)
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """A click group whose subcommands are imported from their modules only when they are used, since the modules
+    of the subcommands import most of great_expectations.
+
+    Args:
+        lazy_commands (dict): maps each subcommand name to the module and attribute name of the subcommand, as
+            "module:attribute"
+    """
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module_name, attribute_name = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attribute_name)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_commands={
+        "checkpoint": "great_expectations.cli.checkpoint:checkpoint",
+        "datasource": "great_expectations.cli.datasource:datasource",
+        "docs": "great_expectations.cli.docs:docs",
+        "init": "great_expectations.cli.init:init",
+        "project": "great_expectations.cli.project:project",
+        "store": "great_expectations.cli.store:store",
+        "suite": "great_expectations.cli.suite:suite",
+        "validation-operator": "great_expectations.cli.validation_operator:validation_operator",
+    },
+)
 @click.version_option(version=ge_version)
 @click.option(
     "--verbose",
@@ -58,16 +87,6 @@ In particular, the CLI supports the following special commands:
         logger.setLevel(logging.DEBUG)
 
 
-cli.add_command(datasource)
-cli.add_command(docs)
-cli.add_command(init)
-cli.add_command(project)
-cli.add_command(suite)
-cli.add_command(validation_operator)
-cli.add_command(store)
-cli.add_command(checkpoint)
-
-
 def main():
     cli()
 
@@ -3,6 +3,7 @@ import click
 from great_expectations.cli import toolkit
 from great_expectations.cli.util import cli_message, cli_message_dict
 from great_expectations.core.usage_statistics.usage_statistics import send_usage_message
+from great_expectations.data_context.store import ValidationsStore
 
 
 @click.group()
@@ -46,3 +47,87 @@ def store_list(directory):
     except Exception as e:
         send_usage_message(data_context=context, event="cli.store.list", success=False)
         raise e
+
+
+@store.command(name="apply-retention")
+@click.option(
+    "--directory",
+    "-d",
+    default=None,
+    help="The project's great_expectations directory.",
+)
+@click.option(
+    "--store-name",
+    "-s",
+    default=None,
+    help="The name of the ValidationsStore. Defaults to the validations store of the project.",
+)
+@click.option(
+    "--max-results",
+    "-m",
+    default=None,
+    type=int,
+    help="Process at most this many validation results, oldest first.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Only list what the retention policy would do.",
+)
+def store_apply_retention(directory, store_name, max_results, dry_run):
+    """
+    Compact, archive and delete old validation results.
+
+    The retention_policy of the ValidationsStore chooses the validation results
+    to replace by summaries or delete after archiving them. Each run only reads
+    the results stored since the previous run.
+    """
+    context = toolkit.load_data_context_with_error_handling(directory)
+    usage_event = "cli.store.apply_retention"
+
+    if store_name is None:
+        store_name = context.validations_store_name
+    validations_store = context.stores.get(store_name)
+    if not isinstance(validations_store, ValidationsStore):
+        toolkit.exit_with_failure_message_and_stats(
+            context,
+            usage_event,
+            f"<red>Could not find a ValidationsStore named {store_name}.</red>",
+        )
+    if validations_store.retention_policy is None:
+        toolkit.exit_with_failure_message_and_stats(
+            context,
+            usage_event,
+            f"<red>The store {store_name} has no retention_policy.</red>",
+        )
+
+    try:
+        report = validations_store.apply_retention_policy(
+            max_results=max_results, dry_run=dry_run
+        )
+    except Exception as e:
+        send_usage_message(data_context=context, event=usage_event, success=False)
+        raise e
+
+    for action, keys in [
+        ("summarize" if dry_run else "Summarized", report["summarized"]),
+        ("delete" if dry_run else "Deleted", report["deleted"]),
+    ]:
+        cli_message(
+            "{}{} {} validation result{}".format(
+                "Would " if dry_run else "",
+                action,
+                len(keys),
+                "" if len(keys) == 1 else "s",
+            )
+        )
+        for key in keys:
+            cli_message(" - {}".format("/".join(key.to_tuple())))
+    if not dry_run:
+        cli_message(
+            "Archived the full validation results in {} bundle{}".format(
+                len(report["bundles"]), "" if len(report["bundles"]) == 1 else "s"
+            )
+        )
+    send_usage_message(data_context=context, event=usage_event, success=True)
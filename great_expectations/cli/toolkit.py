@@ -12,8 +12,6 @@ from ruamel.yaml.compat import StringIO
 from great_expectations import DataContext
 from great_expectations import exceptions as ge_exceptions
 from great_expectations.cli.cli_messages import SECTION_SEPARATOR
-from great_expectations.cli.datasource import get_batch_kwargs
-from great_expectations.cli.docs import build_docs
 from great_expectations.cli.upgrade_helpers import GE_UPGRADE_HELPER_VERSION_MAP
 from great_expectations.cli.util import cli_colorize_string, cli_message
 from great_expectations.core import ExpectationSuite
@@ -78,6 +76,10 @@ def create_expectation_suite(
         )
         data_asset_name = generator_asset
 
+    # These commands import the toolkit themselves
+    from great_expectations.cli.datasource import get_batch_kwargs
+    from great_expectations.cli.docs import build_docs
+
     if show_intro_message and not empty_suite:
         cli_message(
             "\n<cyan>========== Create sample Expectations ==========</cyan>\n\n"
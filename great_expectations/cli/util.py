@@ -7,7 +7,6 @@ from typing import Union
 import pkg_resources
 from pkg_resources import Distribution, WorkingSet
 
-from great_expectations.cli import toolkit
 from great_expectations.cli.python_subprocess import (
     execute_shell_command_with_progress_polling,
 )
@@ -185,6 +184,9 @@ but the package `{pip_library_name}` containing this library is not installed.
     Would you like Great Expectations to try to execute `pip install {pip_library_name}` for you?"""
     continuation_message: str = f"""\nOK, exiting now.
     - Please execute `pip install {pip_library_name}` before trying again."""
+    # toolkit imports most of great_expectations, so only import it when a library is missing
+    from great_expectations.cli import toolkit
+
     pip_install_confirmed = toolkit.confirm_proceed_or_exit(
         confirm_prompt=confirm_prompt,
         continuation_message=continuation_message,
@@ -1,6 +1,7 @@
 import datetime
 import json
 import logging
+import sys
 import warnings
 from collections import namedtuple
 from copy import deepcopy
@@ -8,7 +9,6 @@ from typing import Any, List, Union
 
 import jsonpatch
 from dateutil.parser import parse
-from IPython import get_ipython
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.data_context_key import DataContextKey
@@ -16,7 +16,11 @@ from great_expectations.core.evaluation_parameters import (
     find_evaluation_parameter_dependencies,
 )
 from great_expectations.core.urn import ge_urn
-from great_expectations.core.util import nested_update
+from great_expectations.core.util import (
+    iter_json_array_spans,
+    iter_json_object_members,
+    nested_update,
+)
 from great_expectations.exceptions import (
     DataContextError,
     InvalidCacheValueError,
@@ -46,8 +50,11 @@ EvaluationParameterIdentifier = namedtuple(
 
 # function to determine if code is being run from a Jupyter notebook
 def in_jupyter_notebook():
+    # A notebook kernel has always imported IPython, so avoid importing it (which is slow) when it has not
+    if "IPython" not in sys.modules:
+        return False
     try:
-        shell = get_ipython().__class__.__name__
+        shell = sys.modules["IPython"].get_ipython().__class__.__name__
         if shell == "ZMQInteractiveShell":
             return True  # Jupyter notebook or qtconsole
         elif shell == "TerminalInteractiveShell":
@@ -1473,6 +1480,85 @@ class ExpectationConfigurationSchema(Schema):
 #             raise ValidationError("meta information must be json serializable.")
 
 
+def _freeze_domain_value(value):
+    """Convert a (possibly nested) domain kwarg value into a hashable value that compares equal exactly when the
+    original values compare equal."""
+    if isinstance(value, dict):
+        return (
+            dict,
+            frozenset((key, _freeze_domain_value(val)) for key, val in value.items()),
+        )
+    if isinstance(value, list):
+        return list, tuple(_freeze_domain_value(val) for val in value)
+    if isinstance(value, tuple):
+        return tuple, tuple(_freeze_domain_value(val) for val in value)
+    if isinstance(value, (set, frozenset)):
+        return set, frozenset(_freeze_domain_value(val) for val in value)
+    return value
+
+
+class _ExpectationList(list):
+    """A list of expectations that counts its modifications, so that an ExpectationSuite can tell in constant
+    time whether its domain index is still current."""
+
+    # A class attribute, since unpickling restores the items before the instance attributes
+    version = 0
+
+    def _modified(self):
+        self.version += 1
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._modified()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._modified()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._modified()
+        return result
+
+    def __imul__(self, other):
+        result = super().__imul__(other)
+        self._modified()
+        return result
+
+    def append(self, expectation):
+        super().append(expectation)
+        self._modified()
+
+    def extend(self, expectations):
+        super().extend(expectations)
+        self._modified()
+
+    def insert(self, idx, expectation):
+        super().insert(idx, expectation)
+        self._modified()
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._modified()
+        return result
+
+    def remove(self, expectation):
+        super().remove(expectation)
+        self._modified()
+
+    def clear(self):
+        super().clear()
+        self._modified()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._modified()
+
+    def reverse(self):
+        super().reverse()
+        self._modified()
+
+
 class ExpectationSuite:
     """
     This ExpectationSuite object has create, read, update, and delete functionality for its expectations:
@@ -1513,6 +1599,19 @@ class ExpectationSuite:
         # We require meta information to be serializable, but do not convert until necessary
         ensure_json_serializable(meta)
         self.meta = meta
+        self._expectation_index = None
+        self._indexed_version = None
+
+    @property
+    def expectations(self):
+        return self._expectations
+
+    @expectations.setter
+    def expectations(self, expectations):
+        if not isinstance(expectations, _ExpectationList):
+            expectations = _ExpectationList(expectations)
+        self._expectations = expectations
+        self._invalidate_expectation_index()
 
     def add_citation(
         self,
@@ -1646,6 +1745,62 @@ class ExpectationSuite:
     def _sort_citations(citations):
         return sorted(citations, key=lambda x: x["citation_date"])
 
+    # Domain index #
+
+    @staticmethod
+    def _get_domain_key(expectation_configuration):
+        """Return a hashable key for the expectation type and domain kwargs of a configuration, or None if the
+        domain kwargs cannot be hashed."""
+        try:
+            key = (
+                expectation_configuration.expectation_type,
+                _freeze_domain_value(expectation_configuration.get_domain_kwargs()),
+            )
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _get_expectation_index(self):
+        """Return the mapping from domain key to positions in self.expectations, rebuilding it if the expectations
+        list was reassigned or modified outside of the CRUD methods.
+
+        Domain kwargs mutated in place on a configuration that is already in the suite are not detected; use
+        patch_expectation or add_expectation for such updates.
+        """
+        if self._expectation_index_is_current():
+            return self._expectation_index
+
+        index = {}
+        for idx, expectation in enumerate(self.expectations):
+            index.setdefault(self._get_domain_key(expectation), []).append(idx)
+        self._set_expectation_index(index)
+        return index
+
+    def _expectation_index_is_current(self):
+        return (
+            self._expectation_index is not None
+            and self._indexed_version == self.expectations.version
+        )
+
+    def _set_expectation_index(self, index):
+        self._expectation_index = index
+        self._indexed_version = self.expectations.version
+
+    def _invalidate_expectation_index(self):
+        self._expectation_index = None
+        self._indexed_version = None
+
+    def _get_candidate_expectation_indexes(self, expectation_configuration):
+        """Return the sorted positions of expectations that could match expectation_configuration under any
+        match_type; every match_type requires the expectation type and domain kwargs to be equal."""
+        index = self._get_expectation_index()
+        key = self._get_domain_key(expectation_configuration)
+        if key is None:
+            return list(range(len(self.expectations)))
+        candidates = index.get(key, []) + index.get(None, [])
+        return sorted(candidates)
+
     # CRUD methods #
 
     def append_expectation(self, expectation_config):
@@ -1658,7 +1813,13 @@ class ExpectationSuite:
            Notes:
                May want to add type-checking in the future.
         """
+        index_is_current = self._expectation_index_is_current()
         self.expectations.append(expectation_config)
+        if index_is_current:
+            self._expectation_index.setdefault(
+                self._get_domain_key(expectation_config), []
+            ).append(len(self.expectations) - 1)
+            self._set_expectation_index(self._expectation_index)
 
     def remove_expectation(
         self,
@@ -1747,8 +1908,10 @@ class ExpectationSuite:
                 "Ensure that expectation configuration is valid."
             )
         match_indexes = []
-        for idx, expectation in enumerate(self.expectations):
-            if expectation.isEquivalentTo(expectation_configuration, match_type):
+        for idx in self._get_candidate_expectation_indexes(expectation_configuration):
+            if self.expectations[idx].isEquivalentTo(
+                expectation_configuration, match_type
+            ):
                 match_indexes.append(idx)
 
         return match_indexes
@@ -1761,14 +1924,7 @@ class ExpectationSuite:
         found_expectation_indexes = self.find_expectation_indexes(
             expectation_configuration, match_type
         )
-        if len(found_expectation_indexes) > 0:
-            return [
-                expectation
-                for idx, expectation in enumerate(self.expectations)
-                if idx in found_expectation_indexes
-            ]
-        else:
-            return []
+        return [self.expectations[idx] for idx in found_expectation_indexes]
 
     def patch_expectation(
         self,
@@ -1808,6 +1964,8 @@ class ExpectationSuite:
             )
 
         self.expectations[found_expectation_indexes[0]].patch(op, path, value)
+        # A patch may change the domain of the expectation, so its key must be recomputed
+        self._invalidate_expectation_index()
         return self.expectations[found_expectation_indexes[0]]
 
     def add_expectation(
@@ -1846,9 +2004,9 @@ class ExpectationSuite:
             #   .kwargs, expectation_configuration.kwargs)
             # patch_expectation.apply(self.expectations[found_expectation_index].kwargs, in_place=True)
             if overwrite_existing:
-                self.expectations[
-                    found_expectation_indexes[0]
-                ] = expectation_configuration
+                self._replace_expectation(
+                    found_expectation_indexes[0], expectation_configuration
+                )
             else:
                 raise DataContextError(
                     "A matching ExpectationConfiguration already exists. If you would like to overwrite this "
@@ -1859,6 +2017,21 @@ class ExpectationSuite:
 
         return expectation_configuration
 
+    def _replace_expectation(self, idx, expectation_configuration):
+        """Replace the expectation at position idx, keeping the domain index current."""
+        index = self._get_expectation_index()
+        old_key = self._get_domain_key(self.expectations[idx])
+        new_key = self._get_domain_key(expectation_configuration)
+        self.expectations[idx] = expectation_configuration
+        if old_key != new_key:
+            index[old_key].remove(idx)
+            if not index[old_key]:
+                del index[old_key]
+            positions = index.setdefault(new_key, [])
+            positions.append(idx)
+            positions.sort()
+        self._set_expectation_index(index)
+
 
 class ExpectationSuiteSchema(Schema):
     expectation_suite_name = fields.Str()
@@ -2192,14 +2365,10 @@ class ExpectationSuiteValidationResult(DictDot):
             if (metric_name, metric_kwargs_id) in self._metrics:
                 return self._metrics[(metric_name, metric_kwargs_id)]
             else:
-                for result in self.results:
+                for result in self._iter_results_of_type(metric_name_parts[0]):
                     try:
-                        if (
-                            metric_name_parts[0]
-                            == result.expectation_config.expectation_type
-                        ):
-                            metric_value = result.get_metric(metric_name, **kwargs)
-                            break
+                        metric_value = result.get_metric(metric_name, **kwargs)
+                        break
                     except UnavailableMetricError:
                         pass
                 if metric_value is not None:
@@ -2212,6 +2381,94 @@ class ExpectationSuiteValidationResult(DictDot):
             )
         )
 
+    def _iter_results_of_type(self, expectation_type):
+        for result in self.results:
+            if result.expectation_config.expectation_type == expectation_type:
+                yield result
+
+
+class LazyExpectationSuiteValidationResult(ExpectationSuiteValidationResult):
+    """An ExpectationSuiteValidationResult backed by its serialized (JSON) form.
+
+    success, evaluation_parameters, statistics and meta are decoded when the object is built. The
+    serialized results list is only scanned for element boundaries; each ExpectationValidationResult is
+    decoded the first time it is accessed, so consumers that only need summary information (such as the
+    data docs index) never pay for decoding individual results.
+    """
+
+    def __init__(self, serialized):
+        if isinstance(serialized, bytes):
+            serialized = serialized.decode("utf-8")
+        members = {}
+        result_spans = []
+        for key, start, end in iter_json_object_members(serialized):
+            if key == "results":
+                result_spans = list(iter_json_array_spans(serialized, start))
+            else:
+                members[key] = json.loads(serialized[start:end])
+        super().__init__(
+            success=members.get("success"),
+            evaluation_parameters=members.get("evaluation_parameters"),
+            statistics=members.get("statistics"),
+            meta=members.get("meta"),
+        )
+        self._serialized = serialized
+        self._result_spans = result_spans
+        self._decoded_results = {}
+        # None until the full results list is requested
+        self._results = None
+
+    @property
+    def results(self):
+        if self._results is None:
+            self._results = [
+                self._get_result(index) for index in range(len(self._result_spans))
+            ]
+        return self._results
+
+    @results.setter
+    def results(self, value):
+        self._results = value
+
+    def iter_results(self):
+        """Yield each ExpectationValidationResult, decoding them one at a time."""
+        if self._results is not None:
+            yield from self._results
+        else:
+            for index in range(len(self._result_spans)):
+                yield self._get_result(index)
+
+    def _get_result(self, index, raw_result=None):
+        if index not in self._decoded_results:
+            if raw_result is None:
+                raw_result = self._get_raw_result(index)
+            self._decoded_results[index] = expectationValidationResultSchema.load(
+                raw_result
+            )
+        return self._decoded_results[index]
+
+    def _get_raw_result(self, index):
+        start, end = self._result_spans[index]
+        return json.loads(self._serialized[start:end])
+
+    def _iter_results_of_type(self, expectation_type):
+        if self._results is not None:
+            yield from super()._iter_results_of_type(expectation_type)
+            return
+        for index in range(len(self._result_spans)):
+            if index in self._decoded_results:
+                result = self._decoded_results[index]
+                if result.expectation_config.expectation_type == expectation_type:
+                    yield result
+                continue
+            # Decoding the plain JSON is much cheaper than a full schema load, so check the type first.
+            raw_result = self._get_raw_result(index)
+            if (
+                raw_result.get("expectation_config", {}).get("expectation_type")
+                == expectation_type
+            ):
+                yield self._get_result(index, raw_result=raw_result)
+
 
 class ExpectationSuiteValidationResultSchema(Schema):
     success = fields.Bool()
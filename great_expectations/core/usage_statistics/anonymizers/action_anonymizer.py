@@ -1,19 +1,20 @@
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
-from great_expectations.validation_operators import (
-    NoOpAction,
-    SlackNotificationAction,
-    PagerdutyAlertAction,
-    StoreEvaluationParametersAction,
-    StoreMetricsAction,
-    StoreValidationResultAction,
-    UpdateDataDocsAction,
-    ValidationAction,
-)
 
 
 class ActionAnonymizer(Anonymizer):
     def __init__(self, salt=None):
         super().__init__(salt=salt)
+        # great_expectations.validation_operators imports usage statistics, so import them here to avoid a cycle
+        from great_expectations.validation_operators import (
+            NoOpAction,
+            PagerdutyAlertAction,
+            SlackNotificationAction,
+            StoreEvaluationParametersAction,
+            StoreMetricsAction,
+            StoreValidationResultAction,
+            UpdateDataDocsAction,
+            ValidationAction,
+        )
 
         # ordered bottom up in terms of inheritance order
         self._ge_classes = [
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from hashlib import md5
 
 from great_expectations.util import load_class
@@ -6,6 +7,14 @@ from great_expectations.util import load_class
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _anonymize(salt, string_):
+    # The same few names, such as datasource and expectation suite names, are anonymized for every usage
+    # statistics message, so their hashes are memoized
+    salted = salt + string_
+    return md5(salted.encode("utf-8")).hexdigest()
+
+
 class Anonymizer:
     """Anonymize string names in an optionally-consistent way."""
 
@@ -25,8 +34,7 @@ class Anonymizer:
         return self._salt
 
     def anonymize(self, string_):
-        salted = self._salt + string_
-        return md5(salted.encode("utf-8")).hexdigest()
+        return _anonymize(self._salt, string_)
 
     def anonymize_object_info(
         self,
@@ -20,6 +20,8 @@ class BatchKwargsAnonymizer(Anonymizer):
             "limit",
             "query_parameters",
             "offset",
+            "sampling_method",
+            "sampling_kwargs",
             "snowflake_transient_table",
             "bigquery_temp_table",
             "data_asset_name",
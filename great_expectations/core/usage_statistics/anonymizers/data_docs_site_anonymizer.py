@@ -16,6 +16,7 @@ class DataDocsSiteAnonymizer(Anonymizer):
     def anonymize_data_docs_site_info(self, site_name, site_config):
         site_config_module_name = site_config.get("module_name")
         if site_config_module_name is None:
+            site_config = dict(site_config)
             site_config[
                 "module_name"
             ] = "great_expectations.render.renderer.site_builder"
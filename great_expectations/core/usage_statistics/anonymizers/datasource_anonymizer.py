@@ -1,15 +1,16 @@
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
-from great_expectations.datasource import (
-    Datasource,
-    PandasDatasource,
-    SparkDFDatasource,
-    SqlAlchemyDatasource,
-)
 
 
 class DatasourceAnonymizer(Anonymizer):
     def __init__(self, salt=None):
         super().__init__(salt=salt)
+        # great_expectations.datasource imports usage statistics, so import them here to avoid a cycle
+        from great_expectations.datasource import (
+            Datasource,
+            PandasDatasource,
+            SparkDFDatasource,
+            SqlAlchemyDatasource,
+        )
 
         # ordered bottom up in terms of inheritance order
         self._ge_classes = [
@@ -1,15 +1,15 @@
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
-from great_expectations.dataset import Dataset
-
-GE_EXPECTATION_TYPES = [
-    el for el in Dataset.__dict__.keys() if el.startswith("expect_")
-]
 
 
 class ExpectationSuiteAnonymizer(Anonymizer):
     def __init__(self, salt=None):
         super().__init__(salt=salt)
-        self._ge_expectation_types = GE_EXPECTATION_TYPES
+        # great_expectations.dataset imports pandas and sqlalchemy, so only import it when usage statistics are enabled
+        from great_expectations.dataset import Dataset
+
+        self._ge_expectation_types = [
+            el for el in Dataset.__dict__.keys() if el.startswith("expect_")
+        ]
 
     def anonymize_expectation_suite_info(self, expectation_suite):
         anonymized_info_dict = dict()
@@ -1,14 +1,16 @@
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
-from great_expectations.render.renderer.site_builder import (
-    DefaultSiteIndexBuilder,
-    DefaultSiteSectionBuilder,
-    SiteBuilder,
-)
 
 
 class SiteBuilderAnonymizer(Anonymizer):
     def __init__(self, salt=None):
         super().__init__(salt=salt)
+        # great_expectations.render imports usage statistics, so import them here to avoid a cycle
+        from great_expectations.render.renderer.site_builder import (
+            DefaultSiteIndexBuilder,
+            DefaultSiteSectionBuilder,
+            SiteBuilder,
+        )
+
         self._ge_classes = [
             SiteBuilder,
             DefaultSiteSectionBuilder,
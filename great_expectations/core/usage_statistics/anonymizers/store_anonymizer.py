@@ -2,19 +2,21 @@ from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anon
 from great_expectations.core.usage_statistics.anonymizers.store_backend_anonymizer import (
     StoreBackendAnonymizer,
 )
-from great_expectations.data_context.store import (
-    EvaluationParameterStore,
-    ExpectationsStore,
-    HtmlSiteStore,
-    MetricStore,
-    Store,
-    ValidationsStore,
-)
 
 
 class StoreAnonymizer(Anonymizer):
     def __init__(self, salt=None):
         super().__init__(salt=salt)
+        # great_expectations.data_context.store imports usage statistics, so import them here to avoid a cycle
+        from great_expectations.data_context.store import (
+            EvaluationParameterStore,
+            ExpectationsStore,
+            HtmlSiteStore,
+            MetricStore,
+            Store,
+            ValidationsStore,
+        )
+
         # ordered bottom up in terms of inheritance order
         self._ge_classes = [
             ValidationsStore,
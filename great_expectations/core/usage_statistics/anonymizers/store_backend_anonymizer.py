@@ -1,18 +1,19 @@
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
-from great_expectations.data_context.store import (
-    DatabaseStoreBackend,
-    InMemoryStoreBackend,
-    StoreBackend,
-    TupleFilesystemStoreBackend,
-    TupleGCSStoreBackend,
-    TupleS3StoreBackend,
-    TupleStoreBackend,
-)
 
 
 class StoreBackendAnonymizer(Anonymizer):
     def __init__(self, salt=None):
         super().__init__(salt=salt)
+        # great_expectations.data_context.store imports usage statistics, so import them here to avoid a cycle
+        from great_expectations.data_context.store import (
+            DatabaseStoreBackend,
+            InMemoryStoreBackend,
+            StoreBackend,
+            TupleFilesystemStoreBackend,
+            TupleGCSStoreBackend,
+            TupleS3StoreBackend,
+            TupleStoreBackend,
+        )
 
         # ordered bottom up in terms of inheritance order
         self._ge_classes = [
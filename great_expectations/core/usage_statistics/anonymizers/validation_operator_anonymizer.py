@@ -2,16 +2,18 @@ from great_expectations.core.usage_statistics.anonymizers.action_anonymizer impo
     ActionAnonymizer,
 )
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
-from great_expectations.validation_operators import (
-    ActionListValidationOperator,
-    ValidationOperator,
-    WarningAndFailureExpectationSuitesValidationOperator,
-)
 
 
 class ValidationOperatorAnonymizer(Anonymizer):
     def __init__(self, salt=None):
         super().__init__(salt=salt)
+        # great_expectations.validation_operators imports usage statistics, so import them here to avoid a cycle
+        from great_expectations.validation_operators import (
+            ActionListValidationOperator,
+            ValidationOperator,
+            WarningAndFailureExpectationSuitesValidationOperator,
+        )
+
         # ordered bottom up in terms of inheritance order
         self._ge_classes = [
             ActionListValidationOperator,
@@ -430,8 +430,10 @@ usage_statistics_record_schema = {
                         "cli.suite.new",
                         "cli.suite.scaffold",
                         "cli.store.list",
+                        "cli.store.apply_retention",
                         "cli.project.check_config",
                         "cli.checkpoint.list",
+                        "cli.checkpoint.serve",
                         "cli.datasource.list",
                         "cli.datasource.new",
                         "cli.datasource.profile",
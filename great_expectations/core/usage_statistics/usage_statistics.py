@@ -6,8 +6,9 @@ import platform
 import signal
 import sys
 import threading
+import time
 from functools import wraps
-from queue import Queue
+from queue import Empty, Full, Queue
 
 import jsonschema
 import requests
@@ -39,13 +40,40 @@ from great_expectations.core.usage_statistics.schemas import (
 
 STOP_SIGNAL = object()
 
+# Messages waiting to be sent beyond this many are dropped, so that an unreachable endpoint never accumulates them
+DEFAULT_MAX_QUEUED_MESSAGES = 1000
+# The most messages the worker takes from the queue at once
+DEFAULT_BATCH_SIZE = 50
+# Seconds to wait for a message to be posted
+DEFAULT_POST_TIMEOUT = 2
+# Seconds the process waits at exit for queued messages to be sent; messages not sent by then are dropped
+DEFAULT_SHUTDOWN_TIMEOUT = 1
+
 logger = logging.getLogger(__name__)
 
 _anonymizers = dict()
 
 
 class UsageStatisticsHandler:
-    def __init__(self, data_context, data_context_id, usage_statistics_url):
+    """
+    Sends usage statistics messages from a worker thread, so that the code emitting them never waits for the
+    usage statistics endpoint.
+
+    Messages are queued by emit, up to max_queued_messages of them; the worker takes them from the queue in batches
+    of up to batch_size, validates them and posts them over one HTTP session. At exit, the worker gets at most
+    shutdown_timeout seconds to send the queued messages.
+    """
+
+    def __init__(
+        self,
+        data_context,
+        data_context_id,
+        usage_statistics_url,
+        max_queued_messages=DEFAULT_MAX_QUEUED_MESSAGES,
+        batch_size=DEFAULT_BATCH_SIZE,
+        post_timeout=DEFAULT_POST_TIMEOUT,
+        shutdown_timeout=DEFAULT_SHUTDOWN_TIMEOUT,
+    ):
         self._url = usage_statistics_url
 
         self._data_context_id = data_context_id
@@ -53,7 +81,11 @@ class UsageStatisticsHandler:
         self._data_context = data_context
         self._ge_version = ge_version
 
-        self._message_queue = Queue()
+        self._batch_size = batch_size
+        self._post_timeout = post_timeout
+        self._shutdown_timeout = shutdown_timeout
+        self._shutdown_deadline = None
+        self._message_queue = Queue(maxsize=max_queued_messages)
         self._worker = threading.Thread(target=self._requests_worker, daemon=True)
         self._worker.start()
         self._datasource_anonymizer = DatasourceAnonymizer(data_context_id)
@@ -85,31 +117,57 @@ class UsageStatisticsHandler:
             self._sigint_handler(signum, frame)
 
     def _close_worker(self):
-        self._message_queue.put(STOP_SIGNAL)
-        self._worker.join()
+        """Stop the worker, waiting at most shutdown_timeout seconds for it to send the queued messages."""
+        if self._shutdown_deadline is None:
+            self._shutdown_deadline = time.monotonic() + self._shutdown_timeout
+            try:
+                self._message_queue.put_nowait(STOP_SIGNAL)
+            except Full:
+                # The worker stops at the shutdown deadline anyway
+                pass
+        self._worker.join(timeout=max(self._shutdown_deadline - time.monotonic(), 0))
+
+    def _get_remaining_shutdown_time(self):
+        if self._shutdown_deadline is None:
+            return None
+        return self._shutdown_deadline - time.monotonic()
 
     def _requests_worker(self):
         session = requests.Session()
         while True:
-            message = self._message_queue.get()
-            if message == STOP_SIGNAL:
-                self._message_queue.task_done()
-                return
-            try:
-                res = session.post(self._url, json=message, timeout=2)
-                logger.debug(
-                    "Posted usage stats: message status " + str(res.status_code)
-                )
-                if res.status_code != 201:
+            messages = [self._message_queue.get()]
+            while len(messages) < self._batch_size:
+                try:
+                    messages.append(self._message_queue.get_nowait())
+                except Empty:
+                    break
+            for message in messages:
+                if message is STOP_SIGNAL:
+                    return
+                remaining_shutdown_time = self._get_remaining_shutdown_time()
+                if remaining_shutdown_time is None:
+                    timeout = self._post_timeout
+                elif remaining_shutdown_time > 0:
+                    timeout = min(self._post_timeout, remaining_shutdown_time)
+                else:
                     logger.debug(
-                        "Server rejected message: ", json.dumps(message, indent=2)
+                        "Shutdown timeout reached; dropping queued usage stats messages."
                     )
-            except requests.exceptions.Timeout:
-                logger.debug("Timeout while sending usage stats message.")
-            except Exception as e:
-                logger.debug("Unexpected error posting message: " + str(e))
-            finally:
-                self._message_queue.task_done()
+                    return
+                self._post_message(session, message, timeout)
+
+    def _post_message(self, session, message, timeout):
+        if not self.validate_message(message, schema=usage_statistics_record_schema):
+            return
+        try:
+            res = session.post(self._url, json=message, timeout=timeout)
+            logger.debug("Posted usage stats: message status " + str(res.status_code))
+            if res.status_code != 201:
+                logger.debug("Server rejected message: ", json.dumps(message, indent=2))
+        except requests.exceptions.Timeout:
+            logger.debug("Timeout while sending usage stats message.")
+        except Exception as e:
+            logger.debug("Unexpected error posting message: " + str(e))
 
     def send_usage_message(self, event, event_payload=None, success=None):
         """send a usage statistics message."""
@@ -189,17 +247,17 @@ class UsageStatisticsHandler:
 
     def emit(self, message):
         """
-        Emit a message.
+        Emit a message, which is queued to be sent by the worker thread; emit never waits for the usage
+        statistics endpoint.
         """
         try:
             if message["event"] == "data_context.__init__":
                 message["event_payload"] = self.build_init_payload()
             message = self.build_envelope(message)
-            if not self.validate_message(
-                message, schema=usage_statistics_record_schema
-            ):
-                return
-            self._message_queue.put(message)
+            # The message is validated by the worker, which also posts it
+            self._message_queue.put_nowait(message)
+        except Full:
+            logger.debug("Usage stats message queue is full; dropping message.")
         # noinspection PyBroadException
         except Exception as e:
             # We *always* tolerate *any* error in usage statistics
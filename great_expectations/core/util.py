@@ -1,5 +1,12 @@
+import json
+import re
 from collections.abc import Mapping
 
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_JSON_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_JSON_NON_STRUCTURAL_RE = re.compile(r'[^"\[\]{}]*')
+
 
 # Updated from the stack overflow version below to concatenate lists
 # https://stackoverflow.com/questions/3232943/update-value-of-a-nested-dictionary-of-varying-depth
@@ -18,3 +25,87 @@ def nested_update(d, u):
         else:
             d[k] = v
     return d
+
+
+def _skip_json_whitespace(serialized, idx):
+    return _JSON_WHITESPACE_RE.match(serialized, idx).end()
+
+
+def skip_json_value(serialized, idx):
+    """Return the index just past the JSON value starting at idx, without decoding it.
+
+    Strings, objects and arrays are skipped by scanning for their closing delimiter; only scalar values
+    (numbers, booleans and null) are decoded, since they are short.
+    """
+    first = serialized[idx]
+    if first == '"':
+        match = _JSON_STRING_RE.match(serialized, idx)
+        if match is None:
+            raise ValueError(
+                "Unterminated JSON string starting at index {}".format(idx)
+            )
+        return match.end()
+    if first not in "[{":
+        _, end = _JSON_DECODER.raw_decode(serialized, idx)
+        return end
+    depth = 0
+    length = len(serialized)
+    while idx < length:
+        char = serialized[idx]
+        if char == '"':
+            idx = skip_json_value(serialized, idx)
+            continue
+        if char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+            if depth == 0:
+                return idx + 1
+        idx = _JSON_NON_STRUCTURAL_RE.match(serialized, idx + 1).end()
+    raise ValueError("Unterminated JSON container starting at index {}".format(idx))
+
+
+def iter_json_object_members(serialized, idx=0):
+    """Yield (key, value_start, value_end) for each member of the JSON object starting at idx.
+
+    Member values are located but not decoded, so callers can decode only the members they need.
+    """
+    idx = _skip_json_whitespace(serialized, idx)
+    if serialized[idx] != "{":
+        raise ValueError("Expected a JSON object at index {}".format(idx))
+    idx = _skip_json_whitespace(serialized, idx + 1)
+    if serialized[idx] == "}":
+        return
+    while True:
+        key, idx = _JSON_DECODER.raw_decode(serialized, idx)
+        idx = _skip_json_whitespace(serialized, idx)
+        if serialized[idx] != ":":
+            raise ValueError("Expected ':' at index {}".format(idx))
+        value_start = _skip_json_whitespace(serialized, idx + 1)
+        value_end = skip_json_value(serialized, value_start)
+        yield key, value_start, value_end
+        idx = _skip_json_whitespace(serialized, value_end)
+        if serialized[idx] == "}":
+            return
+        if serialized[idx] != ",":
+            raise ValueError("Expected ',' or '}}' at index {}".format(idx))
+        idx = _skip_json_whitespace(serialized, idx + 1)
+
+
+def iter_json_array_spans(serialized, idx=0):
+    """Yield (start, end) for each element of the JSON array starting at idx, without decoding elements."""
+    idx = _skip_json_whitespace(serialized, idx)
+    if serialized[idx] != "[":
+        raise ValueError("Expected a JSON array at index {}".format(idx))
+    idx = _skip_json_whitespace(serialized, idx + 1)
+    if serialized[idx] == "]":
+        return
+    while True:
+        end = skip_json_value(serialized, idx)
+        yield idx, end
+        idx = _skip_json_whitespace(serialized, end)
+        if serialized[idx] == "]":
+            return
+        if serialized[idx] != ",":
+            raise ValueError("Expected ',' or ']' at index {}".format(idx))
+        idx = _skip_json_whitespace(serialized, idx + 1)
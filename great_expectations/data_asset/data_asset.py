@@ -908,6 +908,8 @@ class DataAsset:
             for col in columns:
                 expectations_to_evaluate.extend(columns[col])
 
+            self._prefetch_expectation_metrics(expectations_to_evaluate)
+
             for expectation in expectations_to_evaluate:
 
                 try:
@@ -1194,6 +1196,15 @@ class DataAsset:
             "Unknown result_format {}.".format(result_format["result_format"])
         )
 
+    def _prefetch_expectation_metrics(self, expectations):
+        """Called by validate with the expectations about to be evaluated, so that backends can compute the metrics
+        they share in advance. The base implementation does nothing.
+
+        Args:
+            expectations (list): The ExpectationConfigurations that will be evaluated
+        """
+        pass
+
     def _calc_map_expectation_success(self, success_count, nonnull_count, mostly):
         """Calculate success and percent_success for column_map_expectations
 
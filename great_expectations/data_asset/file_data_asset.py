@@ -1,10 +1,19 @@
+import bz2
+import codecs
+import gzip
 import hashlib
 import inspect
+import io
 import json
+import locale
+import logging
+import lzma
+import mmap
 import os
 import re
-from functools import wraps
-from itertools import compress
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from itertools import islice
 
 import jsonschema
 import numpy as np
@@ -12,6 +21,357 @@ import numpy as np
 from great_expectations.data_asset.data_asset import DataAsset
 from great_expectations.data_asset.util import parse_result_format
 
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+    logger.debug(
+        "Unable to load zstandard; install optional zstandard dependency for support."
+    )
+
+
+# Number of lines passed at a time to the function implementing a file lines map expectation, when the file is read
+# as text
+LINES_CHUNK_SIZE = 10000
+
+# Approximate size in bytes of the blocks in which the content of a file is read
+BLOCK_SIZE = 1 << 20
+
+# Compression inferred from the extension of a file path when compression="infer"
+COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+    ".zst": "zstd",
+}
+
+# Encodings in which a line break is the byte "\n" and no other character contains that byte, so that the bytes of a
+# file can be split at line breaks before being decoded
+_LINE_SPLITTABLE_ENCODINGS = ["utf-8", "ascii", "iso8859-1", "cp1252"]
+
+# Bytes which read the same in text and binary mode, and are matched the same way by str and bytes regexes: ASCII
+# characters except the carriage return, which ends lines read in text mode, and the separators "\x1c" to "\x1f",
+# which "\s" only matches in str regexes
+_PLAIN_ASCII_BYTES = np.zeros(256, dtype=bool)
+_PLAIN_ASCII_BYTES[:128] = True
+_PLAIN_ASCII_BYTES[[13, 28, 29, 30, 31]] = False
+
+# Plain ASCII bytes matched by "\s"
+_ASCII_WHITESPACE = np.zeros(256, dtype=bool)
+_ASCII_WHITESPACE[[9, 10, 11, 12, 32]] = True
+
+# Regex syntax which can match differently at the end of a line read on its own and at the end of a line within a
+# block of lines: end of string anchors, "\B", lookarounds, inline flags and conditionals
+_LINE_CONTEXT_REGEX_SYNTAX = re.compile(r"\\[ABZ]|\$|\(\?(?![:P])")
+
+
+def _iter_line_chunks(f):
+    """Yield lists of at most LINES_CHUNK_SIZE lines read from the file object f."""
+    while True:
+        lines = list(islice(f, LINES_CHUNK_SIZE))
+        if not lines:
+            return
+        yield lines
+
+
+def _iter_stream_blocks(reader):
+    """Yield blocks of bytes read from the binary file object reader, each ending at a line break except the last."""
+    remainder = b""
+    while True:
+        data = reader.read(BLOCK_SIZE)
+        if not data:
+            break
+        data = remainder + data
+        end = data.rfind(b"\n") + 1
+        if end:
+            yield memoryview(data)[:end]
+            remainder = data[end:]
+        else:
+            remainder = data
+    if remainder:
+        yield memoryview(remainder)
+
+
+def _iter_mapped_blocks(mapping, hashes):
+    """Yield zero-copy views of the memory mapped file mapping, each ending at a line break except the last, and
+    update hashes with their content."""
+    size = len(mapping)
+    start = 0
+    with memoryview(mapping) as view:
+        while start < size:
+            end = mapping.find(b"\n", min(start + BLOCK_SIZE, size) - 1) + 1 or size
+            block = view[start:end]
+            for hash_ in hashes:
+                hash_.update(block)
+            yield block
+            start = end
+
+
+def _decode_lines(block, encoding):
+    """Decode block and split it into lines the way a file opened in text mode is, with universal newlines."""
+    return list(io.StringIO(str(block, encoding), newline=None))
+
+
+def _get_line_bounds(block_array):
+    """Return the offsets of the start and (exclusive) end of each line in a block of bytes."""
+    ends = np.flatnonzero(block_array == 10) + 1
+    if len(block_array) and block_array[-1] != 10:
+        ends = np.append(ends, len(block_array))
+    starts = np.zeros(len(ends), dtype=ends.dtype)
+    starts[1:] = ends[:-1]
+    return starts, ends
+
+
+@lru_cache(maxsize=None)
+def _get_block_regex(pattern, flags):
+    """Return the str regex pattern compiled for blocks of plain ASCII bytes, or None if its syntax may match
+    differently at the end of a line within a block than at the end of the line read on its own."""
+    if (
+        not isinstance(pattern, str)
+        or flags != re.UNICODE
+        or _LINE_CONTEXT_REGEX_SYNTAX.search(pattern)
+    ):
+        return None
+    try:
+        # "^" matches at the start of each line of the block
+        return re.compile(pattern.encode("ascii"), re.MULTILINE)
+    except (re.error, UnicodeEncodeError):
+        return None
+
+
+def _count_regex_matches(comp_regex, lines):
+    """Return an array with the number of matches of comp_regex in each of lines."""
+    if isinstance(lines, _MappedLines):
+        match_counts = lines.count_regex_matches(comp_regex)
+        if match_counts is not None:
+            return match_counts
+    return np.array([len(comp_regex.findall(line)) for line in lines], dtype=int)
+
+
+def _get_unexpected_list_limit(result_format):
+    """Return the number of unexpected lines needed to format a result with result_format, or None if all of them
+    are needed."""
+    if result_format["result_format"] in ["BOOLEAN_ONLY", "BASIC"]:
+        return result_format["partial_unexpected_count"]
+    return None
+
+
+def _get_lines_map_key(func_name, skip, null_lines_regex, func_kwargs):
+    """Return a key identifying the per-line outcomes of a file lines map expectation."""
+    return (
+        func_name,
+        skip,
+        null_lines_regex,
+        json.dumps(func_kwargs, sort_keys=True, default=str),
+    )
+
+
+class _MappedLines:
+    """Lines of a block of plain ASCII bytes, represented by their offsets in the block, so that the file lines map
+    expectations listed in _mapped_lines_map_expectations can be evaluated without creating a string per line.
+    Indexing or iterating decodes the lines."""
+
+    def __init__(self, block, block_array, starts, ends):
+        self._block = block
+        self._block_array = block_array
+        self._starts = starts
+        self._ends = ends
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, idx):
+        return str(self._block[self._starts[idx] : self._ends[idx]], "ascii")
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def count_regex_matches(self, comp_regex):
+        """Return an array with the number of matches of comp_regex in each line, found in a single scan of the
+        block, or None if they cannot be."""
+        block_regex = _get_block_regex(comp_regex.pattern, comp_regex.flags)
+        if block_regex is None:
+            return None
+        spans = np.array(
+            [match.span() for match in block_regex.finditer(self._block)],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        match_starts, match_ends = spans[:, 0], spans[:, 1]
+        # Matches which are empty or hold a line break may differ from the matches found in each line on its own:
+        # the lines are then matched one by one
+        line_breaks = np.flatnonzero(self._block_array == 10)
+        if (match_starts == match_ends).any() or (
+            np.searchsorted(line_breaks, match_starts)
+            != np.searchsorted(line_breaks, match_ends)
+        ).any():
+            return None
+        line_indexes = np.searchsorted(self._starts, match_starts, side="right") - 1
+        # The block also holds null lines, which are not part of these lines
+        in_lines = line_indexes >= 0
+        in_lines[in_lines] = match_starts[in_lines] < self._ends[line_indexes[in_lines]]
+        return np.bincount(line_indexes[in_lines], minlength=len(self))
+
+
+class _FileLinesMapEvaluation:
+    """Accumulates the outcome of a file lines map expectation over the content of a file, which is added in blocks
+    of bytes or in chunks of lines, so that the whole file never needs to be held in memory.
+
+    Only the first unexpected_limit unexpected lines (all of them if None) are kept.
+    """
+
+    def __init__(
+        self,
+        data_asset,
+        func,
+        skip,
+        null_lines_regex,
+        func_kwargs,
+        unexpected_limit,
+        supports_mapped_lines=False,
+    ):
+        self._data_asset = data_asset
+        self._func = func
+        self._skip = int(skip) if skip else 0
+        self._func_kwargs = func_kwargs
+        # Ignore lines that are empty or have only white space ("null values" in the line-map context)
+        self._null_lines = (
+            re.compile(null_lines_regex) if null_lines_regex is not None else None
+        )
+        # Null lines can be found without decoding the lines for the default null_lines_regex only
+        self._supports_mapped_lines = supports_mapped_lines and null_lines_regex in [
+            r"^\s*$",
+            None,
+        ]
+        self._encoding = locale.getpreferredencoding(False)
+        self.unexpected_limit = unexpected_limit
+        # Lines are only skipped if the file has at least skip lines, so hold on to them until that is known
+        self._skipped_lines = [] if self._skip else None
+
+        self.element_count = 0
+        self.nonnull_count = 0
+        self.success_count = 0
+        self.unexpected_count = 0
+        self.unexpected_list = []
+        self.unexpected_index_list = []
+
+    def retains_unexpected(self, unexpected_limit):
+        """Return True if enough unexpected lines were kept to format a result needing unexpected_limit of them."""
+        if self.unexpected_limit is None:
+            return True
+        return (
+            unexpected_limit is not None and unexpected_limit <= self.unexpected_limit
+        )
+
+    def add_lines(self, lines):
+        if self._skipped_lines is not None:
+            missing_count = self._skip - len(self._skipped_lines)
+            self._skipped_lines.extend(lines[:missing_count])
+            lines = lines[missing_count:]
+            if len(self._skipped_lines) < self._skip:
+                return
+            self._skipped_lines = None
+        self._evaluate_lines(lines)
+
+    def add_block(self, block):
+        """Add a block of bytes of the file content in an encoding listed in _LINE_SPLITTABLE_ENCODINGS, ending at a
+        line break unless it is the last one."""
+        if self._skipped_lines is not None:
+            missing_count = self._skip - len(self._skipped_lines)
+            line_ends = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == 10)
+            offset = (
+                line_ends[missing_count - 1] + 1
+                if len(line_ends) >= missing_count
+                else len(block)
+            )
+            self.add_lines(_decode_lines(block[:offset], self._encoding))
+            block = block[offset:]
+            if not len(block):
+                return
+
+        block_array = np.frombuffer(block, dtype=np.uint8)
+        if self._supports_mapped_lines and _PLAIN_ASCII_BYTES[block_array].all():
+            self._evaluate_mapped_lines(block, block_array)
+        else:
+            self._evaluate_lines(_decode_lines(block, self._encoding))
+
+    def finish(self):
+        if self._skipped_lines is not None:
+            # The file has fewer than skip lines, so none are skipped
+            lines = self._skipped_lines
+            self._skipped_lines = None
+            self._evaluate_lines(lines)
+
+    def _evaluate_lines(self, lines):
+        if self._null_lines is not None:
+            nonnull_lines = [line for line in lines if not self._null_lines.match(line)]
+        else:
+            nonnull_lines = lines
+        self._evaluate(nonnull_lines, len(lines))
+
+    def _evaluate_mapped_lines(self, block, block_array):
+        starts, ends = _get_line_bounds(block_array)
+        if self._null_lines is not None:
+            # A line is null if it holds only whitespace, i.e. if no non-whitespace byte falls within it
+            non_whitespace = np.flatnonzero(~_ASCII_WHITESPACE[block_array])
+            first_non_whitespace = np.searchsorted(non_whitespace, starts)
+            nonnull = first_non_whitespace < len(non_whitespace)
+            nonnull[nonnull] = (
+                non_whitespace[first_non_whitespace[nonnull]] < ends[nonnull]
+            )
+            starts, ends, element_count = starts[nonnull], ends[nonnull], len(starts)
+        else:
+            element_count = len(starts)
+        self._evaluate(_MappedLines(block, block_array, starts, ends), element_count)
+
+    def _evaluate(self, nonnull_lines, element_count):
+        self.element_count += element_count
+        if not len(nonnull_lines):
+            return
+
+        boolean_mapped_success_lines = np.asarray(
+            self._func(self._data_asset, _lines=nonnull_lines, **self._func_kwargs),
+            dtype=bool,
+        )
+        unexpected_indexes = np.flatnonzero(~boolean_mapped_success_lines)
+        self.success_count += len(nonnull_lines) - len(unexpected_indexes)
+        self.unexpected_count += len(unexpected_indexes)
+        if self.unexpected_limit is not None:
+            unexpected_indexes = unexpected_indexes[
+                : max(self.unexpected_limit - len(self.unexpected_list), 0)
+            ]
+        self.unexpected_list.extend(nonnull_lines[idx] for idx in unexpected_indexes)
+        self.unexpected_index_list.extend(
+            self.nonnull_count + int(idx) for idx in unexpected_indexes
+        )
+        self.nonnull_count += len(nonnull_lines)
+
+
+class _HashingReader(io.RawIOBase):
+    """A binary reader that updates hash objects with the bytes read from the wrapped file."""
+
+    def __init__(self, raw, hashes):
+        self._raw = raw
+        self._hashes = hashes
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        n = self._raw.readinto(b)
+        if n:
+            data = memoryview(b)[:n]
+            for hash_ in self._hashes:
+                hash_.update(data)
+        return n
+
+    def close(self):
+        self._raw.close()
+        super().close()
+
 
 class MetaFileDataAsset(DataAsset):
     """MetaFileDataset is a thin layer above FileDataset.
@@ -21,6 +381,13 @@ class MetaFileDataAsset(DataAsset):
     and FileDataset implements the expectation methods themselves.
     """
 
+    # File lines map expectations whose functions accept the lines of a block of the file as a _MappedLines object
+    # instead of a list of strings
+    _mapped_lines_map_expectations = [
+        "expect_file_line_regex_match_count_to_be_between",
+        "expect_file_line_regex_match_count_to_equal",
+    ]
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -64,94 +431,64 @@ class MetaFileDataAsset(DataAsset):
             *args,
             **kwargs
         ):
-            try:
-                f = open(self._path)
-            except OSError:
-                raise
-
             if result_format is None:
                 result_format = self.default_expectation_args["result_format"]
 
             result_format = parse_result_format(result_format)
-            lines = f.readlines()  # Read in file lines
 
-            # Skip k initial lines designated by the user
-            if skip is not None and skip <= len(lines):
+            if skip is not None:
                 try:
                     assert float(skip).is_integer()
                     assert float(skip) >= 0
                 except (AssertionError, ValueError):
                     raise ValueError("skip must be a positive integer")
 
-                for i in range(1, skip + 1):
-                    lines.pop(0)
-
-            if lines:
-                if null_lines_regex is not None:
-                    null_lines = re.compile(
-                        null_lines_regex
-                    )  # Ignore lines that are empty or have only white space ("null values" in the line-map context)
-                    boolean_mapped_null_lines = np.array(
-                        [bool(null_lines.match(line)) for line in lines]
-                    )
-                else:
-                    boolean_mapped_null_lines = np.zeros(len(lines), dtype=bool)
-                element_count = int(len(lines))
-                if element_count > sum(boolean_mapped_null_lines):
-                    nonnull_lines = list(
-                        compress(lines, np.invert(boolean_mapped_null_lines))
-                    )
-                    nonnull_count = int((boolean_mapped_null_lines == False).sum())
-                    boolean_mapped_success_lines = np.array(
-                        func(self, _lines=nonnull_lines, *args, **kwargs)
-                    )
-                    success_count = np.count_nonzero(boolean_mapped_success_lines)
-                    unexpected_list = list(
-                        compress(nonnull_lines, np.invert(boolean_mapped_success_lines))
-                    )
-                    nonnull_lines_index = range(0, len(nonnull_lines) + 1)
-                    unexpected_index_list = list(
-                        compress(
-                            nonnull_lines_index, np.invert(boolean_mapped_success_lines)
-                        )
-                    )
-                    success, percent_success = self._calc_map_expectation_success(
-                        success_count, nonnull_count, mostly
-                    )
-                    return_obj = self._format_map_output(
-                        result_format,
-                        success,
-                        element_count,
-                        nonnull_count,
-                        len(unexpected_list),
-                        unexpected_list,
-                        unexpected_index_list,
-                    )
-                else:
-                    return_obj = self._format_map_output(
-                        result_format=result_format,
-                        success=None,
-                        element_count=element_count,
-                        nonnull_count=0,
-                        unexpected_count=0,
-                        unexpected_list=[],
-                        unexpected_index_list=[],
-                    )
-            else:
-                return_obj = self._format_map_output(
-                    result_format=result_format,
-                    success=None,
-                    element_count=0,
-                    nonnull_count=0,
-                    unexpected_count=0,
-                    unexpected_list=[],
-                    unexpected_index_list=[],
+            unexpected_limit = _get_unexpected_list_limit(result_format)
+            evaluation = None
+            if self._active_validation:
+                # validate may already have evaluated this expectation in its single pass over the file
+                evaluation = self._prefetched_lines_map_evaluations.pop(
+                    _get_lines_map_key(func.__name__, skip, null_lines_regex, kwargs),
+                    None,
+                )
+                if evaluation is not None and not evaluation.retains_unexpected(
+                    unexpected_limit
+                ):
+                    evaluation = None
+
+            if evaluation is None:
+                evaluation = _FileLinesMapEvaluation(
+                    self,
+                    func,
+                    skip,
+                    null_lines_regex,
+                    kwargs,
+                    unexpected_limit,
+                    supports_mapped_lines=func.__name__
+                    in self._mapped_lines_map_expectations,
                 )
-            f.close()
-            return return_obj
+                self._feed_file({None: evaluation})
+
+            if evaluation.nonnull_count > 0:
+                success, percent_success = self._calc_map_expectation_success(
+                    evaluation.success_count, evaluation.nonnull_count, mostly
+                )
+            else:
+                success = None
+            return self._format_map_output(
+                result_format,
+                success,
+                evaluation.element_count,
+                evaluation.nonnull_count,
+                evaluation.unexpected_count,
+                evaluation.unexpected_list,
+                evaluation.unexpected_index_list,
+            )
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        # Allows validate to evaluate the expectation in a pass over the file shared with other expectations
+        inner_wrapper._file_lines_map_func = func
 
         return inner_wrapper
 
@@ -161,13 +498,200 @@ class FileDataAsset(MetaFileDataAsset):
     FileDataset instantiates the great_expectations Expectations API as a
     subclass of a python file object. For the full API reference, please see
     :func:`DataAsset <great_expectations.data_asset.base.DataAsset>`
+
+    The compression keyword argument ("infer", "gzip", "bz2", "xz", "zstd" or None) defines how the content of the
+    file is decompressed; "infer" uses the file extension. File hash and size expectations apply to the file as
+    stored.
     """
 
     _data_asset_type = "FileDataAsset"
 
     def __init__(self, file_path=None, *args, **kwargs):
+        compression = kwargs.pop("compression", "infer")
         super().__init__(*args, **kwargs)
+        if compression not in ["infer", None] + list(
+            set(COMPRESSION_EXTENSIONS.values())
+        ):
+            raise ValueError(
+                "compression must be one of 'infer', 'gzip', 'bz2', 'xz', 'zstd' or None"
+            )
         self._path = file_path
+        self._compression = compression
+        # Results computed by _prefetch_expectation_metrics for the expectations of the current validation
+        self._prefetched_lines_map_evaluations = {}
+        self._prefetched_file_hashes = {}
+
+    def _get_compression(self):
+        if self._compression != "infer":
+            return self._compression
+        if self._path is None:
+            return None
+        return COMPRESSION_EXTENSIONS.get(os.path.splitext(str(self._path))[1].lower())
+
+    @contextmanager
+    def _open_binary(self, hashes=()):
+        """Open the file for reading its decompressed content as bytes. hashes are updated with the bytes stored on
+        disk, for the whole file."""
+        compression = self._get_compression()
+        if compression == "zstd" and zstandard is None:
+            raise ImportError(
+                "zstandard is required to read zstd compressed files; please install it"
+            )
+        with io.BufferedReader(
+            _HashingReader(open(self._path, "rb", buffering=0), list(hashes))
+        ) as stored:
+            if compression == "gzip":
+                reader = gzip.GzipFile(fileobj=stored, mode="rb")
+            elif compression == "bz2":
+                reader = bz2.BZ2File(stored)
+            elif compression == "xz":
+                reader = lzma.LZMAFile(stored)
+            elif compression == "zstd":
+                reader = zstandard.ZstdDecompressor().stream_reader(stored)
+            else:
+                reader = stored
+            yield reader
+            if hashes:
+                while stored.read(65536):
+                    pass
+
+    @contextmanager
+    def _open_file(self, hashes=()):
+        """Open the file for reading its decompressed content as text, the way open does."""
+        with self._open_binary(hashes) as reader:
+            f = io.TextIOWrapper(reader)
+            try:
+                yield f
+            finally:
+                f.detach()
+
+    @contextmanager
+    def _open_blocks(self, hashes=()):
+        """Open the file for reading its decompressed content as blocks of bytes, each ending at a line break except
+        the last. Uncompressed files are memory mapped, so that blocks are views of the mapping rather than copies."""
+        mapping = None
+        if self._get_compression() is None:
+            with open(self._path, "rb") as f:
+                try:
+                    mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    # empty files and files which are not regular files cannot be mapped
+                    pass
+        if mapping is None:
+            with self._open_binary(hashes) as reader:
+                yield _iter_stream_blocks(reader)
+            return
+
+        blocks = _iter_mapped_blocks(mapping, hashes)
+        try:
+            yield blocks
+        finally:
+            blocks.close()
+            try:
+                mapping.close()
+            except BufferError:
+                # views of the mapping still referenced release it when they are garbage collected
+                pass
+
+    def _feed_file(self, evaluations, hashes=(), drop_failed=False):
+        """Add the content of the file to each _FileLinesMapEvaluation in the dict evaluations and finish them, in a
+        single pass over the file that also updates hashes.
+
+        If drop_failed, evaluations raising an error are removed from evaluations instead of propagating it.
+        """
+        use_blocks = (
+            codecs.lookup(locale.getpreferredencoding(False)).name
+            in _LINE_SPLITTABLE_ENCODINGS
+        )
+
+        def feed(method, *args):
+            for key, evaluation in list(evaluations.items()):
+                try:
+                    getattr(evaluation, method)(*args)
+                except Exception:
+                    if not drop_failed:
+                        raise
+                    del evaluations[key]
+
+        if use_blocks:
+            with self._open_blocks(hashes) as blocks:
+                for block in blocks:
+                    feed("add_block", block)
+        else:
+            with self._open_file(hashes) as f:
+                for lines in _iter_line_chunks(f):
+                    feed("add_lines", lines)
+        feed("finish")
+
+    def _prefetch_expectation_metrics(self, expectations):
+        """Evaluate all file lines map expectations and file hashes of a suite in a single pass over the file,
+        instead of reading the file again for each expectation."""
+        self._prefetched_lines_map_evaluations = {}
+        self._prefetched_file_hashes = {}
+
+        evaluations = {}
+        hashes = {}
+        for expectation in expectations:
+            kwargs = dict(expectation.kwargs)
+            if any(
+                isinstance(value, dict) and "$PARAMETER" in value
+                for value in kwargs.values()
+            ):
+                # evaluation parameters are only substituted when the expectation is evaluated
+                continue
+            if expectation.expectation_type == "expect_file_hash_to_equal":
+                hash_alg = kwargs.get("hash_alg", "md5")
+                try:
+                    hashes.setdefault(hash_alg, hashlib.new(hash_alg))
+                except (ValueError, TypeError):
+                    pass
+                continue
+
+            func = getattr(
+                getattr(type(self), expectation.expectation_type, None),
+                "_file_lines_map_func",
+                None,
+            )
+            if func is None:
+                continue
+            skip = kwargs.pop("skip", None)
+            null_lines_regex = kwargs.pop("null_lines_regex", r"^\s*$")
+            result_format = parse_result_format(
+                kwargs.pop(
+                    "result_format", self.default_expectation_args["result_format"]
+                )
+            )
+            for key in ["mostly", "include_config", "catch_exceptions", "meta"]:
+                kwargs.pop(key, None)
+            try:
+                evaluations[
+                    _get_lines_map_key(func.__name__, skip, null_lines_regex, kwargs)
+                ] = _FileLinesMapEvaluation(
+                    self,
+                    func,
+                    skip,
+                    null_lines_regex,
+                    kwargs,
+                    _get_unexpected_list_limit(result_format),
+                    supports_mapped_lines=func.__name__
+                    in self._mapped_lines_map_expectations,
+                )
+            except (ValueError, TypeError, re.error):
+                # the expectation reports invalid arguments itself when it is evaluated
+                continue
+
+        if not evaluations and not hashes:
+            return
+        try:
+            self._feed_file(evaluations, list(hashes.values()), drop_failed=True)
+        except (OSError, ValueError, ImportError):
+            # the file cannot be read or decoded; each expectation reads it on its own
+            return
+
+        self._prefetched_lines_map_evaluations = evaluations
+        self._prefetched_file_hashes = {
+            hash_alg: hash_.hexdigest() for hash_alg, hash_ in hashes.items()
+        }
 
     @MetaFileDataAsset.file_lines_map_expectation
     def expect_file_line_regex_match_count_to_be_between(
@@ -273,22 +797,16 @@ class FileDataAsset(MetaFileDataAsset):
                 )
 
         if expected_max_count is not None and expected_min_count is not None:
-            truth_list = [
-                expected_min_count
-                <= len(comp_regex.findall(line))
-                <= expected_max_count
-                for line in _lines
-            ]
+            match_counts = _count_regex_matches(comp_regex, _lines)
+            truth_list = (expected_min_count <= match_counts) & (
+                match_counts <= expected_max_count
+            )
         elif expected_max_count is not None:
-            truth_list = [
-                len(comp_regex.findall(line)) <= expected_max_count for line in _lines
-            ]
+            truth_list = _count_regex_matches(comp_regex, _lines) <= expected_max_count
         elif expected_min_count is not None:
-            truth_list = [
-                len(comp_regex.findall(line)) >= expected_min_count for line in _lines
-            ]
+            truth_list = _count_regex_matches(comp_regex, _lines) >= expected_min_count
         else:
-            truth_list = [True for _ in _lines]
+            truth_list = np.ones(len(_lines), dtype=bool)
 
         return truth_list
 
@@ -368,7 +886,7 @@ class FileDataAsset(MetaFileDataAsset):
         except (AssertionError, ValueError):
             raise ValueError("expected_count must be a non-negative integer")
 
-        return [len(comp_regex.findall(line)) == expected_count for line in _lines]
+        return _count_regex_matches(comp_regex, _lines) == expected_count
 
     @DataAsset.expectation(["value"])
     def expect_file_hash_to_equal(
@@ -412,6 +930,8 @@ class FileDataAsset(MetaFileDataAsset):
         and :ref:`meta`.
         """
         success = False
+        if self._active_validation and hash_alg in self._prefetched_file_hashes:
+            return {"success": self._prefetched_file_hashes[hash_alg] == value}
         try:
             hash = hashlib.new(hash_alg)
 
@@ -616,8 +1136,9 @@ class FileDataAsset(MetaFileDataAsset):
         success = False
 
         try:
-            with open(self._path) as f:
-                lines = f.readlines()  # Read in file lines
+            with self._open_file() as f:
+                # Only the header line is needed, which is the first line after the skipped ones
+                lines = list(islice(f, (skip or 0) + 1))
 
         except OSError:
             raise
@@ -681,7 +1202,7 @@ class FileDataAsset(MetaFileDataAsset):
         """
         if schema is None:
             try:
-                with open(self._path) as f:
+                with self._open_file() as f:
                     json.load(f)
                 success = True
             except ValueError:
@@ -691,7 +1212,7 @@ class FileDataAsset(MetaFileDataAsset):
                 with open(schema) as s:
                     schema_data = s.read()
                 sdata = json.loads(schema_data)
-                with open(self._path) as f:
+                with self._open_file() as f:
                     json_data = f.read()
                 jdata = json.loads(json_data)
                 jsonschema.validate(jdata, sdata)
@@ -1 +1,12 @@
-from .data_context import BaseDataContext, DataContext, ExplorerDataContext
+from great_expectations.lazy_loading import set_lazy_attributes
+
+# Importing the data context classes imports the stores, datasources and renderers, which should not happen when
+# only e.g. great_expectations.data_context.util is imported
+set_lazy_attributes(
+    __name__,
+    {
+        "BaseDataContext": "great_expectations.data_context.data_context",
+        "DataContext": "great_expectations.data_context.data_context",
+        "ExplorerDataContext": "great_expectations.data_context.data_context",
+    },
+)
@@ -3,6 +3,7 @@ import copy
 import datetime
 import errno
 import glob
+import hashlib
 import json
 import logging
 import os
@@ -12,7 +13,7 @@ import uuid
 import warnings
 import webbrowser
 from collections import OrderedDict
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from dateutil.parser import parse
 from ruamel.yaml import YAML, YAMLError
@@ -35,6 +36,11 @@ from great_expectations.core.usage_statistics.usage_statistics import (
 )
 from great_expectations.core.util import nested_update
 from great_expectations.data_asset import DataAsset
+from great_expectations.data_context.store import (
+    EvaluationParameterDependencyStore,
+    PartitionAggregateStore,
+    ValidationsStore,
+)
 from great_expectations.data_context.templates import (
     CONFIG_VARIABLES_TEMPLATE,
     PROJECT_TEMPLATE_USAGE_STATISTICS_DISABLED,
@@ -52,6 +58,7 @@ from great_expectations.data_context.types.base import (
 )
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
+    PartitionAggregatesIdentifier,
     ValidationResultIdentifier,
 )
 from great_expectations.data_context.util import (
@@ -61,11 +68,11 @@ from great_expectations.data_context.util import (
     substitute_all_config_variables,
     substitute_config_variable,
 )
-from great_expectations.dataset import Dataset
+from great_expectations.dataset import Dataset, PartitionAggregatesDataset
 from great_expectations.datasource import Datasource
+from great_expectations.datasource.types import BatchMarkers
 from great_expectations.marshmallow__shade import ValidationError
 from great_expectations.profile.basic_dataset_profiler import BasicDatasetProfiler
-from great_expectations.render.renderer.site_builder import SiteBuilder
 from great_expectations.util import verify_dynamic_loading_support
 from great_expectations.validator.validator import Validator
 
@@ -76,6 +83,10 @@ except ImportError:
     # just fall through
     SQLAlchemyError = ge_exceptions.ProfilerError
 
+if TYPE_CHECKING:
+    # The renderers are only imported when data docs are built
+    from great_expectations.render.renderer.site_builder import SiteBuilder
+
 logger = logging.getLogger(__name__)
 yaml = YAML()
 yaml.indent(mapping=2, sequence=4, offset=2)
@@ -239,6 +250,9 @@ class BaseDataContext:
             raise ge_exceptions.InvalidConfigError(
                 "Your project_config is not valid. Try using the CLI check-config command."
             )
+        # Config variables and substituted project config, cached until the state they are computed from changes
+        self._cached_config_variables = None
+        self._cached_config_with_variables_substituted = None
         self._project_config = project_config
         self._apply_global_config_overrides()
         if context_root_dir is not None:
@@ -278,6 +292,11 @@ class BaseDataContext:
 
         self._evaluation_parameter_dependencies_compiled = False
         self._evaluation_parameter_dependencies = {}
+        self._evaluation_parameter_dependency_index = None
+        # Whether _evaluation_parameter_dependency_index holds the stored index, which is None if it was not stored
+        self._evaluation_parameter_dependency_index_loaded = False
+        # {upstream expectation suite name -> names of the expectation suites depending on it}
+        self._evaluation_parameter_dependents = {}
 
     def _build_store(self, store_name, store_config):
         module_name = "great_expectations.data_context.store"
@@ -452,6 +471,7 @@ class BaseDataContext:
         """
 
         self._project_config["stores"][store_name] = store_config
+        self._invalidate_config_with_variables_substituted()
         return self._build_store(store_name, store_config)
 
     def add_validation_operator(
@@ -470,6 +490,7 @@ class BaseDataContext:
         self._project_config["validation_operators"][
             validation_operator_name
         ] = validation_operator_config
+        self._invalidate_config_with_variables_substituted()
         config = self._project_config_with_variables_substituted.validation_operators[
             validation_operator_name
         ]
@@ -572,7 +593,7 @@ class BaseDataContext:
 
         return site_urls
 
-    def _load_site_builder_from_site_config(self, site_config) -> SiteBuilder:
+    def _load_site_builder_from_site_config(self, site_config) -> "SiteBuilder":
         default_module_name = "great_expectations.render.renderer.site_builder"
         site_builder = instantiate_class_from_config(
             config=site_config,
@@ -672,7 +693,7 @@ class BaseDataContext:
 
     @property
     def instance_id(self):
-        instance_id = self._load_config_variables_file().get("instance_id")
+        instance_id = self._get_config_variables().get("instance_id")
         if instance_id is None:
             if self._in_memory_instance_id is not None:
                 return self._in_memory_instance_id
@@ -686,22 +707,28 @@ class BaseDataContext:
     #
     #####
 
+    def _get_config_variables_file_path(self):
+        """Return the path of the config variables file, or None if the config does not define one."""
+        config_variables_file_path = self.get_config().config_variables_file_path
+        if not config_variables_file_path:
+            return None
+        # If the user specifies the config variable path with an environment variable, we want to substitute it
+        defined_path = substitute_config_variable(
+            config_variables_file_path, dict(os.environ)
+        )
+        if not os.path.isabs(defined_path):
+            # A BaseDataContext will not have a root directory; in that case use the current directory
+            # for any non-absolute path
+            root_directory = self.root_directory or os.curdir()
+        else:
+            root_directory = ""
+        return os.path.join(root_directory, defined_path)
+
     def _load_config_variables_file(self):
         """Get all config variables from the default location."""
-        config_variables_file_path = self.get_config().config_variables_file_path
-        if config_variables_file_path:
+        var_path = self._get_config_variables_file_path()
+        if var_path:
             try:
-                # If the user specifies the config variable path with an environment variable, we want to substitute it
-                defined_path = substitute_config_variable(
-                    config_variables_file_path, dict(os.environ)
-                )
-                if not os.path.isabs(defined_path):
-                    # A BaseDataContext will not have a root directory; in that case use the current directory
-                    # for any non-absolute path
-                    root_directory = self.root_directory or os.curdir()
-                else:
-                    root_directory = ""
-                var_path = os.path.join(root_directory, defined_path)
                 with open(var_path) as config_variables_file:
                     return yaml.load(config_variables_file) or {}
             except OSError as e:
@@ -712,13 +739,68 @@ class BaseDataContext:
         else:
             return {}
 
+    def _get_config_variables(self):
+        """Get all config variables from the default location, reading the file again only if it was modified since
+        it was last read. The returned dict is shared and must not be modified."""
+        var_path = self._get_config_variables_file_path()
+        file_state = None
+        if var_path:
+            try:
+                stat = os.stat(var_path)
+                file_state = (
+                    stat.st_ino,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    stat.st_ctime_ns,
+                )
+            except OSError:
+                pass
+        if self._cached_config_variables is None or self._cached_config_variables[
+            0
+        ] != (var_path, file_state):
+            self._cached_config_variables = (
+                (var_path, file_state),
+                self._load_config_variables_file(),
+            )
+        return self._cached_config_variables[1]
+
     def get_config_with_variables_substituted(self, config=None):
+        """Return the config (the project config by default) with its ${VARIABLE}s substituted with config
+        variables, environment variables and the runtime environment.
+
+        The substituted project config is cached and only computed again when the project config is replaced or
+        changed by the methods of the data context, or when the config variables file, the environment or the
+        runtime environment change, so it is shared between calls and must not be modified.
+        """
+        if not config or config is self._project_config:
+            # _get_config_variables returns the same dict until the config variables file changes
+            state = (
+                self._project_config,
+                self._get_config_variables(),
+                dict(os.environ),
+                dict(self.runtime_environment),
+            )
+            cached = self._cached_config_with_variables_substituted
+            if (
+                cached is not None
+                and cached[0][0] is state[0]
+                and cached[0][1] is state[1]
+                and cached[0][2:] == state[2:]
+            ):
+                return cached[1]
+            substituted_config = self._substitute_config_variables(self._project_config)
+            self._cached_config_with_variables_substituted = (state, substituted_config)
+            return substituted_config
+
+        return self._substitute_config_variables(config)
 
-        if not config:
-            config = self._project_config
+    def _invalidate_config_with_variables_substituted(self):
+        """Drop the cached substituted project config, after a change to the project config."""
+        self._cached_config_with_variables_substituted = None
 
+    def _substitute_config_variables(self, config):
         substituted_config_variables = substitute_all_config_variables(
-            dict(self._load_config_variables_file()),
+            dict(self._get_config_variables()),
             dict(os.environ),
             self.DOLLAR_SIGN_ESCAPE_STRING,
         )
@@ -799,6 +881,7 @@ class BaseDataContext:
 
         with open(config_variables_filepath, "w") as config_variables_file:
             yaml.dump(config_variables, config_variables_file)
+        self._cached_config_variables = None
 
     def delete_datasource(self, datasource_name=None):
         """Delete a data source
@@ -818,6 +901,7 @@ class BaseDataContext:
                     datasource_name
                 ]
                 del self._project_config.datasources[datasource_name]
+                self._invalidate_config_with_variables_substituted()
                 del self._cached_datasources[datasource_name]
             else:
                 raise ValueError("Datasource {} not found".format(datasource_name))
@@ -996,6 +1080,102 @@ class BaseDataContext:
         )
         return validator.get_dataset()
 
+    def get_incremental_batch(
+        self,
+        datasource_name: str,
+        batch_kwargs_generator_name: str,
+        data_asset_name: str,
+        expectation_suite_name: Union[str, ExpectationSuite],
+        partition_ids: Optional[List[str]] = None,
+        partition_aggregate_store_name: Optional[str] = None,
+    ) -> PartitionAggregatesDataset:
+        """Build a batch validating the partitions of a data asset incrementally, from aggregates computed over each
+        partition and saved in a PartitionAggregateStore, so that validating the data asset again only loads its new
+        partitions. See PartitionAggregatesDataset for the expectations it supports.
+
+        The batch can be validated like any other batch, for example by run_validation_operator.
+
+        Args:
+            datasource_name: the name of the datasource of the data asset
+            batch_kwargs_generator_name: the name of the batch kwargs generator listing the partitions of the data asset
+            data_asset_name: the name of the data asset
+            expectation_suite_name: The ExpectationSuite or the name of the expectation_suite to get
+            partition_ids: the ids of the partitions to validate, by default all the partitions listed by the batch \
+                kwargs generator
+            partition_aggregate_store_name: the name of the PartitionAggregateStore saving partition aggregates, by \
+                default the first PartitionAggregateStore of the context
+
+        Returns:
+            PartitionAggregatesDataset
+        """
+        if isinstance(expectation_suite_name, ExpectationSuite):
+            expectation_suite = expectation_suite_name
+        else:
+            expectation_suite = self.get_expectation_suite(expectation_suite_name)
+
+        if partition_aggregate_store_name is None:
+            partition_aggregate_store_name = next(
+                (
+                    store_name
+                    for store_name, store in self.stores.items()
+                    if isinstance(store, PartitionAggregateStore)
+                ),
+                None,
+            )
+            if partition_aggregate_store_name is None:
+                raise ge_exceptions.DataContextError(
+                    "No PartitionAggregateStore is configured in this DataContext"
+                )
+        partition_aggregate_store = self.stores[partition_aggregate_store_name]
+
+        if partition_ids is None:
+            batch_kwargs_generator = self.get_datasource(
+                datasource_name
+            ).get_batch_kwargs_generator(batch_kwargs_generator_name)
+            # Partitions are validated from the oldest to the newest, assuming their ids sort chronologically
+            partition_ids = sorted(
+                batch_kwargs_generator.get_available_partition_ids(
+                    data_asset_name=data_asset_name
+                )
+            )
+
+        def load_partition_batch(partition_id):
+            batch_kwargs = self.build_batch_kwargs(
+                datasource_name,
+                batch_kwargs_generator_name,
+                data_asset_name=data_asset_name,
+                partition_id=partition_id,
+            )
+            return self.get_batch(batch_kwargs, expectation_suite)
+
+        return PartitionAggregatesDataset(
+            partition_ids,
+            load_partition_batch,
+            partition_aggregate_store=partition_aggregate_store,
+            partition_aggregate_keys=[
+                PartitionAggregatesIdentifier(
+                    datasource_name,
+                    batch_kwargs_generator_name,
+                    data_asset_name,
+                    partition_id,
+                )
+                for partition_id in partition_ids
+            ],
+            expectation_suite=expectation_suite,
+            data_context=self,
+            batch_kwargs=BatchKwargs(
+                datasource=datasource_name,
+                batch_kwargs_generator=batch_kwargs_generator_name,
+                data_asset_name=data_asset_name,
+                partition_ids=partition_ids,
+            ),
+            batch_markers=BatchMarkers(
+                ge_load_time=datetime.datetime.now(datetime.timezone.utc).strftime(
+                    "%Y%m%dT%H%M%S.%fZ"
+                )
+            ),
+        )
+
     @usage_statistics_enabled_method(
         event_name="data_context.run_validation_operator",
         args_payload_fn=run_validation_operator_usage_statistics,
@@ -1103,6 +1283,7 @@ class BaseDataContext:
 
         config = datasourceConfigSchema.load(config)
         self._project_config["datasources"][name] = config
+        self._invalidate_config_with_variables_substituted()
 
         # We perform variable substitution in the datasource's config here before using the config
         # to instantiate the datasource object. Variable substitution is a service that the data
@@ -1213,6 +1394,7 @@ class BaseDataContext:
             key,
             value,
         ) in self._project_config_with_variables_substituted.datasources.items():
+            value = copy.deepcopy(value)
             value["name"] = key
             datasources.append(value)
         return datasources
@@ -1225,6 +1407,7 @@ class BaseDataContext:
             name,
             value,
         ) in self._project_config_with_variables_substituted.stores.items():
+            value = copy.deepcopy(value)
             value["name"] = name
             stores.append(value)
         return stores
@@ -1239,6 +1422,7 @@ class BaseDataContext:
         ) in (
             self._project_config_with_variables_substituted.validation_operators.items()
         ):
+            value = copy.deepcopy(value)
             value["name"] = name
             validation_operators.append(value)
         return validation_operators
@@ -1276,6 +1460,9 @@ class BaseDataContext:
             )
         else:
             self._stores[self.expectations_store_name].set(key, expectation_suite)
+            self._update_evaluation_parameter_dependency_index(
+                expectation_suite_name, expectation_suite
+            )
 
         return expectation_suite
 
@@ -1295,6 +1482,7 @@ class BaseDataContext:
             )
         else:
             self._stores[self.expectations_store_name].remove_key(key)
+            self._update_evaluation_parameter_dependency_index(expectation_suite_name)
             return True
         return False
 
@@ -1310,7 +1498,12 @@ class BaseDataContext:
         key = ExpectationSuiteIdentifier(expectation_suite_name=expectation_suite_name)
 
         if self.stores[self.expectations_store_name].has_key(key):
-            return self.stores[self.expectations_store_name].get(key)
+            expectation_suite = self.stores[self.expectations_store_name].get(key)
+            # The suite may have been changed outside of this Data Context
+            self._update_evaluation_parameter_dependency_index(
+                expectation_suite_name, expectation_suite
+            )
+            return expectation_suite
         else:
             raise ge_exceptions.DataContextError(
                 "expectation_suite %s not found" % expectation_suite_name
@@ -1350,7 +1543,9 @@ class BaseDataContext:
             )
 
         self.stores[self.expectations_store_name].set(key, expectation_suite)
-        self._evaluation_parameter_dependencies_compiled = False
+        self._update_evaluation_parameter_dependency_index(
+            key.expectation_suite_name, expectation_suite
+        )
 
     def _store_metrics(self, requested_metrics, validation_results, target_store_name):
         """
@@ -1434,8 +1629,15 @@ class BaseDataContext:
         if target_store_name is None:
             target_store_name = self.evaluation_parameter_store_name
 
+        expectation_suite_name = validation_results.meta["expectation_suite_name"]
+        if expectation_suite_name not in self._evaluation_parameter_dependencies:
+            return
         self._store_metrics(
-            self._evaluation_parameter_dependencies,
+            {
+                expectation_suite_name: self._evaluation_parameter_dependencies[
+                    expectation_suite_name
+                ]
+            },
             validation_results,
             target_store_name,
         )
@@ -1458,19 +1660,214 @@ class BaseDataContext:
     def validations_store(self):
         return self.stores[self.validations_store_name]
 
+    def _get_evaluation_parameter_dependency_store(self):
+        for store in self.stores.values():
+            if isinstance(store, EvaluationParameterDependencyStore):
+                return store
+        return None
+
+    def _load_evaluation_parameter_dependency_index(
+        self, evaluation_parameter_dependency_store
+    ):
+        """
+        Return the index of the evaluation parameter dependencies stored in evaluation_parameter_dependency_store, or
+        None if it was never stored. The index is only read from the store once: the context keeps it up to date
+        with the expectation suites it saves, loads and deletes.
+        """
+        if not self._evaluation_parameter_dependency_index_loaded:
+            self._evaluation_parameter_dependency_index = (
+                evaluation_parameter_dependency_store.get_index()
+            )
+            self._evaluation_parameter_dependency_index_loaded = True
+        return self._evaluation_parameter_dependency_index
+
     def _compile_evaluation_parameter_dependencies(self):
-        self._evaluation_parameter_dependencies = {}
-        for key in self.stores[self.expectations_store_name].list_keys():
-            expectation_suite = self.stores[self.expectations_store_name].get(key)
+        """
+        Load the index of the evaluation parameter dependencies of the expectation suites from the first
+        EvaluationParameterDependencyStore of the context, and check it against the etags of the expectation suites,
+        which the expectations store lists without loading them. Only the expectation suites which the index is
+        missing, or which changed since they were indexed, are loaded and parsed.
+
+        Without an EvaluationParameterDependencyStore, or before the index is first stored, every expectation suite
+        is loaded and parsed.
+        """
+        evaluation_parameter_dependency_store = (
+            self._get_evaluation_parameter_dependency_store()
+        )
+        index = None
+        if evaluation_parameter_dependency_store is not None:
+            index = self._load_evaluation_parameter_dependency_index(
+                evaluation_parameter_dependency_store
+            )
+        if index is None:
+            index = {"expectation_suites": {}}
+        indexed_expectation_suites = index["expectation_suites"]
+
+        expectations_store = self.stores[self.expectations_store_name]
+        expectation_suite_etags = {
+            key.expectation_suite_name: etag
+            for key, etag in expectations_store.list_key_etags().items()
+        }
+        index_changed = False
+        for expectation_suite_name in list(indexed_expectation_suites.keys()):
+            if expectation_suite_name not in expectation_suite_etags:
+                del indexed_expectation_suites[expectation_suite_name]
+                index_changed = True
+        for expectation_suite_name, etag in expectation_suite_etags.items():
+            indexed_expectation_suite = indexed_expectation_suites.get(
+                expectation_suite_name
+            )
+            # Store backends which cannot tell the etags of their keys return None: their expectation suites are
+            # only indexed again when the context saves or loads them
+            if indexed_expectation_suite is not None and (
+                etag is None or indexed_expectation_suite.get("etag") == etag
+            ):
+                continue
+            expectation_suite = expectations_store.get(
+                ExpectationSuiteIdentifier(expectation_suite_name)
+            )
             if not expectation_suite:
                 continue
+            indexed_expectation_suites[expectation_suite_name] = {
+                "etag": etag,
+                "version": _get_evaluation_parameter_dependencies_version(
+                    expectation_suite
+                ),
+                "dependencies": expectation_suite.get_evaluation_parameter_dependencies(),
+            }
+            index_changed = True
 
-            dependencies = expectation_suite.get_evaluation_parameter_dependencies()
-            if len(dependencies) > 0:
-                nested_update(self._evaluation_parameter_dependencies, dependencies)
+        self._evaluation_parameter_dependency_index = index
+        if index_changed and evaluation_parameter_dependency_store is not None:
+            evaluation_parameter_dependency_store.set_index(index)
 
+        self._evaluation_parameter_dependents = {}
+        for (
+            expectation_suite_name,
+            indexed_expectation_suite,
+        ) in indexed_expectation_suites.items():
+            for upstream_expectation_suite_name in indexed_expectation_suite[
+                "dependencies"
+            ]:
+                self._evaluation_parameter_dependents.setdefault(
+                    upstream_expectation_suite_name, set()
+                ).add(expectation_suite_name)
+        self._evaluation_parameter_dependencies = {}
+        self._merge_evaluation_parameter_dependencies(
+            list(self._evaluation_parameter_dependents.keys())
+        )
         self._evaluation_parameter_dependencies_compiled = True
 
+    def _merge_evaluation_parameter_dependencies(
+        self, upstream_expectation_suite_names
+    ):
+        """
+        Merge the dependencies on the given upstream expectation suites of the expectation suites depending on them.
+        """
+        indexed_expectation_suites = self._evaluation_parameter_dependency_index[
+            "expectation_suites"
+        ]
+        for upstream_expectation_suite_name in upstream_expectation_suite_names:
+            dependencies = {}
+            for expectation_suite_name in sorted(
+                self._evaluation_parameter_dependents.get(
+                    upstream_expectation_suite_name, ()
+                )
+            ):
+                nested_update(
+                    dependencies,
+                    {
+                        upstream_expectation_suite_name: indexed_expectation_suites[
+                            expectation_suite_name
+                        ]["dependencies"][upstream_expectation_suite_name]
+                    },
+                )
+            if upstream_expectation_suite_name in dependencies:
+                self._evaluation_parameter_dependencies[
+                    upstream_expectation_suite_name
+                ] = dependencies[upstream_expectation_suite_name]
+            else:
+                self._evaluation_parameter_dependencies.pop(
+                    upstream_expectation_suite_name, None
+                )
+                self._evaluation_parameter_dependents.pop(
+                    upstream_expectation_suite_name, None
+                )
+
+    def _update_evaluation_parameter_dependency_index(
+        self, expectation_suite_name, expectation_suite=None
+    ):
+        """
+        Update the index of the evaluation parameter dependencies for a saved, loaded or deleted expectation suite.
+
+        The index is not compiled for this, which would list all the expectation suites: before it is compiled, only
+        the stored index is updated, if any.
+
+        Args:
+            expectation_suite_name: the name of the expectation suite
+            expectation_suite: the saved or loaded expectation suite, or None if it was deleted
+        """
+        evaluation_parameter_dependency_store = (
+            self._get_evaluation_parameter_dependency_store()
+        )
+        if self._evaluation_parameter_dependencies_compiled:
+            index = self._evaluation_parameter_dependency_index
+        elif evaluation_parameter_dependency_store is not None:
+            index = self._load_evaluation_parameter_dependency_index(
+                evaluation_parameter_dependency_store
+            )
+            if index is None:
+                return
+        else:
+            return
+
+        indexed_expectation_suites = index["expectation_suites"]
+        previously_indexed_expectation_suite = indexed_expectation_suites.get(
+            expectation_suite_name
+        )
+        if expectation_suite is None:
+            if previously_indexed_expectation_suite is None:
+                return
+            del indexed_expectation_suites[expectation_suite_name]
+            dependencies = {}
+        else:
+            version = _get_evaluation_parameter_dependencies_version(expectation_suite)
+            # An expectation suite changed without changing its evaluation parameters keeps its previous etag: it is
+            # parsed again once when the index is next compiled, instead of storing the index on every save
+            if (
+                previously_indexed_expectation_suite is not None
+                and previously_indexed_expectation_suite["version"] == version
+            ):
+                return
+            dependencies = expectation_suite.get_evaluation_parameter_dependencies()
+            indexed_expectation_suites[expectation_suite_name] = {
+                "etag": self.stores[self.expectations_store_name].get_etag(
+                    ExpectationSuiteIdentifier(expectation_suite_name)
+                ),
+                "version": version,
+                "dependencies": dependencies,
+            }
+
+        if evaluation_parameter_dependency_store is not None:
+            evaluation_parameter_dependency_store.set_index(index)
+        if not self._evaluation_parameter_dependencies_compiled:
+            return
+
+        upstream_expectation_suite_names = set(dependencies)
+        if previously_indexed_expectation_suite is not None:
+            upstream_expectation_suite_names.update(
+                previously_indexed_expectation_suite["dependencies"]
+            )
+        for upstream_expectation_suite_name in upstream_expectation_suite_names:
+            dependents = self._evaluation_parameter_dependents.setdefault(
+                upstream_expectation_suite_name, set()
+            )
+            if upstream_expectation_suite_name in dependencies:
+                dependents.add(expectation_suite_name)
+            else:
+                dependents.discard(expectation_suite_name)
+        self._merge_evaluation_parameter_dependencies(upstream_expectation_suite_names)
+
     def get_validation_result(
         self,
         expectation_suite_name,
@@ -1478,6 +1875,7 @@ class BaseDataContext:
         batch_identifier=None,
         validations_store_name=None,
         failed_only=False,
+        lazy=False,
     ):
         """Get validation results from a configured store.
 
@@ -1487,6 +1885,8 @@ class BaseDataContext:
             run_id: run_id for which to get validation result (if None, fetch the latest result by alphanumeric sort)
             validations_store_name: the name of the store from which to get validation results
             failed_only: if True, filter the result to return only failed expectations
+            lazy: if True and the store is a ValidationsStore, return a LazyExpectationSuiteValidationResult that \
+                only decodes individual expectation results when they are accessed
 
         Returns:
             validation_result
@@ -1532,7 +1932,10 @@ class BaseDataContext:
             run_id=run_id,
             batch_identifier=batch_identifier,
         )
-        results_dict = selected_store.get(key)
+        if lazy and isinstance(selected_store, ValidationsStore):
+            results_dict = selected_store.get(key, lazy=True)
+        else:
+            results_dict = selected_store.get(key)
 
         # TODO: This should be a convenience method of ValidationResultSuite
         if failed_only:
@@ -2383,6 +2786,8 @@ class DataContext(BaseDataContext):
         config_filepath = os.path.join(self.root_directory, self.GE_YML)
         with open(config_filepath, "w") as outfile:
             self._project_config.to_yaml(outfile)
+        # Callers may have changed the project config in place before saving it
+        self._invalidate_config_with_variables_substituted()
 
     def add_store(self, store_name, store_config):
         logger.debug("Starting DataContext.add_store for store %s" % store_name)
@@ -2624,6 +3029,20 @@ class ExplorerDataContext(DataContext):
             return return_obj
 
 
+def _get_evaluation_parameter_dependencies_version(expectation_suite):
+    """
+    Return a fingerprint of the evaluation parameters of an expectation suite, which changes whenever its evaluation
+    parameter dependencies may change, without parsing them.
+    """
+    parameter_expressions = sorted(
+        value["$PARAMETER"]
+        for expectation in expectation_suite.expectations
+        for value in expectation.kwargs.values()
+        if isinstance(value, dict) and "$PARAMETER" in value
+    )
+    return hashlib.md5(json.dumps(parameter_expressions).encode("utf-8")).hexdigest()
+
+
 def _get_metric_configuration_tuples(metric_configuration, base_kwargs=None):
     if base_kwargs is None:
         base_kwargs = {}
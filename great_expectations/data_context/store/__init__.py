@@ -1,9 +1,12 @@
 from great_expectations.util import verify_dynamic_loading_support
 
+from .database_metric_store_backend import DatabaseMetricStoreBackend
 from .database_store_backend import DatabaseStoreBackend
+from .evaluation_parameter_dependency_store import EvaluationParameterDependencyStore
 from .expectations_store import ExpectationsStore
 from .html_site_store import HtmlSiteStore
 from .metric_store import EvaluationParameterStore, MetricStore
+from .partition_aggregate_store import PartitionAggregateStore
 from .query_store import SqlAlchemyQueryStore
 from .store import Store
 from .store_backend import InMemoryStoreBackend, StoreBackend
@@ -21,8 +24,11 @@ for module_name, package_name in [
     (".expectations_store", "great_expectations.data_context.store"),
     (".html_site_store", "great_expectations.data_context.store"),
     (".metric_store", "great_expectations.data_context.store"),
+    (".evaluation_parameter_dependency_store", "great_expectations.data_context.store"),
+    (".partition_aggregate_store", "great_expectations.data_context.store"),
     (".store_backend", "great_expectations.data_context.store"),
     (".tuple_store_backend", "great_expectations.data_context.store"),
     (".database_store_backend", "great_expectations.data_context.store"),
+    (".database_metric_store_backend", "great_expectations.data_context.store"),
 ]:
     verify_dynamic_loading_support(module_name=module_name, package_name=package_name)
@@ -0,0 +1,212 @@
+import logging
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.data_context.store.store_backend import StoreBackend
+
+try:
+    import sqlalchemy
+    from sqlalchemy import (
+        Column,
+        Index,
+        MetaData,
+        String,
+        Table,
+        and_,
+        create_engine,
+        select,
+    )
+    from sqlalchemy.engine.url import URL
+    from sqlalchemy.exc import NoSuchTableError, SQLAlchemyError
+except ImportError:
+    sqlalchemy = None
+    create_engine = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseMetricStoreBackend(StoreBackend):
+    """
+    A DatabaseMetricStoreBackend stores the values of a MetricStore in a table with one row per metric value,
+    indexed to read the values of one metric across validation runs, for example to compare a metric with its
+    recent history.
+
+    Its keys are the fixed length tuples of ValidationMetricIdentifiers, whose parts are stored in the columns
+    run_name, run_time, data_asset_name, expectation_suite_name, metric_name and metric_kwargs_id. run_time is
+    stored in the sortable format of RunIdentifier tuples, such as 20200101T000000.000000Z.
+    """
+
+    key_columns = [
+        "run_name",
+        "run_time",
+        "data_asset_name",
+        "expectation_suite_name",
+        "metric_name",
+        "metric_kwargs_id",
+    ]
+
+    def __init__(
+        self, credentials, table_name="ge_metric_time_series", fixed_length_key=True
+    ):
+        super().__init__(fixed_length_key=fixed_length_key)
+        if not sqlalchemy:
+            raise ge_exceptions.DataContextError(
+                "ModuleNotFoundError: No module named 'sqlalchemy'"
+            )
+
+        if not self.fixed_length_key:
+            raise ge_exceptions.InvalidConfigError(
+                "DatabaseMetricStoreBackend requires use of a fixed-length-key"
+            )
+
+        if "engine" in credentials:
+            self.engine = credentials["engine"]
+        elif "url" in credentials:
+            self.engine = create_engine(credentials["url"])
+        else:
+            drivername = credentials.pop("drivername")
+            options = URL(drivername, **credentials)
+            self.engine = create_engine(options)
+
+        meta = MetaData()
+        try:
+            table = Table(table_name, meta, autoload=True, autoload_with=self.engine)
+            if {str(col.name).lower() for col in table.columns} != (
+                set(self.key_columns) | {"value"}
+            ):
+                raise ge_exceptions.StoreBackendError(
+                    f"Unable to use table {table_name}: it exists, but does not have the expected schema."
+                )
+        except NoSuchTableError:
+            table = Table(
+                table_name,
+                meta,
+                *[
+                    Column(key_column, String, primary_key=True)
+                    for key_column in self.key_columns
+                ],
+                Column("value", String),
+                # Serves the queries of get_metric_values, which read one metric ordered by run_time
+                Index(
+                    "ix_{}_metric".format(table_name),
+                    "metric_name",
+                    "expectation_suite_name",
+                    "data_asset_name",
+                    "metric_kwargs_id",
+                    "run_time",
+                ),
+            )
+            try:
+                meta.create_all(self.engine)
+            except SQLAlchemyError as e:
+                raise ge_exceptions.StoreBackendError(
+                    f"Unable to create table {table_name} because of an error. SqlAlchemyError: {str(e)}"
+                )
+        self._table = table
+
+    def _key_condition(self, key):
+        return and_(
+            *[
+                self._table.columns[key_column] == value
+                for key_column, value in zip(self.key_columns, key)
+            ]
+        )
+
+    def _get(self, key):
+        sel = select([self._table.columns.value]).where(self._key_condition(key))
+        try:
+            return self.engine.execute(sel).fetchone()[0]
+        except (TypeError, SQLAlchemyError) as e:
+            logger.debug("Error fetching value: " + str(e))
+            raise ge_exceptions.StoreError("Unable to fetch value for key: " + str(key))
+
+    def _set(self, key, value, **kwargs):
+        with self.engine.begin() as connection:
+            connection.execute(self._table.delete().where(self._key_condition(key)))
+            connection.execute(
+                self._table.insert().values(
+                    value=value, **dict(zip(self.key_columns, key))
+                )
+            )
+
+    def _move(self, source_key, dest_key, **kwargs):
+        raise NotImplementedError
+
+    def _has_key(self, key):
+        sel = select([sqlalchemy.func.count()]).where(self._key_condition(key))
+        try:
+            return self.engine.execute(sel).fetchone()[0] == 1
+        except SQLAlchemyError as e:
+            logger.debug("Error checking for value: " + str(e))
+            return False
+
+    def list_keys(self, prefix=()):
+        sel = select([self._table.columns[col] for col in self.key_columns]).where(
+            self._key_condition(prefix)
+        )
+        return [tuple(row) for row in self.engine.execute(sel).fetchall()]
+
+    def remove_key(self, key):
+        try:
+            return self.engine.execute(
+                self._table.delete().where(self._key_condition(key))
+            )
+        except SQLAlchemyError as e:
+            raise ge_exceptions.StoreBackendError(
+                f"Unable to delete key: got sqlalchemy error {str(e)}"
+            )
+
+    def get_metric_values(
+        self,
+        metric_name,
+        expectation_suite_name=None,
+        data_asset_name=None,
+        metric_kwargs_id=None,
+        start_time=None,
+        end_time=None,
+        limit=None,
+    ):
+        """
+        Return the keys and values of a metric, ordered by run_time.
+
+        Args:
+            metric_name: the name of the metric
+            expectation_suite_name: *optional* only return the values of this expectation suite
+            data_asset_name: *optional* only return the values of this data asset
+            metric_kwargs_id: *optional* only return the values with this metric_kwargs_id
+            start_time: *optional* only return the values of runs at or after this run_time string
+            end_time: *optional* only return the values of runs at or before this run_time string
+            limit: *optional* only return the latest limit values, which may come from fewer runs when several \
+                values of a run match
+
+        Returns:
+            a list of (key, value) tuples
+        """
+        columns = self._table.columns
+        conditions = [columns.metric_name == metric_name]
+        for column_name, value in [
+            ("expectation_suite_name", expectation_suite_name),
+            ("data_asset_name", data_asset_name),
+            ("metric_kwargs_id", metric_kwargs_id),
+        ]:
+            if value is not None:
+                conditions.append(columns[column_name] == value)
+        if start_time is not None:
+            conditions.append(columns.run_time >= start_time)
+        if end_time is not None:
+            conditions.append(columns.run_time <= end_time)
+
+        sel = select(
+            [columns[col] for col in self.key_columns] + [columns.value]
+        ).where(and_(*conditions))
+        if limit is not None:
+            sel = sel.order_by(columns.run_time.desc()).limit(limit)
+        else:
+            sel = sel.order_by(columns.run_time)
+        rows = [
+            (tuple(row[: len(self.key_columns)]), row[-1])
+            for row in self.engine.execute(sel).fetchall()
+        ]
+        if limit is not None:
+            rows.reverse()
+        return rows
@@ -0,0 +1,86 @@
+import json
+
+from great_expectations.core.data_context_key import StringKey
+from great_expectations.data_context.store.database_store_backend import (
+    DatabaseStoreBackend,
+)
+from great_expectations.data_context.store.store import Store
+from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
+from great_expectations.util import load_class, verify_dynamic_loading_support
+
+
+class EvaluationParameterDependencyStore(Store):
+    """
+    An EvaluationParameterDependencyStore persists the index of the evaluation parameter dependencies of the
+    expectation suites of a Data Context, so that a Data Context does not need to load and parse every expectation
+    suite to find the metrics to store when it stores evaluation parameters.
+
+    The index is a single value, stored under INDEX_KEY:
+
+    ::
+
+        {
+            "expectation_suites": {
+                <expectation suite name>: {
+                    "etag": <etag of the suite in the expectations store, see StoreBackend.list_key_etags>,
+                    "version": <fingerprint of the evaluation parameters of the suite>,
+                    "dependencies": <ExpectationSuite.get_evaluation_parameter_dependencies() of the suite>,
+                },
+            }
+        }
+
+    The Data Context updates it when it saves or deletes an expectation suite, and when it loads an expectation
+    suite whose version does not match the index. When the Data Context first loads the index, it indexes again the
+    expectation suites whose etag changed, for example because they were edited outside of the Data Context.
+    """
+
+    _key_class = StringKey
+
+    INDEX_KEY = StringKey("evaluation_parameter_dependencies")
+
+    def __init__(self, store_backend=None, runtime_environment=None):
+        if store_backend is not None:
+            store_backend_module_name = store_backend.get(
+                "module_name", "great_expectations.data_context.store"
+            )
+            store_backend_class_name = store_backend.get(
+                "class_name", "InMemoryStoreBackend"
+            )
+            verify_dynamic_loading_support(module_name=store_backend_module_name)
+            store_backend_class = load_class(
+                store_backend_class_name, store_backend_module_name
+            )
+
+            # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
+            if issubclass(store_backend_class, TupleStoreBackend):
+                # Provide defaults for this common case
+                store_backend["filepath_suffix"] = store_backend.get(
+                    "filepath_suffix", ".json"
+                )
+            elif issubclass(store_backend_class, DatabaseStoreBackend):
+                # Provide defaults for this common case
+                store_backend["table_name"] = store_backend.get(
+                    "table_name", "ge_evaluation_parameter_dependencies"
+                )
+                store_backend["key_columns"] = store_backend.get(
+                    "key_columns", ["index_name"]
+                )
+
+        super().__init__(
+            store_backend=store_backend, runtime_environment=runtime_environment
+        )
+
+    def get_index(self):
+        """Return the stored index, or None if it was never stored."""
+        if not self.has_key(self.INDEX_KEY):
+            return None
+        return self.get(self.INDEX_KEY)
+
+    def set_index(self, index):
+        self.set(self.INDEX_KEY, index)
+
+    def serialize(self, key, value):
+        return json.dumps(value, indent=2, sort_keys=True)
+
+    def deserialize(self, key, value):
+        return json.loads(value)
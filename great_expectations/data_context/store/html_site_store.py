@@ -1,4 +1,6 @@
+import hashlib
 import inspect
+import json
 import logging
 import os
 from mimetypes import guess_type
@@ -311,6 +313,9 @@ A HtmlSiteStore facilitates publishing rendered documentation built from Expecta
                 pass
         return keys
 
+    # Key in the static assets store of the manifest of the md5 hashes of the copied static assets
+    STATIC_ASSETS_MANIFEST_KEY = ("static", "static_assets_manifest.json")
+
     def write_index_page(self, page):
         """This third param_store has a special method, which uses a zero-length tuple as a key."""
         return self.store_backends["index_page"].set(
@@ -330,7 +335,39 @@ A HtmlSiteStore facilitates publishing rendered documentation built from Expecta
         """
         Copies static assets, using a special "static_assets" backend store that accepts variable-length tuples as
         keys, with no filepath_template.
+
+        The md5 hash of each copied asset is recorded in a manifest stored with the static assets, and assets whose
+        content did not change since they were last copied are not copied again.
         """
+        static_assets_manifest = self._get_static_assets_manifest()
+        updated_static_assets_manifest = dict(static_assets_manifest)
+        self._copy_static_assets(
+            static_assets_source_dir, updated_static_assets_manifest
+        )
+        if updated_static_assets_manifest != static_assets_manifest:
+            self.store_backends["static_assets"].set(
+                self.STATIC_ASSETS_MANIFEST_KEY,
+                json.dumps(updated_static_assets_manifest, indent=2, sort_keys=True),
+                content_encoding="utf-8",
+                content_type="application/json",
+            )
+
+    def _get_static_assets_manifest(self):
+        static_assets_store_backend = self.store_backends["static_assets"]
+        if not static_assets_store_backend.has_key(self.STATIC_ASSETS_MANIFEST_KEY):
+            return {}
+        try:
+            static_assets_manifest = json.loads(
+                static_assets_store_backend.get(self.STATIC_ASSETS_MANIFEST_KEY)
+            )
+        except ValueError:
+            logger.warning("Ignoring invalid static assets manifest")
+            return {}
+        if not isinstance(static_assets_manifest, dict):
+            return {}
+        return static_assets_manifest
+
+    def _copy_static_assets(self, static_assets_source_dir, static_assets_manifest):
         file_exclusions = [".DS_Store"]
         dir_exclusions = []
 
@@ -346,7 +383,7 @@ A HtmlSiteStore facilitates publishing rendered documentation built from Expecta
                     continue
                 # Recurse
                 new_source_dir = os.path.join(static_assets_source_dir, item)
-                self.copy_static_assets(new_source_dir)
+                self._copy_static_assets(new_source_dir, static_assets_manifest)
             # File
             else:
                 # Copy file over using static assets store backend
@@ -354,27 +391,35 @@ A HtmlSiteStore facilitates publishing rendered documentation built from Expecta
                     continue
                 source_name = os.path.join(static_assets_source_dir, item)
                 with open(source_name, "rb") as f:
-                    # Only use path elements starting from static/ for key
-                    store_key = tuple(os.path.normpath(source_name).split(os.sep))
-                    store_key = store_key[store_key.index("static") :]
-                    content_type, content_encoding = guess_type(item, strict=False)
-
-                    if content_type is None:
-                        # Use GE-known content-type if possible
-                        if source_name.endswith(".otf"):
-                            content_type = "font/opentype"
-                        else:
-                            # fallback
-                            logger.warning(
-                                "Unable to automatically determine content_type for {}".format(
-                                    source_name
-                                )
+                    content = f.read()
+                # Only use path elements starting from static/ for key
+                store_key = tuple(os.path.normpath(source_name).split(os.sep))
+                store_key = store_key[store_key.index("static") :]
+
+                manifest_key = "/".join(store_key)
+                content_hash = hashlib.md5(content).hexdigest()
+                if static_assets_manifest.get(manifest_key) == content_hash:
+                    continue
+
+                content_type, content_encoding = guess_type(item, strict=False)
+
+                if content_type is None:
+                    # Use GE-known content-type if possible
+                    if source_name.endswith(".otf"):
+                        content_type = "font/opentype"
+                    else:
+                        # fallback
+                        logger.warning(
+                            "Unable to automatically determine content_type for {}".format(
+                                source_name
                             )
-                            content_type = "text/html; charset=utf8"
-
-                    self.store_backends["static_assets"].set(
-                        store_key,
-                        f.read(),
-                        content_encoding=content_encoding,
-                        content_type=content_type,
-                    )
+                        )
+                        content_type = "text/html; charset=utf8"
+
+                self.store_backends["static_assets"].set(
+                    store_key,
+                    content,
+                    content_encoding=content_encoding,
+                    content_type=content_type,
+                )
+                static_assets_manifest[manifest_key] = content_hash
@@ -1,19 +1,41 @@
 import json
+from urllib.parse import parse_qsl
 
-from great_expectations.core import ensure_json_serializable
+from great_expectations.core import RunIdentifier, ensure_json_serializable
 from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.data_context.store.database_metric_store_backend import (
+    DatabaseMetricStoreBackend,
+)
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
+from great_expectations.exceptions import StoreError
 from great_expectations.util import load_class, verify_dynamic_loading_support
 
 
 class MetricStore(Store):
     """
     A MetricStore stores ValidationMetric information to be used between runs.
+
+    get_metric_series reads the values of a metric across runs. With a DatabaseMetricStoreBackend, the values are
+    read with one indexed query; other store backends list all their keys to find them.
+
+    Evaluation parameters can also read them with a URN such as
+    ``urn:great_expectations:stores:<store name>:<metric name>:<query parameters>``, for example
+    ``urn:great_expectations:stores:metric_store:statistics.evaluated_expectations:expectation_suite_name=my_suite&limit=5&aggregate=mean``;
+    see get_query_result.
     """
 
+    # Aggregates get_query_result can return instead of the list of metric values
+    _query_result_aggregates = {
+        "min": min,
+        "max": max,
+        "sum": sum,
+        "count": len,
+        "mean": lambda values: sum(values) / len(values),
+    }
+
     _key_class = ValidationMetricIdentifier
 
     def __init__(self, store_backend=None):
@@ -62,6 +84,113 @@ class MetricStore(Store):
         if value:
             return json.loads(value)["value"]
 
+    def get_metric_series(
+        self,
+        metric_name,
+        expectation_suite_name=None,
+        data_asset_name=None,
+        metric_kwargs_id=None,
+        start_time=None,
+        end_time=None,
+        limit=None,
+    ):
+        """
+        Return the values of a metric across runs, ordered by run_time.
+
+        Args:
+            metric_name: the name of the metric, such as statistics.evaluated_expectations
+            expectation_suite_name: *optional* only return the values of this expectation suite
+            data_asset_name: *optional* only return the values of this data asset
+            metric_kwargs_id: *optional* only return the values with this metric_kwargs_id
+            start_time: *optional* only return the values of runs at or after this datetime or datetime string
+            end_time: *optional* only return the values of runs at or before this datetime or datetime string
+            limit: *optional* only return the latest limit values, which may come from fewer runs when several \
+                values of a run match
+
+        Returns:
+            a list of (ValidationMetricIdentifier, value) tuples
+        """
+        if start_time is not None:
+            start_time = RunIdentifier(run_time=start_time).to_tuple()[1]
+        if end_time is not None:
+            end_time = RunIdentifier(run_time=end_time).to_tuple()[1]
+        if limit is not None:
+            limit = int(limit)
+
+        if isinstance(self._store_backend, DatabaseMetricStoreBackend):
+            return [
+                (self.tuple_to_key(key), self.deserialize(key, value))
+                for key, value in self._store_backend.get_metric_values(
+                    metric_name,
+                    expectation_suite_name=expectation_suite_name,
+                    data_asset_name=data_asset_name,
+                    metric_kwargs_id=metric_kwargs_id,
+                    start_time=start_time,
+                    end_time=end_time,
+                    limit=limit,
+                )
+            ]
+
+        keys = []
+        for key in self.list_keys():
+            run_time = key.run_id.to_tuple()[1]
+            if (
+                key.metric_name != metric_name
+                or expectation_suite_name is not None
+                and key.expectation_suite_identifier.expectation_suite_name
+                != expectation_suite_name
+                or data_asset_name is not None
+                and key.data_asset_name != data_asset_name
+                or metric_kwargs_id is not None
+                and key.metric_kwargs_id != metric_kwargs_id
+                or start_time is not None
+                and run_time < start_time
+                or end_time is not None
+                and run_time > end_time
+            ):
+                continue
+            keys.append(key)
+        keys.sort(key=lambda key: key.run_id.to_tuple()[1])
+        if limit is not None:
+            keys = keys[-limit:] if limit > 0 else []
+        return [(key, self.get(key)) for key in keys]
+
+    def get_query_result(self, metric_name, query_parameters=None):
+        """
+        Return the values of a metric across runs, for evaluation parameters referring to this store.
+
+        Args:
+            metric_name: the name of the metric
+            query_parameters: *optional* a dictionary, or a URL query string such as "limit=5&aggregate=mean", of \
+                the keyword arguments of get_metric_series, and optionally an aggregate among min, max, sum, count \
+                and mean
+
+        Returns:
+            the list of the values of the metric ordered by run_time, or their aggregate
+        """
+        if query_parameters is None:
+            query_parameters = {}
+        elif isinstance(query_parameters, str):
+            query_parameters = dict(parse_qsl(query_parameters))
+        query_parameters = dict(query_parameters)
+        aggregate = query_parameters.pop("aggregate", None)
+        if aggregate is not None and aggregate not in self._query_result_aggregates:
+            raise StoreError(
+                "Unknown aggregate {}: must be one of {}".format(
+                    aggregate, ", ".join(self._query_result_aggregates.keys())
+                )
+            )
+
+        values = [
+            value
+            for _, value in self.get_metric_series(metric_name, **query_parameters)
+        ]
+        if aggregate is None:
+            return values
+        if not values and aggregate != "count":
+            raise StoreError("No values of metric {} to aggregate".format(metric_name))
+        return self._query_result_aggregates[aggregate](values)
+
 
 class EvaluationParameterStore(MetricStore):
     def __init__(self, store_backend=None):
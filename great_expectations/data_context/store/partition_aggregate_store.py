@@ -0,0 +1,67 @@
+import json
+
+from great_expectations.data_context.store.database_store_backend import (
+    DatabaseStoreBackend,
+)
+from great_expectations.data_context.store.store import Store
+from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
+from great_expectations.data_context.types.resource_identifiers import (
+    PartitionAggregatesIdentifier,
+)
+from great_expectations.util import load_class, verify_dynamic_loading_support
+
+
+class PartitionAggregateStore(Store):
+    """
+    A PartitionAggregateStore stores the partial aggregates computed over the partitions of a data asset, such as
+    row counts, sums or value counts, so that an incremental validation of the data asset only needs to compute them
+    over its new partitions.
+
+    Each value is a dictionary of JSON serializable aggregates, keyed by a description of the aggregate.
+    """
+
+    _key_class = PartitionAggregatesIdentifier
+
+    def __init__(self, store_backend=None, runtime_environment=None):
+        if store_backend is not None:
+            store_backend_module_name = store_backend.get(
+                "module_name", "great_expectations.data_context.store"
+            )
+            store_backend_class_name = store_backend.get(
+                "class_name", "InMemoryStoreBackend"
+            )
+            verify_dynamic_loading_support(module_name=store_backend_module_name)
+            store_backend_class = load_class(
+                store_backend_class_name, store_backend_module_name
+            )
+
+            # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
+            if issubclass(store_backend_class, TupleStoreBackend):
+                # Provide defaults for this common case
+                store_backend["filepath_suffix"] = store_backend.get(
+                    "filepath_suffix", ".json"
+                )
+            elif issubclass(store_backend_class, DatabaseStoreBackend):
+                # Provide defaults for this common case
+                store_backend["table_name"] = store_backend.get(
+                    "table_name", "ge_partition_aggregates"
+                )
+                store_backend["key_columns"] = store_backend.get(
+                    "key_columns",
+                    [
+                        "datasource_name",
+                        "batch_kwargs_generator_name",
+                        "data_asset_name",
+                        "partition_id",
+                    ],
+                )
+
+        super().__init__(
+            store_backend=store_backend, runtime_environment=runtime_environment
+        )
+
+    def serialize(self, key, value):
+        return json.dumps(value, indent=2, sort_keys=True)
+
+    def deserialize(self, key, value):
+        return json.loads(value)
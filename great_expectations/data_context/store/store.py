@@ -89,6 +89,16 @@ class Store:
     def list_keys(self):
         return [self.tuple_to_key(key) for key in self._store_backend.list_keys()]
 
+    def list_key_etags(self):
+        return {
+            self.tuple_to_key(key): etag
+            for key, etag in self._store_backend.list_key_etags().items()
+        }
+
+    def get_etag(self, key):
+        self._validate_key(key)
+        return self._store_backend.get_etag(self.key_to_tuple(key))
+
     def has_key(self, key):
         if self._use_fixed_length_key:
             return self._store_backend.has_key(key.to_fixed_length_tuple())
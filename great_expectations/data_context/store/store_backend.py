@@ -99,6 +99,23 @@ class StoreBackend(metaclass=ABCMeta):
     def _has_key(self, key):
         raise NotImplementedError
 
+    def list_key_etags(self):
+        """
+        Return a dictionary of {key -> etag} for all the keys of the store backend.
+
+        The etag of a key is a string which changes whenever the value of the key changes, and which the store backend
+        obtains without reading the value, or None if the store backend cannot tell it.
+        """
+        return {key: None for key in self.list_keys()}
+
+    def get_etag(self, key):
+        """Return the etag of a key (see list_key_etags), or None if the store backend cannot tell it."""
+        self._validate_key(key)
+        return self._get_etag(key)
+
+    def _get_etag(self, key):
+        return None
+
     def is_ignored_key(self, key):
         for ignored in self.IGNORED_FILES:
             if ignored in key:
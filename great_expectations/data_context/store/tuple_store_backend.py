@@ -362,6 +362,20 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             os.path.join(self.full_base_directory, self._convert_key_to_filepath(key))
         )
 
+    def list_key_etags(self):
+        return {key: self._get_etag(key) for key in self.list_keys()}
+
+    def _get_etag(self, key):
+        filepath = os.path.join(
+            self.full_base_directory, self._convert_key_to_filepath(key)
+        )
+        try:
+            stat_result = os.stat(filepath)
+        except FileNotFoundError:
+            return None
+        # Like the etags HTTP servers send for files, built from the modification time and the size of the file
+        return "{}-{}".format(stat_result.st_mtime_ns, stat_result.st_size)
+
 
 class TupleS3StoreBackend(TupleStoreBackend):
     """
@@ -487,6 +501,16 @@ class TupleS3StoreBackend(TupleStoreBackend):
         s3.Object(self.bucket, source_filepath).delete()
 
     def list_keys(self):
+        return [key for key, _ in self._list_keys_and_s3_objects()]
+
+    def list_key_etags(self):
+        return {
+            key: s3_object_info["ETag"]
+            for key, s3_object_info in self._list_keys_and_s3_objects()
+        }
+
+    def _list_keys_and_s3_objects(self):
+        """Return a list of (key, S3 object info) tuples for the objects of the store."""
         key_list = []
 
         import boto3
@@ -530,10 +554,23 @@ class TupleS3StoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(s3_object_key)
             if key:
-                key_list.append(key)
+                key_list.append((key, s3_object_info))
 
         return key_list
 
+    def _get_etag(self, key):
+        import boto3
+        from botocore.exceptions import ClientError
+
+        s3 = boto3.client("s3", endpoint_url=self.endpoint_url)
+        try:
+            s3_object_info = s3.head_object(
+                Bucket=self.bucket, Key=self._build_s3_object_key(key)
+            )
+        except ClientError:
+            return None
+        return s3_object_info["ETag"]
+
     def get_url_for_key(self, key, protocol=None):
         import boto3
 
@@ -722,6 +759,13 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         _ = bucket.rename_blob(blob, dest_filepath)
 
     def list_keys(self):
+        return [key for key, _ in self._list_keys_and_blobs()]
+
+    def list_key_etags(self):
+        return {key: blob.etag for key, blob in self._list_keys_and_blobs()}
+
+    def _list_keys_and_blobs(self):
+        """Return a list of (key, blob) tuples for the objects of the store."""
         key_list = []
 
         from google.cloud import storage
@@ -741,9 +785,19 @@ class TupleGCSStoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(gcs_object_key)
             if key:
-                key_list.append(key)
+                key_list.append((key, blob))
         return key_list
 
+    def _get_etag(self, key):
+        from google.cloud import storage
+
+        gcs = storage.Client(project=self.project)
+        bucket = gcs.get_bucket(self.bucket)
+        blob = bucket.get_blob(self._build_gcs_object_key(key))
+        if not blob:
+            return None
+        return blob.etag
+
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
 
@@ -1,13 +1,30 @@
-from great_expectations.core import ExpectationSuiteValidationResultSchema
+import base64
+import datetime
+import gzip
+import json
+from collections import defaultdict
+
+from great_expectations.core import (
+    ExpectationSuiteValidationResult,
+    ExpectationSuiteValidationResultSchema,
+    LazyExpectationSuiteValidationResult,
+)
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
-from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
+from great_expectations.data_context.store.tuple_store_backend import (
+    TupleFilesystemStoreBackend,
+    TupleStoreBackend,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
-from great_expectations.data_context.util import load_class
+from great_expectations.data_context.util import (
+    instantiate_class_from_config,
+    load_class,
+)
+from great_expectations.exceptions import StoreConfigurationError, StoreError
 from great_expectations.util import verify_dynamic_loading_support
 
 
@@ -78,15 +95,74 @@ A ValidationsStore manages Validation Results to ensure they are accessible via
         bug_risk: Moderate
 
 --ge-feature-maturity-info--
+
+A ValidationsStore configured with a retention_policy can compact, archive and delete old validation results when
+apply_retention_policy is called, for example by ``great_expectations store apply-retention``:
+
+.. code-block:: yaml
+
+    validations_store:
+      class_name: ValidationsStore
+      store_backend:
+        class_name: TupleFilesystemStoreBackend
+        base_directory: uncommitted/validations/
+      retention_policy:
+        # keep the full results of the latest 20 runs of each expectation suite and batch...
+        max_results_per_batch: 20
+        # ...and of the last 30 days
+        max_age_days: 30
+        # delete the results older than a year from the store; they remain in the archive bundles
+        delete_after_days: 365
+        # never compact or delete unsuccessful results
+        keep_unsuccessful: true
+      # optional for a TupleFilesystemStoreBackend, which defaults to a sibling directory of its base_directory
+      archive_store_backend:
+        class_name: TupleFilesystemStoreBackend
+        base_directory: uncommitted/validations_archive/
+
+The full results selected by max_age_days, max_results_per_suite or max_results_per_batch are archived, then replaced
+by a summary which keeps their statistics, evaluation parameters, meta and unsuccessful expectation results only, so
+that they can still be rendered into Data Docs. The results older than delete_after_days are archived if needed, then
+deleted, which keeps the listings of the store short as the history grows.
     """
 
     _key_class = ValidationResultIdentifier
 
-    def __init__(self, store_backend=None, runtime_environment=None):
+    _retention_policy_options = [
+        "max_age_days",
+        "max_results_per_suite",
+        "max_results_per_batch",
+        "delete_after_days",
+        "keep_unsuccessful",
+    ]
+
+    # Key of the retention index in the archive store backend; archive bundles are stored under "bundles"
+    RETENTION_INDEX_KEY = ("retention_index.json",)
+
+    def __init__(
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        retention_policy=None,
+        archive_store_backend=None,
+    ):
         self._expectationSuiteValidationResultSchema = (
             ExpectationSuiteValidationResultSchema()
         )
 
+        if retention_policy is not None:
+            unknown_options = set(retention_policy.keys()) - set(
+                self._retention_policy_options
+            )
+            if unknown_options:
+                raise StoreConfigurationError(
+                    "Unknown retention_policy options {}: the options are {}".format(
+                        ", ".join(sorted(unknown_options)),
+                        ", ".join(self._retention_policy_options),
+                    )
+                )
+        self._retention_policy = retention_policy
+
         if store_backend is not None:
             store_backend_module_name = store_backend.get(
                 "module_name", "great_expectations.data_context.store"
@@ -105,6 +181,16 @@ A ValidationsStore manages Validation Results to ensure they are accessible via
                 store_backend["filepath_suffix"] = store_backend.get(
                     "filepath_suffix", ".json"
                 )
+                if (
+                    retention_policy is not None
+                    and archive_store_backend is None
+                    and issubclass(store_backend_class, TupleFilesystemStoreBackend)
+                ):
+                    archive_store_backend = {
+                        "class_name": "TupleFilesystemStoreBackend",
+                        "base_directory": store_backend["base_directory"].rstrip("/")
+                        + "_archive",
+                    }
             elif issubclass(store_backend_class, DatabaseStoreBackend):
                 # Provide defaults for this common case
                 store_backend["table_name"] = store_backend.get(
@@ -123,8 +209,287 @@ A ValidationsStore manages Validation Results to ensure they are accessible via
             store_backend=store_backend, runtime_environment=runtime_environment
         )
 
+        self._archive_store_backend = None
+        if archive_store_backend is not None:
+            self._archive_store_backend = instantiate_class_from_config(
+                config=archive_store_backend,
+                runtime_environment=runtime_environment or {},
+                config_defaults={
+                    "module_name": "great_expectations.data_context.store"
+                },
+            )
+
     def serialize(self, key, value):
         return self._expectationSuiteValidationResultSchema.dumps(value)
 
     def deserialize(self, key, value):
         return self._expectationSuiteValidationResultSchema.loads(value)
+
+    def get(self, key, lazy=False):
+        """Get the validation result stored at key.
+
+        If lazy is True, a LazyExpectationSuiteValidationResult is returned: its summary fields are decoded
+        immediately, but individual expectation results are only decoded when accessed.
+        """
+        if not lazy:
+            return super().get(key)
+        self._validate_key(key)
+        value = self._store_backend.get(self.key_to_tuple(key))
+        if value:
+            return LazyExpectationSuiteValidationResult(value)
+
+    @property
+    def retention_policy(self):
+        return self._retention_policy
+
+    @property
+    def archive_store_backend(self):
+        return self._archive_store_backend
+
+    def apply_retention_policy(self, max_results=None, dry_run=False, now=None):
+        """Compact, archive and delete validation results according to the retention_policy of the store.
+
+        The retention index, stored in the archive store backend, records the tier of each result ("full",
+        "summary" or "archived"), its success and its archive bundle, so that each run only reads the results
+        stored since the previous one.
+
+        Args:
+            max_results: *optional* process at most this many results, oldest first, so that a long history can be
+                processed over several runs
+            dry_run: if True, only return what would be done
+            now: *optional* the datetime from which the ages of the results are computed; defaults to the current time
+
+        Returns:
+            a dictionary with the ValidationResultIdentifiers of the "summarized" and "deleted" results, and the keys
+            of the archive "bundles" written
+        """
+        if self._retention_policy is None:
+            raise StoreError("This ValidationsStore has no retention_policy.")
+        if self._archive_store_backend is None:
+            raise StoreError(
+                "This ValidationsStore has no archive_store_backend to archive validation results in."
+            )
+        policy = self._retention_policy
+        if now is None:
+            now = datetime.datetime.now(datetime.timezone.utc)
+        elif not now.tzinfo:
+            # run times are in UTC, like in RunIdentifier
+            now = now.replace(tzinfo=datetime.timezone.utc)
+
+        index = self._get_retention_index()
+        entries = index["validation_results"]
+        keys = {}
+        for key in self.list_keys():
+            index_key = self._get_retention_index_key(key)
+            keys[index_key] = key
+            if index_key not in entries or entries[index_key]["tier"] == "archived":
+                # Only the summary fields are decoded
+                validation_result = self.get(key, lazy=True)
+                retention_meta = validation_result.meta.get(
+                    "validation_result_retention"
+                )
+                entries[index_key] = {
+                    "tier": "summary" if retention_meta else "full",
+                    "success": validation_result.success,
+                    "bundle": retention_meta["archive_bundle"]
+                    if retention_meta
+                    else None,
+                }
+        for index_key in list(entries.keys()):
+            if index_key not in keys and entries[index_key]["tier"] != "archived":
+                # Removed from the store since the previous run
+                del entries[index_key]
+
+        to_summarize = set()
+        to_delete = set()
+        for index_key, key in keys.items():
+            age = now - key.run_id.run_time
+            if policy.get("delete_after_days") is not None and age > datetime.timedelta(
+                days=policy["delete_after_days"]
+            ):
+                to_delete.add(index_key)
+            elif (
+                policy.get("max_age_days") is not None
+                and age > datetime.timedelta(days=policy["max_age_days"])
+                and entries[index_key]["tier"] == "full"
+            ):
+                to_summarize.add(index_key)
+        for option, group_key in [
+            (
+                "max_results_per_suite",
+                lambda key: key.expectation_suite_identifier.expectation_suite_name,
+            ),
+            (
+                "max_results_per_batch",
+                lambda key: (
+                    key.expectation_suite_identifier.expectation_suite_name,
+                    key.batch_identifier,
+                ),
+            ),
+        ]:
+            if policy.get(option) is None:
+                continue
+            groups = defaultdict(list)
+            for index_key, key in keys.items():
+                groups[group_key(key)].append(index_key)
+            for group in groups.values():
+                group.sort(key=lambda index_key: keys[index_key].run_id.run_time)
+                for index_key in group[: max(len(group) - policy[option], 0)]:
+                    if (
+                        entries[index_key]["tier"] == "full"
+                        and index_key not in to_delete
+                    ):
+                        to_summarize.add(index_key)
+        if policy.get("keep_unsuccessful"):
+            to_summarize = {
+                index_key for index_key in to_summarize if entries[index_key]["success"]
+            }
+            to_delete = {
+                index_key for index_key in to_delete if entries[index_key]["success"]
+            }
+
+        selected = sorted(
+            to_summarize | to_delete,
+            key=lambda index_key: keys[index_key].run_id.run_time,
+        )
+        if max_results is not None:
+            selected = selected[:max_results]
+
+        to_archive = defaultdict(list)
+        for index_key in selected:
+            if entries[index_key]["tier"] == "full":
+                to_archive[
+                    keys[index_key].expectation_suite_identifier.expectation_suite_name
+                ].append(index_key)
+        report = {
+            "summarized": [
+                keys[index_key] for index_key in selected if index_key in to_summarize
+            ],
+            "deleted": [
+                keys[index_key] for index_key in selected if index_key in to_delete
+            ],
+            "bundles": [
+                self._get_archive_bundle_key(expectation_suite_name, now)
+                for expectation_suite_name in sorted(to_archive.keys())
+            ],
+        }
+        if dry_run:
+            return report
+
+        for bundle_key in report["bundles"]:
+            archived = []
+            summaries = {}
+            for index_key in to_archive[bundle_key[1]]:
+                key = keys[index_key]
+                serialized = self._store_backend.get(self.key_to_tuple(key))
+                archived.append(
+                    {
+                        "key": list(self.key_to_tuple(key)),
+                        "validation_result": json.loads(serialized),
+                    }
+                )
+                if index_key in to_summarize:
+                    summaries[index_key] = self._get_validation_result_summary(
+                        LazyExpectationSuiteValidationResult(serialized),
+                        bundle_key,
+                        now,
+                    )
+            # The bundle is written before any result is replaced or deleted
+            self._archive_store_backend.set(
+                bundle_key, self._encode_archive_bundle(archived)
+            )
+            for index_key in to_archive[bundle_key[1]]:
+                entries[index_key]["bundle"] = list(bundle_key)
+                if index_key in summaries:
+                    self.set(keys[index_key], summaries[index_key])
+                    entries[index_key]["tier"] = "summary"
+        for index_key in selected:
+            if index_key in to_delete:
+                self._store_backend.remove_key(self.key_to_tuple(keys[index_key]))
+                entries[index_key]["tier"] = "archived"
+
+        self._archive_store_backend.set(
+            self.RETENTION_INDEX_KEY, json.dumps(index, indent=2, sort_keys=True)
+        )
+        return report
+
+    def get_archived(self, key):
+        """Return the full validation result stored at key before it was compacted or deleted by
+        apply_retention_policy."""
+        self._validate_key(key)
+        entry = (
+            self._get_retention_index()["validation_results"].get(
+                self._get_retention_index_key(key)
+            )
+            if self._archive_store_backend is not None
+            else None
+        )
+        if entry is None or entry["bundle"] is None:
+            raise StoreError(
+                "The validation result {} has not been archived.".format(key.to_tuple())
+            )
+        archived = self._decode_archive_bundle(
+            self._archive_store_backend.get(tuple(entry["bundle"]))
+        )
+        for archived_result in archived:
+            if tuple(archived_result["key"]) == self.key_to_tuple(key):
+                return self._expectationSuiteValidationResultSchema.load(
+                    archived_result["validation_result"]
+                )
+        raise StoreError(
+            "The validation result {} is missing from its archive bundle.".format(
+                key.to_tuple()
+            )
+        )
+
+    def _get_retention_index(self):
+        if not self._archive_store_backend.has_key(self.RETENTION_INDEX_KEY):
+            return {"validation_results": {}}
+        return json.loads(self._archive_store_backend.get(self.RETENTION_INDEX_KEY))
+
+    def _get_archive_bundle_key(self, expectation_suite_name, now):
+        bundle_name = now.strftime("%Y%m%dT%H%M%S.%fZ")
+        bundle_key = ("bundles", expectation_suite_name, bundle_name + ".bundle")
+        sequence_number = 1
+        # Bundles are never overwritten, even by runs at the same time
+        while self._archive_store_backend.has_key(bundle_key):
+            bundle_key = (
+                "bundles",
+                expectation_suite_name,
+                "{}-{}.bundle".format(bundle_name, sequence_number),
+            )
+            sequence_number += 1
+        return bundle_key
+
+    def _get_retention_index_key(self, key):
+        return json.dumps(list(self.key_to_tuple(key)))
+
+    @staticmethod
+    def _get_validation_result_summary(validation_result, bundle_key, now):
+        meta = dict(validation_result.meta)
+        meta["validation_result_retention"] = {
+            "archive_bundle": list(bundle_key),
+            "compacted_at": now.isoformat(),
+        }
+        return ExpectationSuiteValidationResult(
+            success=validation_result.success,
+            results=[
+                result
+                for result in validation_result.iter_results()
+                if not result.success
+            ],
+            evaluation_parameters=validation_result.evaluation_parameters,
+            statistics=validation_result.statistics,
+            meta=meta,
+        )
+
+    @staticmethod
+    def _encode_archive_bundle(archived):
+        # Compressed, then base64-encoded so that any store backend can store it as text
+        return base64.b64encode(
+            gzip.compress(json.dumps(archived).encode("utf-8"))
+        ).decode("ascii")
+
+    @staticmethod
+    def _decode_archive_bundle(value):
+        return json.loads(gzip.decompress(base64.b64decode(value)).decode("utf-8"))
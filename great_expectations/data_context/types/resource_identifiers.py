@@ -278,6 +278,55 @@ class SiteSectionIdentifier(DataContextKey):
             )
 
 
+class PartitionAggregatesIdentifier(DataContextKey):
+    """A PartitionAggregatesIdentifier identifies the aggregates computed over one partition of a data asset, as
+    listed by a batch kwargs generator."""
+
+    def __init__(
+        self,
+        datasource_name: str,
+        batch_kwargs_generator_name: str,
+        data_asset_name: str,
+        partition_id: str,
+    ):
+        super().__init__()
+        self._datasource_name = datasource_name
+        self._batch_kwargs_generator_name = batch_kwargs_generator_name
+        self._data_asset_name = data_asset_name
+        self._partition_id = partition_id
+
+    @property
+    def datasource_name(self):
+        return self._datasource_name
+
+    @property
+    def batch_kwargs_generator_name(self):
+        return self._batch_kwargs_generator_name
+
+    @property
+    def data_asset_name(self):
+        return self._data_asset_name
+
+    @property
+    def partition_id(self):
+        return self._partition_id
+
+    def to_tuple(self):
+        return (
+            self.datasource_name,
+            self.batch_kwargs_generator_name,
+            self.data_asset_name,
+            self.partition_id,
+        )
+
+    def to_fixed_length_tuple(self):
+        return self.to_tuple()
+
+    @classmethod
+    def from_fixed_length_tuple(cls, tuple_):
+        return cls.from_tuple(tuple_)
+
+
 expectationSuiteIdentifierSchema = ExpectationSuiteIdentifierSchema()
 validationResultIdentifierSchema = ValidationResultIdentifierSchema()
 runIdentifierSchema = RunIdentifierSchema()
@@ -2,6 +2,10 @@ import logging
 
 from .dataset import Dataset
 from .pandas_dataset import MetaPandasDataset, PandasDataset
+from .partition_aggregates_dataset import (
+    MetaPartitionAggregatesDataset,
+    PartitionAggregatesDataset,
+)
 
 logger = logging.getLogger(__name__)
 
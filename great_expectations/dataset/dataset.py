@@ -109,9 +109,7 @@ class MetaDataset(DataAsset):
             result_format = parse_result_format(result_format)
 
             if row_condition and self._supports_row_condition:
-                self = self.query(row_condition, parser=condition_parser).reset_index(
-                    drop=True
-                )
+                self = self._query_rows(row_condition, parser=condition_parser)
 
             element_count = self.get_row_count()
 
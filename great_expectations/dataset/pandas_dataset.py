@@ -17,7 +17,9 @@ from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
 from great_expectations.dataset.util import (
     _scipy_distribution_positional_args_from_dict,
+    combine_regex_list,
     is_valid_continuous_partition_object,
+    parse_datetime_series,
     validate_distribution_parameters,
 )
 
@@ -25,6 +27,40 @@ from .dataset import Dataset
 
 logger = logging.getLogger(__name__)
 
+# The number of rows sampled to estimate the number of distinct values of a column
+_DISTINCT_VALUE_SAMPLE_SIZE = 10000
+
+
+def _factorize_for_map_expectation(series, distinct_value_ratio_threshold):
+    """Return (codes, distinct_values) such that series equals distinct_values[codes], or (None, None).
+
+    Distinct values are only used where equal values are guaranteed to be indistinguishable to an expectation: for
+    categoricals, strings and integers. (Factorizing a column of mixed objects would merge, for example, 1, 1.0 and
+    True, which have different string representations.) Strings and integers are only factorized when a sample of the
+    column has at most distinct_value_ratio_threshold distinct values per row, so that high-cardinality columns, such
+    as identifiers, do not pay for a factorization that saves nothing.
+    """
+    if pd.api.types.is_categorical_dtype(series.dtype):
+        return (
+            series.cat.codes.values,
+            pd.Series(np.asarray(series.cat.categories), dtype=object),
+        )
+    if pd.api.types.is_integer_dtype(series.dtype) or (
+        pd.api.types.is_object_dtype(series.dtype)
+        and pd.api.types.infer_dtype(series, skipna=False) == "string"
+    ):
+        # A sample has at least as many distinct values per row as the whole column
+        sample = (
+            series.sample(n=_DISTINCT_VALUE_SAMPLE_SIZE, random_state=0)
+            if len(series) > _DISTINCT_VALUE_SAMPLE_SIZE
+            else series
+        )
+        if sample.nunique() > distinct_value_ratio_threshold * len(sample):
+            return None, None
+        codes, uniques = pd.factorize(series)
+        return codes, pd.Series(uniques, dtype=series.dtype)
+    return None, None
+
 
 class MetaPandasDataset(Dataset):
     """MetaPandasDataset is a thin layer between Dataset and PandasDataset.
@@ -36,6 +72,38 @@ class MetaPandasDataset(Dataset):
     and PandasDataset implements the expectation methods themselves.
     """
 
+    # Column map expectations that are passed the values of the column converted to str
+    _string_column_map_expectations = [
+        "expect_column_value_lengths_to_be_between",
+        "expect_column_values_to_match_regex",
+        "expect_column_values_to_not_match_regex",
+        "expect_column_values_to_match_regex_list",
+        "expect_column_values_to_not_match_regex_list",
+    ]
+
+    # Column map expectations whose result for a row depends only on the value in that row
+    _distinct_value_map_expectations = _string_column_map_expectations + [
+        "expect_column_values_to_be_in_set",
+        "expect_column_values_to_not_be_in_set",
+        "expect_column_value_lengths_to_equal",
+        "expect_column_values_to_match_strftime_format",
+        "expect_column_values_to_be_dateutil_parseable",
+        "expect_column_values_to_be_json_parseable",
+        "expect_column_values_to_match_json_schema",
+    ]
+
+    # Map expectations that parse their column(s) with dateutil when parse_strings_as_datetimes is True
+    _datetime_parsing_map_expectations = [
+        "expect_column_values_to_be_between",
+        "expect_column_values_to_be_increasing",
+        "expect_column_values_to_be_decreasing",
+        "expect_column_pair_values_A_to_be_greater_than_B",
+    ]
+
+    # Evaluate distinct value expectations once per distinct value when a column has at most this many distinct
+    # values per row
+    distinct_value_ratio_threshold = 0.1
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -99,7 +167,45 @@ class MetaPandasDataset(Dataset):
             nonnull_values = series[boolean_mapped_null_values == False]
             nonnull_count = int((boolean_mapped_null_values == False).sum())
 
-            boolean_mapped_success_values = func(self, nonnull_values, *args, **kwargs)
+            distinct_value_codes = None
+            if func.__name__ in cls._distinct_value_map_expectations:
+                distinct_value_codes, distinct_values = _factorize_for_map_expectation(
+                    nonnull_values, self.distinct_value_ratio_threshold
+                )
+
+            if distinct_value_codes is not None:
+                # The expectation depends only on each value, so evaluate it once per distinct value and broadcast
+                # the results back to the rows holding each value
+                if func.__name__ in cls._string_column_map_expectations:
+                    distinct_values = distinct_values.astype(str)
+                distinct_success_values = np.asarray(
+                    func(self, distinct_values, *args, **kwargs), dtype=bool
+                )
+                boolean_mapped_success_values = distinct_success_values[
+                    distinct_value_codes
+                ]
+            else:
+                func_values = nonnull_values
+                if (
+                    func.__name__ in cls._datetime_parsing_map_expectations
+                    and kwargs.get("parse_strings_as_datetimes")
+                ):
+                    # Share one parse of the column between all expectations that parse it. If the column cannot be
+                    # parsed, the expectation handles its values itself
+                    try:
+                        func_values = data._get_column_as_datetime(column)[
+                            boolean_mapped_null_values == False
+                        ]
+                    except (TypeError, ValueError):
+                        pass
+                elif func.__name__ in cls._string_column_map_expectations:
+                    # These expectations operate on the string representation of each value; share one conversion
+                    # of the column between all of them
+                    func_values = data._get_column_as_str(column)[
+                        boolean_mapped_null_values == False
+                    ]
+
+                boolean_mapped_success_values = func(self, func_values, *args, **kwargs)
             success_count = np.count_nonzero(boolean_mapped_success_values)
 
             unexpected_list = list(
@@ -185,7 +291,7 @@ class MetaPandasDataset(Dataset):
                 result_format = self.default_expectation_args["result_format"]
 
             if row_condition:
-                self = self.query(row_condition).reset_index(drop=True)
+                self = self._query_rows(row_condition)
 
             series_A = self[column_A]
             series_B = self[column_B]
@@ -214,8 +320,26 @@ class MetaPandasDataset(Dataset):
                 for value_pair in zip(list(nonnull_values_A), list(nonnull_values_B))
             ]
 
+            func_values_A = nonnull_values_A
+            func_values_B = nonnull_values_B
+            if func.__name__ in cls._datetime_parsing_map_expectations and kwargs.get(
+                "parse_strings_as_datetimes"
+            ):
+                # Share one parse of each column between all expectations that parse it. If a column cannot be
+                # parsed, the expectation handles its values itself
+                try:
+                    func_values_A = self._get_column_as_datetime(column_A)[
+                        boolean_mapped_null_values == False
+                    ]
+                    func_values_B = self._get_column_as_datetime(column_B)[
+                        boolean_mapped_null_values == False
+                    ]
+                except (TypeError, ValueError):
+                    func_values_A = nonnull_values_A
+                    func_values_B = nonnull_values_B
+
             boolean_mapped_success_values = func(
-                self, nonnull_values_A, nonnull_values_B, *args, **kwargs
+                self, func_values_A, func_values_B, *args, **kwargs
             )
             success_count = boolean_mapped_success_values.sum()
 
@@ -289,7 +413,7 @@ class MetaPandasDataset(Dataset):
                 result_format = self.default_expectation_args["result_format"]
 
             if row_condition:
-                self = self.query(row_condition).reset_index(drop=True)
+                self = self._query_rows(row_condition)
 
             test_df = self[column_list]
 
@@ -384,6 +508,9 @@ Notes:
         "_expectation_suite",
         "_config",
         "caching",
+        "_column_str_cache",
+        "_column_datetime_cache",
+        "_propagate_expectation_suite",
         "default_expectation_args",
         "discard_subset_failing_expectations",
     ]
@@ -398,7 +525,9 @@ Notes:
         return self.__class__
 
     def __finalize__(self, other, method=None, **kwargs):
-        if isinstance(other, PandasDataset):
+        if isinstance(other, PandasDataset) and getattr(
+            other, "_propagate_expectation_suite", True
+        ):
             self._initialize_expectations(other._expectation_suite)
             # If other was coerced to be a PandasDataset (e.g. via _constructor call during self.copy() operation)
             # then it may not have discard_subset_failing_expectations set. Default to self value
@@ -417,6 +546,36 @@ Notes:
         self.discard_subset_failing_expectations = kwargs.get(
             "discard_subset_failing_expectations", False
         )
+        self._column_str_cache = {}
+        self._column_datetime_cache = {}
+        self._propagate_expectation_suite = True
+
+    @staticmethod
+    def _get_cached_column_conversion(cache, series, column, convert):
+        cached = cache.get(column)
+        # The DataFrame returns the same Series object for a column until that column is modified
+        if cached is None or cached[0] is not series:
+            cached = (series, convert(series))
+            cache[column] = cached
+        return cached[1]
+
+    def _get_column_as_str(self, column):
+        """Return the values of column converted to str, converting each column at most once while it is unchanged."""
+        series = self[column]
+        if not self.caching:
+            return series.astype(str)
+        return self._get_cached_column_conversion(
+            self._column_str_cache, series, column, lambda values: values.astype(str)
+        )
+
+    def _get_column_as_datetime(self, column):
+        """Return the values of column parsed as datetimes, parsing each column at most once while it is unchanged."""
+        series = self[column]
+        if not self.caching:
+            return parse_datetime_series(series)
+        return self._get_cached_column_conversion(
+            self._column_datetime_cache, series, column, parse_datetime_series
+        )
 
     def _apply_row_condition(self, row_condition, condition_parser):
         if condition_parser not in ["python", "pandas"]:
@@ -425,9 +584,21 @@ Notes:
                 " and must be 'python' or 'pandas'"
             )
         else:
-            return self.query(row_condition, parser=condition_parser).reset_index(
-                drop=True
-            )
+            return self._query_rows(row_condition, parser=condition_parser)
+
+    def _query_rows(self, row_condition, parser="pandas"):
+        """Return the rows matching row_condition as a temporary dataset used to evaluate a single expectation.
+
+        The temporary dataset does not receive a copy of this dataset's expectation suite, which would otherwise be
+        deep-copied for every expectation evaluated with a row_condition.
+        """
+        self._propagate_expectation_suite = False
+        try:
+            rows = self.query(row_condition, parser=parser)
+        finally:
+            self._propagate_expectation_suite = True
+        rows._propagate_expectation_suite = False
+        return rows.reset_index(drop=True)
 
     def get_row_count(self):
         return self.shape[0]
@@ -442,15 +613,17 @@ Notes:
         return self[column].sum()
 
     def get_column_max(self, column, parse_strings_as_datetimes=False):
-        temp_column = self[column].dropna()
         if parse_strings_as_datetimes:
-            temp_column = temp_column.map(parse)
+            temp_column = self._get_column_as_datetime(column).dropna()
+        else:
+            temp_column = self[column].dropna()
         return temp_column.max()
 
     def get_column_min(self, column, parse_strings_as_datetimes=False):
-        temp_column = self[column].dropna()
         if parse_strings_as_datetimes:
-            temp_column = temp_column.map(parse)
+            temp_column = self._get_column_as_datetime(column).dropna()
+        else:
+            temp_column = self[column].dropna()
         return temp_column.min()
 
     def get_column_mean(self, column):
@@ -1174,7 +1347,7 @@ Notes:
                 max_value = parse(max_value)
 
             try:
-                temp_column = column.map(parse)
+                temp_column = parse_datetime_series(column)
             except TypeError:
                 temp_column = column
 
@@ -1287,7 +1460,7 @@ Notes:
         meta=None,
     ):
         if parse_strings_as_datetimes:
-            temp_column = column.map(parse)
+            temp_column = parse_datetime_series(column)
 
             col_diff = temp_column.diff()
 
@@ -1326,7 +1499,7 @@ Notes:
         meta=None,
     ):
         if parse_strings_as_datetimes:
-            temp_column = column.map(parse)
+            temp_column = parse_datetime_series(column)
 
             col_diff = temp_column.diff()
 
@@ -1378,7 +1551,7 @@ Notes:
         except ValueError:
             raise ValueError("min_value and max_value must be integers")
 
-        column_lengths = column.astype(str).str.len()
+        column_lengths = column.str.len()
 
         if min_value is not None and max_value is not None:
             return column_lengths.between(min_value, max_value)
@@ -1422,7 +1595,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        return column.astype(str).str.contains(regex)
+        return column.str.contains(regex)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1438,7 +1611,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        return ~column.astype(str).str.contains(regex)
+        return ~column.str.contains(regex)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1456,15 +1629,14 @@ Notes:
         meta=None,
     ):
 
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
-
         if match_on == "any":
-            return regex_match_df.any(axis="columns")
+            return self._matches_any_regex(column, regex_list)
         elif match_on == "all":
-            return regex_match_df.all(axis="columns")
+            matches_all = np.ones(len(column), dtype=bool)
+            for regex in regex_list:
+                # Only search values that have matched every regex so far
+                matches_all[matches_all] = column[matches_all].str.contains(regex)
+            return pd.Series(matches_all, index=column.index)
         else:
             raise ValueError("match_on must be either 'any' or 'all'")
 
@@ -1482,12 +1654,18 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
+        return ~self._matches_any_regex(column, regex_list)
 
-        return ~regex_match_df.any(axis="columns")
+    @staticmethod
+    def _matches_any_regex(column, regex_list):
+        combined_regex = combine_regex_list(regex_list)
+        if combined_regex is not None:
+            return column.str.contains(combined_regex)
+        matches_any = np.zeros(len(column), dtype=bool)
+        for regex in regex_list:
+            # Only search values that have not matched any regex so far
+            matches_any[~matches_any] = column[~matches_any].str.contains(regex)
+        return pd.Series(matches_any, index=column.index)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1804,8 +1982,8 @@ Notes:
             raise NotImplementedError
 
         if parse_strings_as_datetimes:
-            temp_column_A = column_A.map(parse)
-            temp_column_B = column_B.map(parse)
+            temp_column_A = parse_datetime_series(column_A)
+            temp_column_B = parse_datetime_series(column_B)
 
         else:
             temp_column_A = column_A
@@ -1835,24 +2013,22 @@ Notes:
             # vacuously true
             return np.ones(len(column_A), dtype=np.bool_)
 
-        temp_df = pd.DataFrame({"A": column_A, "B": column_B})
-        value_pairs_set = {(x, y) for x, y in value_pairs_set}
-
-        results = []
-        for i, t in temp_df.iterrows():
-            if pd.isnull(t["A"]):
-                a = None
-            else:
-                a = t["A"]
-
-            if pd.isnull(t["B"]):
-                b = None
-            else:
-                b = t["B"]
-
-            results.append((a, b) in value_pairs_set)
+        # Encode each (A, B) pair, both in the columns and in value_pairs_set, as a single integer key so that
+        # membership can be tested for all rows at once. Missing values (encoded as -1) match None in the set.
+        value_pairs = list(value_pairs_set)
+        set_A = pd.Series([pair[0] for pair in value_pairs], dtype=object)
+        set_B = pd.Series([pair[1] for pair in value_pairs], dtype=object)
+        codes_A, uniques_A = pd.factorize(
+            pd.concat([column_A.astype(object), set_A], ignore_index=True)
+        )
+        codes_B, _ = pd.factorize(
+            pd.concat([column_B.astype(object), set_B], ignore_index=True)
+        )
+        keys = (codes_B.astype(np.int64) + 1) * (len(uniques_A) + 1) + codes_A + 1
 
-        return pd.Series(results, temp_df.index)
+        return pd.Series(
+            np.isin(keys[: len(column_A)], keys[len(column_A) :]), column_A.index
+        )
 
     def expect_multicolumn_values_to_be_unique(
         self,
@@ -1894,9 +2070,16 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        threshold = len(column_list.columns)
         # Do not dropna here, since we have separately dealt with na in decorator
-        return column_list.nunique(dropna=False, axis=1) >= threshold
+        # Values in a record are unique if no two of its columns are equal (treating missing values as equal)
+        is_unique = pd.Series(True, index=column_list.index)
+        columns = [column_list.iloc[:, idx] for idx in range(len(column_list.columns))]
+        for idx, column_A in enumerate(columns):
+            for column_B in columns[idx + 1 :]:
+                is_unique &= ~(
+                    (column_A == column_B) | (column_A.isnull() & column_B.isnull())
+                )
+        return is_unique
 
     @DocInherit
     @MetaPandasDataset.multicolumn_map_expectation
@@ -0,0 +1,500 @@
+import datetime
+import decimal
+import inspect
+import json
+import logging
+import math
+from collections import Counter
+from functools import wraps
+
+import numpy as np
+import pandas as pd
+from dateutil.parser import parse
+
+from great_expectations.core import convert_to_json_serializable
+from great_expectations.data_asset.util import parse_result_format
+from great_expectations.dataset.dataset import Dataset
+
+logger = logging.getLogger(__name__)
+
+
+class MetaPartitionAggregatesDataset(Dataset):
+    """MetaPartitionAggregatesDataset is a thin layer between Dataset and PartitionAggregatesDataset.
+
+    This two-layer inheritance is required to make @classmethod decorators work.
+    """
+
+    @classmethod
+    def column_map_expectation(cls, func):
+        """Constructs an expectation using column-map semantics over the partitions of the dataset.
+
+        The expectation is evaluated over each partition, and the element, missing and unexpected counts of the
+        partitions are summed to evaluate `mostly` over the whole dataset. Since values are only compared within a
+        partition, the expectation must hold for the dataset as soon as it holds for each of its partitions.
+
+        The partial unexpected lists of the partitions are concatenated, so the COMPLETE result format only reports
+        the first unexpected values of each partition, and no unexpected index list is reported.
+
+        Args:
+            func (function): \
+                The Dataset method declaring the expectation; it is not called.
+        """
+        argspec = inspect.getfullargspec(func)[0][1:]
+
+        @cls.expectation(argspec)
+        @wraps(func)
+        def inner_wrapper(
+            self,
+            column,
+            mostly=None,
+            result_format=None,
+            row_condition=None,
+            condition_parser=None,
+            *args,
+            **kwargs
+        ):
+            if result_format is None:
+                result_format = self.default_expectation_args["result_format"]
+            result_format = parse_result_format(result_format)
+
+            expectation_kwargs = dict(kwargs)
+            if row_condition:
+                expectation_kwargs["row_condition"] = row_condition
+                expectation_kwargs["condition_parser"] = condition_parser
+
+            element_count = 0
+            nonnull_count = 0
+            unexpected_count = 0
+            unexpected_list = []
+            for aggregates in self._get_partition_aggregates(
+                "column_map", func.__name__, column, expectation_kwargs
+            ):
+                element_count += aggregates["element_count"]
+                nonnull_count += aggregates["element_count"] - (
+                    aggregates["missing_count"] or 0
+                )
+                unexpected_count += aggregates["unexpected_count"]
+                unexpected_list += aggregates["partial_unexpected_list"]
+
+            success, percent_success = self._calc_map_expectation_success(
+                nonnull_count - unexpected_count, nonnull_count, mostly
+            )
+            return self._format_map_output(
+                result_format,
+                success,
+                element_count,
+                nonnull_count,
+                unexpected_count,
+                unexpected_list,
+                None,
+            )
+
+        inner_wrapper.__name__ = func.__name__
+        inner_wrapper.__doc__ = func.__doc__
+
+        return inner_wrapper
+
+
+class PartitionAggregatesDataset(MetaPartitionAggregatesDataset):
+    """
+PartitionAggregatesDataset validates a data asset made of append-only partitions, such as the partitions listed by a
+batch kwargs generator, from aggregates computed over each partition.
+
+The aggregates of a partition, such as its row count, the sum and value counts of a column, or the unexpected count
+of a column map expectation, are computed over a batch of the partition the first time they are needed, and saved
+in a PartitionAggregateStore. Expectations are evaluated by merging the aggregates of all the partitions, so
+validating the data asset again after new partitions were added only loads the new partitions, and the partitions
+whose aggregates do not yet include those needed by new expectations.
+
+Partitions are assumed never to change once their aggregates were saved.
+
+Expectations which cannot be evaluated from partition aggregates, such as those on medians, quantiles, histograms
+with bins computed from the data or the uniqueness of column values, raise a NotImplementedError. So do expectations
+on the value counts, minimum or maximum of columns with values other than strings, numbers, booleans, dates,
+datetimes and decimals.
+    """
+
+    # Column map expectations whose result over the dataset only depends on the counts computed over each partition
+    _partition_column_map_expectations = [
+        "expect_column_values_to_not_be_null",
+        "expect_column_values_to_be_null",
+        "expect_column_values_to_be_in_set",
+        "expect_column_values_to_not_be_in_set",
+        "expect_column_values_to_be_between",
+        "expect_column_value_lengths_to_be_between",
+        "expect_column_value_lengths_to_equal",
+        "expect_column_values_to_match_regex",
+        "expect_column_values_to_not_match_regex",
+        "expect_column_values_to_match_regex_list",
+        "expect_column_values_to_not_match_regex_list",
+        "expect_column_values_to_match_strftime_format",
+        "expect_column_values_to_be_dateutil_parseable",
+        "expect_column_values_to_be_json_parseable",
+        "expect_column_values_to_match_json_schema",
+    ]
+
+    # Number of unexpected values of each partition kept in the column map aggregates
+    partial_unexpected_count = 20
+
+    def __init__(
+        self,
+        partition_ids,
+        load_partition_batch,
+        partition_aggregate_store=None,
+        partition_aggregate_keys=None,
+        *args,
+        **kwargs
+    ):
+        """
+        :param partition_ids: the ids of the partitions of the dataset, from the oldest to the newest
+        :param load_partition_batch: a function returning a Dataset of a partition given its id
+        :param partition_aggregate_store: *optional* the PartitionAggregateStore saving the aggregates of the \
+        partitions between validations
+        :param partition_aggregate_keys: the keys of the aggregates of each partition in partition_aggregate_store
+        """
+        super().__init__(*args, **kwargs)
+        self._partition_ids = list(partition_ids)
+        self._load_partition_batch = load_partition_batch
+        self._partition_aggregate_store = partition_aggregate_store
+        if partition_aggregate_store is not None and partition_aggregate_keys is None:
+            raise ValueError(
+                "partition_aggregate_keys must be provided with a partition_aggregate_store"
+            )
+        self._partition_aggregate_keys = (
+            {}
+            if partition_aggregate_store is None
+            else dict(zip(self._partition_ids, partition_aggregate_keys))
+        )
+        # Aggregates of each partition, keyed by the JSON description of the aggregate
+        self._partition_aggregates = {}
+        # Partitions whose aggregates were computed since they were last saved
+        self._unsaved_partition_ids = set()
+        self._partition_batches = {}
+
+    @property
+    def partition_ids(self):
+        return list(self._partition_ids)
+
+    def _get_stored_partition_aggregates(self, partition_id):
+        if partition_id not in self._partition_aggregates:
+            aggregates = {}
+            key = self._partition_aggregate_keys.get(partition_id)
+            if key is not None and self._partition_aggregate_store.has_key(key):
+                aggregates = self._partition_aggregate_store.get(key) or {}
+            self._partition_aggregates[partition_id] = aggregates
+        return self._partition_aggregates[partition_id]
+
+    def _get_partition_batch(self, partition_id):
+        if partition_id not in self._partition_batches:
+            logger.debug("Loading partition {}".format(partition_id))
+            self._partition_batches[partition_id] = self._load_partition_batch(
+                partition_id
+            )
+        return self._partition_batches[partition_id]
+
+    def _get_partition_aggregates(self, *aggregate):
+        """Return the aggregate of every partition, computing it over the partitions for which it is not stored."""
+        aggregate_key = json.dumps(aggregate, sort_keys=True, default=str)
+        values = []
+        for partition_id in self._partition_ids:
+            aggregates = self._get_stored_partition_aggregates(partition_id)
+            if aggregate_key not in aggregates:
+                aggregates[aggregate_key] = convert_to_json_serializable(
+                    self._compute_partition_aggregate(
+                        self._get_partition_batch(partition_id), *aggregate
+                    )
+                )
+                self._unsaved_partition_ids.add(partition_id)
+            values.append(aggregates[aggregate_key])
+        return values
+
+    def _compute_partition_aggregate(self, partition_batch, aggregate, *args):
+        if aggregate == "row_count":
+            return partition_batch.get_row_count()
+        elif aggregate == "table_columns":
+            return list(partition_batch.get_table_columns())
+        elif aggregate == "nonnull_count":
+            return partition_batch.get_column_nonnull_count(*args)
+        elif aggregate == "sum":
+            return partition_batch.get_column_sum(*args)
+        elif aggregate in ["min", "max"]:
+            column, parse_strings_as_datetimes = args
+            get_extremum = (
+                partition_batch.get_column_min
+                if aggregate == "min"
+                else partition_batch.get_column_max
+            )
+            value, value_type = _serialize_partition_value(
+                get_extremum(
+                    column, parse_strings_as_datetimes=parse_strings_as_datetimes
+                )
+            )
+            return {"value": value, "value_type": value_type}
+        elif aggregate == "moments":
+            (column,) = args
+            count = partition_batch.get_column_nonnull_count(column)
+            if count == 0:
+                return {"count": 0, "mean": 0.0, "m2": 0.0}
+            mean = float(partition_batch.get_column_mean(column))
+            stdev = (
+                float(partition_batch.get_column_stdev(column)) if count > 1 else 0.0
+            )
+            # The sum of squared differences from the mean, from the sample standard deviation
+            return {"count": count, "mean": mean, "m2": stdev ** 2 * (count - 1)}
+        elif aggregate == "count_in_range":
+            return partition_batch.get_column_count_in_range(*args)
+        elif aggregate == "hist":
+            column, bins = args
+            return list(partition_batch.get_column_hist(column, bins))
+        elif aggregate == "value_counts":
+            return [
+                list(_serialize_partition_value(value)) + [count]
+                for value, count in partition_batch.get_column_value_counts(
+                    *args, sort="none"
+                ).items()
+            ]
+        elif aggregate == "column_map":
+            expectation_type, column, expectation_kwargs = args
+            result = getattr(partition_batch, expectation_type)(
+                column,
+                result_format={
+                    "result_format": "SUMMARY",
+                    "partial_unexpected_count": self.partial_unexpected_count,
+                },
+                catch_exceptions=False,
+                **expectation_kwargs
+            ).result
+            if "unexpected_count" not in result:
+                raise NotImplementedError(
+                    "{} did not return unexpected counts over partition {}".format(
+                        expectation_type, partition_batch.batch_kwargs
+                    )
+                )
+            return {
+                "element_count": result["element_count"],
+                "missing_count": result.get("missing_count"),
+                "unexpected_count": result["unexpected_count"],
+                "partial_unexpected_list": result["partial_unexpected_list"],
+            }
+        raise ValueError("Unknown partition aggregate {}".format(aggregate))
+
+    def save_partition_aggregates(self):
+        """Save the partition aggregates computed since they were last saved to the PartitionAggregateStore."""
+        for partition_id in sorted(self._unsaved_partition_ids):
+            key = self._partition_aggregate_keys.get(partition_id)
+            if key is not None:
+                self._partition_aggregate_store.set(
+                    key, self._partition_aggregates[partition_id]
+                )
+        self._unsaved_partition_ids = set()
+
+    def validate(self, *args, **kwargs):
+        """Validate the dataset like DataAsset.validate, then save the partition aggregates computed to validate it
+        and release the partition batches loaded to compute them."""
+        try:
+            return super().validate(*args, **kwargs)
+        finally:
+            self.save_partition_aggregates()
+            self._partition_batches = {}
+
+    def get_row_count(self):
+        return sum(self._get_partition_aggregates("row_count"))
+
+    def get_column_count(self):
+        return len(self.get_table_columns())
+
+    def get_table_columns(self):
+        if not self._partition_ids:
+            return []
+        # Partitions are appended to the data asset, so the newest partition has its current columns
+        return self._get_partition_aggregates("table_columns")[-1]
+
+    def get_column_nonnull_count(self, column):
+        return sum(self._get_partition_aggregates("nonnull_count", column))
+
+    def get_column_sum(self, column):
+        return sum(
+            value
+            for value in self._get_partition_aggregates("sum", column)
+            if not _is_missing(value)
+        )
+
+    def get_column_mean(self, column):
+        nonnull_count = self.get_column_nonnull_count(column)
+        if nonnull_count == 0:
+            return None
+        return self.get_column_sum(column) / nonnull_count
+
+    def get_column_min(self, column, parse_strings_as_datetimes=False):
+        return self._merge_extremum(
+            min, "min", column, parse_strings_as_datetimes=parse_strings_as_datetimes
+        )
+
+    def get_column_max(self, column, parse_strings_as_datetimes=False):
+        return self._merge_extremum(
+            max, "max", column, parse_strings_as_datetimes=parse_strings_as_datetimes
+        )
+
+    def _merge_extremum(self, extremum, aggregate, column, parse_strings_as_datetimes):
+        values = []
+        for partition_extremum in self._get_partition_aggregates(
+            aggregate, column, parse_strings_as_datetimes
+        ):
+            if partition_extremum["value"] is None:
+                continue
+            values.append(
+                _parse_partition_value(
+                    partition_extremum["value"], partition_extremum["value_type"]
+                )
+            )
+        if not values:
+            return None
+        return extremum(values)
+
+    def get_column_value_counts(self, column, sort="value", collate=None):
+        if sort not in ["value", "count", "none"]:
+            raise ValueError("sort must be either 'value', 'count', or 'none'")
+        if collate is not None:
+            raise ValueError(
+                "collate parameter is not supported in PartitionAggregatesDataset"
+            )
+        counts = Counter()
+        for value_counts in self._get_partition_aggregates("value_counts", column):
+            for value, value_type, count in value_counts:
+                counts[_parse_partition_value(value, value_type)] += count
+        counts = pd.Series(dict(counts), dtype="int64")
+        if sort == "value":
+            try:
+                counts.sort_index(inplace=True)
+            except TypeError:
+                # values of multiple types cannot be compared
+                counts.index = counts.index.astype(str)
+                counts.sort_index(inplace=True)
+        elif sort == "count":
+            counts.sort_values(inplace=True)
+        counts.name = "count"
+        counts.index.name = "value"
+        return counts
+
+    def get_column_unique_count(self, column):
+        return len(self.get_column_value_counts(column, sort="none"))
+
+    def get_column_modes(self, column):
+        value_counts = self.get_column_value_counts(column)
+        if value_counts.empty:
+            return []
+        return list(value_counts[value_counts == value_counts.max()].index)
+
+    def get_column_median(self, column):
+        raise NotImplementedError(
+            "The median of a column cannot be computed from partition aggregates"
+        )
+
+    def get_column_quantiles(self, column, quantiles, allow_relative_error=False):
+        raise NotImplementedError(
+            "The quantiles of a column cannot be computed from partition aggregates"
+        )
+
+    def get_column_stdev(self, column):
+        # Merge the count, mean and sum of squared differences from the mean of the partitions pairwise, which is
+        # numerically stable unlike merging sums of squares
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for moments in self._get_partition_aggregates("moments", column):
+            if moments["count"] == 0:
+                continue
+            merged_count = count + moments["count"]
+            delta = moments["mean"] - mean
+            m2 += moments["m2"] + delta ** 2 * count * moments["count"] / merged_count
+            mean += delta * moments["count"] / merged_count
+            count = merged_count
+        if count < 2:
+            return None
+        # Sample standard deviation, like the other datasets
+        return math.sqrt(m2 / (count - 1))
+
+    def get_column_hist(self, column, bins):
+        # Bins are fixed by the caller, so the counts of each bin can be summed over the partitions
+        hist = None
+        for partition_hist in self._get_partition_aggregates(
+            "hist", column, list(bins)
+        ):
+            if hist is None:
+                hist = list(partition_hist)
+            else:
+                hist = [count + other for count, other in zip(hist, partition_hist)]
+        if hist is None:
+            return [0] * (len(bins) - 1)
+        return hist
+
+    def get_column_count_in_range(
+        self, column, min_val=None, max_val=None, strict_min=False, strict_max=True
+    ):
+        if min_val is None and max_val is None:
+            raise ValueError("Must specify either min or max value")
+        if min_val is not None and max_val is not None and min_val > max_val:
+            raise ValueError("Min value must be <= to max value")
+        return sum(
+            self._get_partition_aggregates(
+                "count_in_range", column, min_val, max_val, strict_min, strict_max
+            )
+        )
+
+
+def _serialize_partition_value(value):
+    """
+    Return a column value as a JSON-serializable value, and the type to parse it back with _parse_partition_value.
+
+    Dates and datetimes are serialized in ISO format, and decimals as strings, so that values merged over partitions
+    compare equal to the values of the partitions.
+    """
+    if isinstance(value, np.datetime64):
+        value = pd.Timestamp(value)
+    elif isinstance(value, np.timedelta64):
+        value = pd.Timedelta(value)
+    if _is_missing(value):
+        return None, None
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(), "datetime"
+    if isinstance(value, datetime.date):
+        return value.isoformat(), "date"
+    if isinstance(value, decimal.Decimal):
+        return str(value), "decimal"
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (str, bool, int, float)):
+        return value, None
+    raise NotImplementedError(
+        "Values of type {} cannot be merged over partitions".format(
+            type(value).__name__
+        )
+    )
+
+
+def _parse_partition_value(value, value_type):
+    if value_type == "datetime":
+        return parse(value)
+    elif value_type == "date":
+        return parse(value).date()
+    elif value_type == "decimal":
+        return decimal.Decimal(value)
+    return value
+
+
+def _is_missing(value):
+    return (
+        value is None
+        or value is pd.NaT
+        or (isinstance(value, float) and math.isnan(value))
+    )
+
+
+for _expectation_type in PartitionAggregatesDataset._partition_column_map_expectations:
+    setattr(
+        PartitionAggregatesDataset,
+        _expectation_type,
+        PartitionAggregatesDataset.column_map_expectation(
+            getattr(Dataset, _expectation_type)
+        ),
+    )
@@ -18,6 +18,7 @@ from great_expectations.data_asset.util import DocInherit, parse_result_format
 
 from .dataset import Dataset
 from .pandas_dataset import PandasDataset
+from .util import parse_datetime_series
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +27,9 @@ try:
     from pyspark.ml.feature import Bucketizer
     from pyspark.sql import SQLContext, Window
     from pyspark.sql.functions import (
+        approx_count_distinct,
         array,
+        broadcast,
         col,
         count,
         countDistinct,
@@ -37,15 +40,18 @@ try:
         lag,
     )
     from pyspark.sql.functions import length as length_
+    from pyspark.sql.functions import lit
+    from pyspark.sql.functions import max as max_
+    from pyspark.sql.functions import mean
+    from pyspark.sql.functions import min as min_
     from pyspark.sql.functions import (
-        lit,
         monotonically_increasing_id,
+        pandas_udf,
         stddev_samp,
         struct,
-        udf,
-        when,
-        year,
     )
+    from pyspark.sql.functions import sum as sum_
+    from pyspark.sql.functions import udf, when, year
 except ImportError as e:
     logger.debug(str(e))
     logger.debug(
@@ -53,6 +59,11 @@ except ImportError as e:
     )
 
 
+def _parse_datetime_batch(values):
+    # Spark expects a Series of datetime64 values from a TimestampType pandas udf
+    return pd.to_datetime(parse_datetime_series(values))
+
+
 class MetaSparkDFDataset(Dataset):
     """MetaSparkDFDataset is a thin layer between Dataset and SparkDFDataset.
     This two-layer inheritance is required to make @classmethod decorators work.
@@ -61,6 +72,18 @@ class MetaSparkDFDataset(Dataset):
     and SparkDFDataset implements the expectation methods themselves.
     """
 
+    # Column map expectations that evaluate a python udf on each value, and whose result for a row depends only on
+    # the value in that row
+    _distinct_value_map_expectations = [
+        "expect_column_values_to_match_strftime_format",
+        "expect_column_values_to_be_json_parseable",
+        "expect_column_values_to_match_json_schema",
+    ]
+
+    # Evaluate distinct value expectations once per distinct value when a column has at most this many distinct
+    # values per row
+    distinct_value_ratio_threshold = 0.1
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -120,14 +143,39 @@ class MetaSparkDFDataset(Dataset):
             ]:
                 col_df = col_df.filter(col_df[0].isNotNull())
                 # these nonnull_counts are cached by SparkDFDataset
-                nonnull_count = self.get_column_nonnull_count(eval_col)
+                nonnull_count = self.get_column_nonnull_count(column)
             else:
                 nonnull_count = element_count
 
+            use_distinct_values = (
+                func.__name__ in cls._distinct_value_map_expectations
+                and nonnull_count > 0
+                # map columns cannot be grouped
+                and not isinstance(col_df.schema[0].dataType, sparktypes.MapType)
+                and self._get_column_approx_unique_count(column)
+                <= self.distinct_value_ratio_threshold * nonnull_count
+            )
+            if use_distinct_values:
+                # The expectation depends only on each value, so evaluate it once per distinct value, weighting each
+                # result by the number of rows holding that value
+                values_df = col_df.groupBy(col_df[0]).agg(
+                    count(lit(1)).alias("__count")
+                )
+            else:
+                values_df = col_df
+
             # success_df will have columns [column, '__success']
             # this feels a little hacky, so might want to change
-            success_df = func(self, col_df, *args, **kwargs)
-            success_count = success_df.filter("__success = True").count()
+            success_df = func(self, values_df, *args, **kwargs)
+            if use_distinct_values:
+                success_count = (
+                    success_df.filter("__success = True")
+                    .select(sum_("__count"))
+                    .collect()[0][0]
+                    or 0
+                )
+            else:
+                success_count = success_df.filter("__success = True").count()
 
             unexpected_count = nonnull_count - success_count
 
@@ -140,9 +188,16 @@ class MetaSparkDFDataset(Dataset):
                 unexpected_df = success_df.filter("__success = False")
                 if unexpected_count_limit:
                     unexpected_df = unexpected_df.limit(unexpected_count_limit)
-                maybe_limited_unexpected_list = [
-                    row[eval_col] for row in unexpected_df.collect()
-                ]
+                if use_distinct_values:
+                    maybe_limited_unexpected_list = [
+                        row[eval_col]
+                        for row in unexpected_df.collect()
+                        for _ in range(row["__count"])
+                    ][:unexpected_count_limit]
+                else:
+                    maybe_limited_unexpected_list = [
+                        row[eval_col] for row in unexpected_df.collect()
+                    ]
 
                 if "output_strftime_format" in kwargs:
                     output_strftime_format = kwargs["output_strftime_format"]
@@ -597,9 +652,25 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         else:
             raise ValueError("from_dataset requires a SparkDFDataset dataset")
 
+    # Column aggregates that _prefetch_expectation_metrics evaluates in a single job for each expectation type, in
+    # addition to the nonnull count of every column and the approximate distinct count used by the column map
+    # decorator for _distinct_value_map_expectations
+    _batched_aggregate_expectations = {
+        "expect_column_mean_to_be_between": ["mean"],
+        "expect_column_sum_to_be_between": ["sum"],
+        "expect_column_stdev_to_be_between": ["stdev"],
+        "expect_column_min_to_be_between": ["min"],
+        "expect_column_max_to_be_between": ["max"],
+        "expect_column_unique_value_count_to_be_between": ["unique_count"],
+        "expect_column_proportion_of_unique_values_to_be_between": ["unique_count"],
+        "expect_column_quantile_values_to_be_between": ["quantiles"],
+    }
+
     def __init__(self, spark_df, *args, **kwargs):
         # Creation of the Spark DataFrame is done outside this class
         self.spark_df = spark_df
+        # Aggregates computed by _prefetch_expectation_metrics, keyed by (metric, column, *arguments)
+        self._batched_aggregates = {}
         self._persist = kwargs.pop("persist", True)
         if self._persist:
             self.spark_df.persist()
@@ -617,7 +688,120 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             ),
         )
 
+    def _prefetch_expectation_metrics(self, expectations):
+        """Evaluate the column aggregates used by expectations in a single Spark job, instead of one job per getter
+        call. Prefetched values are kept for the lifetime of the dataset, like cached getters, so nothing is
+        prefetched when caching is disabled."""
+        if not self.caching:
+            return
+
+        types = dict(self.spark_df.dtypes)
+        aggregates = OrderedDict()
+        aggregates[("row_count",)] = count(lit(1))
+        for expectation in expectations:
+            column = expectation.kwargs.get("column")
+            if (
+                not isinstance(column, str)
+                or column not in types
+                or types[column].startswith("map<")
+            ):
+                continue
+            metrics = ["nonnull_count"] + self._batched_aggregate_expectations.get(
+                expectation.expectation_type, []
+            )
+            if expectation.expectation_type in self._distinct_value_map_expectations:
+                metrics.append("approx_unique_count")
+            for metric in metrics:
+                aggregate = self._get_batched_aggregate(
+                    metric, column, types[column], expectation.kwargs
+                )
+                if aggregate is not None:
+                    key, aggregate_column = aggregate
+                    aggregates[key] = aggregate_column
+
+        aggregates = OrderedDict(
+            (key, aggregate_column)
+            for key, aggregate_column in aggregates.items()
+            if key not in self._batched_aggregates
+        )
+        if not aggregates:
+            return
+        try:
+            row = self.spark_df.agg(
+                *[
+                    aggregate_column.alias("__aggregate_%d" % idx)
+                    for idx, aggregate_column in enumerate(aggregates.values())
+                ]
+            ).collect()[0]
+        except Exception as e:
+            # Each getter still computes its own aggregate
+            logger.debug("Unable to prefetch column aggregates: %s" % str(e))
+            return
+
+        for key, value in zip(aggregates.keys(), row):
+            if key[0] == "quantiles":
+                if value is None:
+                    continue
+                # approxQuantile returns doubles
+                value = [float(quantile) for quantile in value]
+            self._batched_aggregates[key] = value
+
+    @staticmethod
+    def _get_batched_aggregate(metric, column, column_type, kwargs):
+        """Return the cache key and aggregate Column computing metric for column, or None if the getter for the
+        metric must compute it itself."""
+        is_numeric = column_type in ("int", "float", "double", "bigint")
+        if metric == "nonnull_count":
+            return (metric, column), count(col(column))
+        elif metric == "approx_unique_count":
+            return (metric, column), approx_count_distinct(col(column))
+        elif metric == "unique_count":
+            return (metric, column), countDistinct(col(column))
+        elif metric in ["min", "max"]:
+            if kwargs.get("parse_strings_as_datetimes"):
+                return None
+            aggregate_function = min_ if metric == "min" else max_
+            return (metric, column), aggregate_function(col(column))
+        elif not is_numeric:
+            # let the getter raise its usual error for non-numeric columns
+            return None
+        elif metric == "mean":
+            return (metric, column), mean(col(column))
+        elif metric == "sum":
+            return (metric, column), sum_(col(column))
+        elif metric == "stdev":
+            return (metric, column), stddev_samp(col(column))
+        elif metric == "quantiles":
+            quantile_ranges = kwargs.get("quantile_ranges")
+            allow_relative_error = kwargs.get("allow_relative_error", False)
+            # exact quantiles cannot be computed by percentile_approx
+            if (
+                not isinstance(quantile_ranges, dict)
+                or not isinstance(quantile_ranges.get("quantiles"), list)
+                or not isinstance(allow_relative_error, float)
+                or not 0 < allow_relative_error <= 1
+            ):
+                return None
+            quantiles = tuple(quantile_ranges["quantiles"])
+            if not all(isinstance(quantile, (int, float)) for quantile in quantiles):
+                return None
+            accuracy = max(int(round(1 / allow_relative_error)), 1)
+            return (
+                (metric, column, quantiles, allow_relative_error),
+                expr(
+                    "percentile_approx(`%s`, array(%s), %d)"
+                    % (
+                        column.replace("`", "``"),
+                        ", ".join(repr(float(quantile)) for quantile in quantiles),
+                        accuracy,
+                    )
+                ),
+            )
+        return None
+
     def get_row_count(self):
+        if ("row_count",) in self._batched_aggregates:
+            return self._batched_aggregates[("row_count",)]
         return self.spark_df.count()
 
     def get_column_count(self):
@@ -627,34 +811,36 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         return self.spark_df.columns
 
     def get_column_nonnull_count(self, column):
+        if ("nonnull_count", column) in self._batched_aggregates:
+            return self._batched_aggregates[("nonnull_count", column)]
         return self.spark_df.filter(col(column).isNotNull()).count()
 
+    def _get_column_approx_unique_count(self, column):
+        if ("approx_unique_count", column) in self._batched_aggregates:
+            return self._batched_aggregates[("approx_unique_count", column)]
+        return self.spark_df.agg(approx_count_distinct(col(column))).collect()[0][0]
+
     def get_column_mean(self, column):
         # TODO need to apply this logic to other such methods?
         types = dict(self.spark_df.dtypes)
         if types[column] not in ("int", "float", "double", "bigint"):
             raise TypeError("Expected numeric column type for function mean()")
+        if ("mean", column) in self._batched_aggregates:
+            return self._batched_aggregates[("mean", column)]
         result = self.spark_df.select(column).groupBy().mean().collect()[0]
         return result[0] if len(result) > 0 else None
 
     def get_column_sum(self, column):
+        if ("sum", column) in self._batched_aggregates:
+            return self._batched_aggregates[("sum", column)]
         return self.spark_df.select(column).groupBy().sum().collect()[0][0]
 
-    # TODO: consider getting all basic statistics in one go:
-    def _describe_column(self, column):
-        # temp_column = self.spark_df.select(column).where(col(column).isNotNull())
-        # return self.spark_df.select(
-        #     [
-        #         count(temp_column),
-        #         mean(temp_column),
-        #         stddev(temp_column),
-        #         min(temp_column),
-        #         max(temp_column)
-        #     ]
-        # )
-        pass
-
     def get_column_max(self, column, parse_strings_as_datetimes=False):
+        if (
+            not parse_strings_as_datetimes
+            and ("max", column) in self._batched_aggregates
+        ):
+            return self._batched_aggregates[("max", column)]
         temp_column = self.spark_df.select(column).where(col(column).isNotNull())
         if parse_strings_as_datetimes:
             temp_column = self._apply_dateutil_parse(temp_column)
@@ -664,6 +850,11 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         return result[0][0]
 
     def get_column_min(self, column, parse_strings_as_datetimes=False):
+        if (
+            not parse_strings_as_datetimes
+            and ("min", column) in self._batched_aggregates
+        ):
+            return self._batched_aggregates[("min", column)]
         temp_column = self.spark_df.select(column).where(col(column).isNotNull())
         if parse_strings_as_datetimes:
             temp_column = self._apply_dateutil_parse(temp_column)
@@ -696,6 +887,8 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         return series
 
     def get_column_unique_count(self, column):
+        if ("unique_count", column) in self._batched_aggregates:
+            return self._batched_aggregates[("unique_count", column)]
         return self.spark_df.agg(countDistinct(column)).collect()[0][0]
 
     def get_column_modes(self, column):
@@ -728,11 +921,16 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             raise ValueError(
                 "SparkDFDataset requires relative error to be False or to be a float between 0 and 1."
             )
+        key = ("quantiles", column, tuple(quantiles), allow_relative_error)
+        if key in self._batched_aggregates:
+            return self._batched_aggregates[key]
         return self.spark_df.approxQuantile(
             column, list(quantiles), allow_relative_error
         )
 
     def get_column_stdev(self, column):
+        if ("stdev", column) in self._batched_aggregates:
+            return self._batched_aggregates[("stdev", column)]
         return self.spark_df.select(stddev_samp(col(column))).collect()[0][0]
 
     def get_column_hist(self, column, bins):
@@ -819,13 +1017,31 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         return result.count()
 
     # Utils
+    @staticmethod
+    def _get_dateutil_parse_udf():
+        try:
+            # Parse each batch of values with the vectorized parser shared with PandasDataset
+            return pandas_udf(_parse_datetime_batch, sparktypes.TimestampType())
+        except ImportError:
+            # pandas udfs require pyarrow
+            return udf(parse, sparktypes.TimestampType())
+
     @staticmethod
     def _apply_dateutil_parse(column):
         assert len(column.columns) == 1, "Expected DataFrame with 1 column"
         col_name = column.columns[0]
-        _udf = udf(parse, sparktypes.TimestampType())
+        _udf = SparkDFDataset._get_dateutil_parse_udf()
         return column.withColumn(col_name, _udf(col_name))
 
+    @staticmethod
+    def _get_vectorized_udf(func, return_type):
+        """Return a udf applying func to each value, evaluated over Arrow batches by a pandas udf when pyarrow is
+        available instead of serializing each row to a Python worker."""
+        try:
+            return pandas_udf(lambda values: values.map(func), return_type)
+        except ImportError:
+            return udf(func, return_type)
+
     # Expectations
     @DocInherit
     @MetaSparkDFDataset.column_map_expectation
@@ -1055,18 +1271,23 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         except ValueError as e:
             raise ValueError("Unable to use provided strftime_format. " + e.message)
 
+        if not isinstance(column.schema[0].dataType, sparktypes.StringType):
+            raise TypeError(
+                "Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
+            )
+
         def is_parseable_by_format(val):
             try:
                 datetime.strptime(val, strftime_format)
                 return True
-            except TypeError:
-                raise TypeError(
-                    "Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
-                )
             except ValueError:
                 return False
 
-        success_udf = udf(is_parseable_by_format)
+        # Spark datetime patterns do not reproduce strptime semantics (e.g. single digit fields or locale names),
+        # so the format is checked in Python, one Arrow batch at a time
+        success_udf = self._get_vectorized_udf(
+            is_parseable_by_format, sparktypes.BooleanType()
+        )
         return column.withColumn("__success", success_udf(column[0]))
 
     @DocInherit
@@ -1121,7 +1342,16 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             except:
                 raise
 
-        matches_json_schema_udf = udf(matches_json_schema, sparktypes.StringType())
+        if not isinstance(
+            column.schema[0].dataType, (sparktypes.StringType, sparktypes.BinaryType)
+        ):
+            raise TypeError(
+                "Values passed to expect_column_values_to_match_json_schema must be of type string or binary"
+            )
+
+        matches_json_schema_udf = self._get_vectorized_udf(
+            matches_json_schema, sparktypes.BooleanType()
+        )
 
         return column.withColumn("__success", matches_json_schema_udf(column[0]))
 
@@ -1143,7 +1373,13 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             except:
                 return False
 
-        is_json_udf = udf(is_json, sparktypes.StringType())
+        if not isinstance(
+            column.schema[0].dataType, (sparktypes.StringType, sparktypes.BinaryType)
+        ):
+            # Only strings and bytes can be parsed as json
+            return column.withColumn("__success", lit(False))
+
+        is_json_udf = self._get_vectorized_udf(is_json, sparktypes.BooleanType())
 
         return column.withColumn("__success", is_json_udf(column[0]))
 
@@ -1330,7 +1566,7 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         column_B_name = column_B.schema.names[1]
 
         if parse_strings_as_datetimes:
-            _udf = udf(parse, sparktypes.TimestampType())
+            _udf = self._get_dateutil_parse_udf()
             # Create new columns for comparison without replacing original values.
             (timestamp_column_A, timestamp_column_B) = (
                 "__ts_{}".format(column_A_name),
@@ -1384,14 +1620,19 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             "combine_AB", array(col(column_A_name), col(column_B_name))
         )
 
+        # The set of pairs is small: broadcast it to avoid shuffling the data, and deduplicate it so that the left
+        # join matches each row at most once
         value_set_df = (
             SQLContext(self.spark_df._sc)
             .createDataFrame(value_pairs_set, ["col_A", "col_B"])
             .select(array("col_A", "col_B").alias("set_AB"))
+            .distinct()
         )
 
         return join_df.join(
-            value_set_df, join_df["combine_AB"] == value_set_df["set_AB"], "left"
+            broadcast(value_set_df),
+            join_df["combine_AB"] == value_set_df["set_AB"],
+            "left",
         ).withColumn(
             "__success", when(col("set_AB").isNull(), lit(False)).otherwise(lit(True))
         )
@@ -1440,10 +1681,11 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         column_names = column_list.schema.names[:]
         conditions = []
         for i in range(0, len(column_names) - 1):
-            # Negate the `eqNullSafe` result and append to the conditions.
-            conditions.append(
-                ~(col(column_names[i]).eqNullSafe(col(column_names[i + 1])))
-            )
+            for j in range(i + 1, len(column_names)):
+                # Negate the `eqNullSafe` result and append to the conditions.
+                conditions.append(
+                    ~(col(column_names[i]).eqNullSafe(col(column_names[j])))
+                )
 
         return column_list.withColumn(
             "__success", reduce(lambda a, b: a & b, conditions)
@@ -1,10 +1,16 @@
+import hashlib
 import inspect
 import logging
+import threading
+import time
 import traceback
 import uuid
 import warnings
+import weakref
 from datetime import datetime
-from functools import wraps
+from fractions import Fraction
+from functools import reduce, wraps
+from math import gcd
 from typing import Dict, Iterable, List
 
 import numpy as np
@@ -17,6 +23,7 @@ from great_expectations.dataset.util import (
     check_sql_engine_dialect,
     get_approximate_percentile_disc_sql,
     get_sql_dialect_floating_point_infinity_value,
+    get_uniform_bin_width,
 )
 from great_expectations.util import import_library_module
 
@@ -28,7 +35,7 @@ logger = logging.getLogger(__name__)
 
 try:
     import sqlalchemy as sa
-    from sqlalchemy.dialects import registry
+    from sqlalchemy.dialects import postgresql, registry
     from sqlalchemy.engine import reflection
     from sqlalchemy.engine.default import DefaultDialect
     from sqlalchemy.engine.result import RowProxy
@@ -42,6 +49,7 @@ except ImportError:
         "Unable to load SqlAlchemy context; install optional sqlalchemy dependency for support"
     )
     sa = None
+    postgresql = None
     registry = None
     reflection = None
     BinaryExpression = None
@@ -119,8 +127,178 @@ except ImportError:
     pyathena = None
 
 
+def _drop_table(engine, table_name, schema=None):
+    dialect_name = engine.dialect.name.lower()
+    if schema is not None and dialect_name not in ["bigquery", "mssql"]:
+        table_name = schema + "." + table_name
+    if dialect_name == "bigquery":
+        stmt = "DROP TABLE IF EXISTS `{table_name}`".format(table_name=table_name)
+    elif dialect_name == "mssql":
+        stmt = "DROP TABLE {table_name}".format(table_name=table_name)
+    elif dialect_name in ["snowflake", "mysql", "awsathena"]:
+        stmt = "DROP TABLE IF EXISTS {table_name}".format(table_name=table_name)
+    else:
+        stmt = 'DROP TABLE IF EXISTS "{table_name}"'.format(table_name=table_name)
+    try:
+        engine.execute(stmt)
+    except Exception as e:
+        logger.warning(
+            "Unable to drop materialized table {table_name}: {error}".format(
+                table_name=table_name, error=str(e)
+            )
+        )
+
+
+class SqlAlchemyMaterializationCache:
+    """Tracks the tables materialized from custom_sql queries so that several datasets can reuse them.
+
+    Entries are keyed by a hash of the normalized query text (with any query_parameters already substituted), the
+    schema, and the requested table name, if any. Each entry remembers the engine or connection on which the table was
+    created, since temporary tables in many dialects are only visible within that connection. Entries older than ttl
+    seconds are no longer reused, and invalidated entries have their table dropped so that tables on warehouses without
+    session-scoped temporary tables have a bounded lifetime.
+
+    Datasets acquire the entry of the table they query and release it when they are garbage collected; the table of an
+    expired or invalidated entry is only dropped once no dataset uses it anymore.
+    """
+
+    def __init__(self, ttl=None):
+        self._ttl = ttl
+        self._entries = {}
+        self._lock = threading.RLock()
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    @staticmethod
+    def get_query_key(query, schema=None, table_name=None):
+        normalized_query = " ".join(query.split()).rstrip(";").strip()
+        key_string = "|".join([normalized_query, str(schema), str(table_name)])
+        return hashlib.md5(key_string.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return the entry for key, or None if it is not cached or has expired."""
+        with self._lock:
+            self._purge_expired()
+            entry = self._entries.get(key)
+            if entry is not None and getattr(entry["engine"], "closed", False):
+                # The connection holding a connection-scoped temporary table is gone, and the table with it
+                del self._entries[key]
+                entry = None
+            return entry
+
+    def acquire(self, key):
+        """Return the entry for key like get, counting one more user of its table until release is called."""
+        with self._lock:
+            entry = self.get(key)
+            if entry is not None:
+                entry["users"] += 1
+            return entry
+
+    def add(self, key, table_name, engine, schema=None):
+        """Cache the table materialized for key, and return its entry, counting the caller as its first user."""
+        with self._lock:
+            self._purge_expired()
+            entry = {
+                "table_name": table_name,
+                "schema": schema,
+                "engine": engine,
+                "created_at": time.time(),
+                "users": 1,
+                "retired": False,
+            }
+            self._entries[key] = entry
+            return entry
+
+    def release(self, entry):
+        """Count one less user of the table of entry, dropping it if its entry was retired and it is now unused."""
+        with self._lock:
+            entry["users"] -= 1
+            if entry["users"] <= 0 and entry["retired"]:
+                self._drop_table(entry)
+
+    def invalidate(self, key=None):
+        """Forget the entry for key (or every entry if key is None), dropping the tables it materialized once they
+        are unused."""
+        with self._lock:
+            keys = list(self._entries.keys()) if key is None else [key]
+            for key_to_invalidate in keys:
+                entry = self._entries.pop(key_to_invalidate, None)
+                if entry is not None:
+                    self._retire(entry)
+
+    def _purge_expired(self):
+        if self._ttl is None:
+            return
+        now = time.time()
+        for key, entry in list(self._entries.items()):
+            if now - entry["created_at"] > self._ttl:
+                self.invalidate(key)
+
+    def _retire(self, entry):
+        entry["retired"] = True
+        if entry["users"] <= 0:
+            self._drop_table(entry)
+
+    @staticmethod
+    def _drop_table(entry):
+        _drop_table(entry["engine"], entry["table_name"], schema=entry["schema"])
+
+
+class SqlAlchemyReflectionCache:
+    """Caches the reflected columns of tables so that datasets over the same table skip reflection.
+
+    Entries are keyed by schema and table name and are reflected again once they are older than ttl seconds, so that
+    schema changes are eventually picked up. Tables generated for custom_sql queries are never cached.
+    """
+
+    def __init__(self, ttl=None):
+        self._ttl = ttl
+        self._entries = {}
+        self._lock = threading.RLock()
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    def get(self, table_name, schema=None):
+        """Return the cached columns for table_name, or None if they are not cached or have expired."""
+        with self._lock:
+            entry = self._entries.get((schema, table_name))
+            if entry is None:
+                return None
+            if self._ttl is not None and time.time() - entry["created_at"] > self._ttl:
+                del self._entries[(schema, table_name)]
+                return None
+            return entry["columns"]
+
+    def add(self, table_name, columns, schema=None):
+        with self._lock:
+            self._entries[(schema, table_name)] = {
+                "columns": columns,
+                "created_at": time.time(),
+            }
+
+    def invalidate(self, table_name=None, schema=None):
+        """Forget the columns of table_name (or of every table if table_name is None)."""
+        with self._lock:
+            if table_name is None:
+                self._entries = {}
+            else:
+                self._entries.pop((schema, table_name), None)
+
+
 class SqlAlchemyBatchReference:
-    def __init__(self, engine, table_name=None, schema=None, query=None):
+    def __init__(
+        self,
+        engine,
+        table_name=None,
+        schema=None,
+        query=None,
+        materialization_cache=None,
+        reflection_cache=None,
+    ):
         self._engine = engine
         if table_name is None and query is None:
             raise ValueError("Table_name or query must be specified")
@@ -128,6 +306,17 @@ class SqlAlchemyBatchReference:
         self._table_name = table_name
         self._schema = schema
         self._query = query
+        self._materialization_cache = materialization_cache
+        self._reflection_cache = reflection_cache
+
+    @property
+    def query_key(self):
+        """Identity of the materialized query, or None for table-based batches."""
+        if self._query is None:
+            return None
+        return SqlAlchemyMaterializationCache.get_query_key(
+            self._query, schema=self._schema, table_name=self._table_name
+        )
 
     def get_init_kwargs(self):
         if self._table_name and self._query:
@@ -144,6 +333,10 @@ class SqlAlchemyBatchReference:
             kwargs = {"engine": self._engine, "custom_sql": self._query}
         if self._schema:
             kwargs["schema"] = self._schema
+        if self._query and self._materialization_cache is not None:
+            kwargs["materialization_cache"] = self._materialization_cache
+        if self._reflection_cache is not None:
+            kwargs["reflection_cache"] = self._reflection_cache
 
         return kwargs
 
@@ -451,18 +644,35 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         connection_string=None,
         custom_sql=None,
         schema=None,
+        materialization_cache=None,
+        reflection_cache=None,
         *args,
         **kwargs,
     ):
+        self._materialization_cache = materialization_cache
+        self._reflection_cache = reflection_cache
+        # Set for custom_sql datasets holding a connection-scoped table of their own, which validate releases
+        self._temporary_table_source = None
+        self._connection_released = False
+        materialization_key = None
+        materialization_entry = None
+        if custom_sql and materialization_cache is not None:
+            materialization_key = materialization_cache.get_query_key(
+                custom_sql, schema=schema, table_name=table_name
+            )
+            materialization_entry = materialization_cache.acquire(materialization_key)
 
         if custom_sql and not table_name:
             # NOTE: Eugene 2020-01-31: @James, this is a not a proper fix, but without it the "public" schema
             # was used for a temp table and raising an error
             schema = None
-            table_name = f"ge_tmp_{str(uuid.uuid4())[:8]}"
-            # mssql expects all temporary table names to have a prefix '#'
-            if engine.dialect.name.lower() == "mssql":
-                table_name = f"#{table_name}"
+            if materialization_entry is not None:
+                table_name = materialization_entry["table_name"]
+            else:
+                table_name = f"ge_tmp_{str(uuid.uuid4())[:8]}"
+                # mssql expects all temporary table names to have a prefix '#'
+                if engine.dialect.name.lower() == "mssql":
+                    table_name = f"#{table_name}"
             self.generated_table_name = table_name
         else:
             self.generated_table_name = None
@@ -522,9 +732,28 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         else:
             self.dialect = None
 
-        if engine and engine.dialect.name.lower() in ["sqlite", "mssql", "snowflake"]:
-            # sqlite/mssql/snowflake temp tables only persist within a connection so override the engine
+        if materialization_entry is not None:
+            # Reuse the engine or connection on which the cached table was materialized
+            self.engine = materialization_entry["engine"]
+        elif (
+            custom_sql
+            and engine
+            and engine.dialect.name.lower() in ["sqlite", "mssql", "snowflake"]
+        ):
+            # sqlite/mssql/snowflake temp tables only persist within a connection so override the engine.
+            # Datasets over existing tables use the engine directly, so that each query checks a connection out
+            # of the engine's pool only while it runs.
             self.engine = engine.connect()
+            dialect_name = engine.dialect.name.lower()
+            # Only connection-scoped tables are released after validation: a snowflake table named by the caller is
+            # created as TRANSIENT, and an mssql one without the '#' prefix as a regular table, so both must persist
+            if materialization_cache is None and (
+                self.generated_table_name is not None
+                or dialect_name == "sqlite"
+                or dialect_name == "mssql"
+                and table_name.startswith("#")
+            ):
+                self._temporary_table_source = (engine, table_name, custom_sql, schema)
 
         if schema is not None and custom_sql is not None:
             # temporary table will be written to temp schema, so don't allow
@@ -545,8 +774,21 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                     "default dataset in engine url"
                 )
 
-        if custom_sql:
+        if materialization_entry is not None:
+            logger.debug(
+                "Reusing table {table_name} materialized for an identical query".format(
+                    table_name=table_name
+                )
+            )
+        elif custom_sql:
             self.create_temporary_table(table_name, custom_sql, schema_name=schema)
+            if materialization_cache is not None:
+                materialization_entry = materialization_cache.add(
+                    materialization_key,
+                    table_name=table_name,
+                    engine=self.engine,
+                    schema=schema,
+                )
 
             if self.generated_table_name is not None:
                 if self.engine.dialect.name.lower() == "bigquery":
@@ -562,21 +804,69 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                         )
                     )
 
-        try:
-            insp = reflection.Inspector.from_engine(self.engine)
-            self.columns = insp.get_columns(table_name, schema=schema)
-        except KeyError:
-            # we will get a KeyError for temporary tables, since
-            # reflection will not find the temporary schema
-            self.columns = self.column_reflection_fallback()
+        if materialization_entry is not None:
+            # The table is kept until this dataset is garbage collected, even if its cache entry expires before
+            weakref.finalize(self, materialization_cache.release, materialization_entry)
+
+        use_reflection_cache = reflection_cache is not None and custom_sql is None
+        self.columns = (
+            reflection_cache.get(table_name, schema=schema)
+            if use_reflection_cache
+            else None
+        )
+        if self.columns is None:
+            try:
+                insp = reflection.Inspector.from_engine(self.engine)
+                self.columns = insp.get_columns(table_name, schema=schema)
+            except KeyError:
+                # we will get a KeyError for temporary tables, since
+                # reflection will not find the temporary schema
+                self.columns = self.column_reflection_fallback()
 
-        # Use fallback because for mssql reflection doesn't throw an error but returns an empty list
-        if len(self.columns) == 0:
-            self.columns = self.column_reflection_fallback()
+            # Use fallback because for mssql reflection doesn't throw an error but returns an empty list
+            if len(self.columns) == 0:
+                self.columns = self.column_reflection_fallback()
+
+            if use_reflection_cache:
+                reflection_cache.add(table_name, self.columns, schema=schema)
 
         # Only call super once connection is established and table_name and columns known to allow autoinspection
         super().__init__(*args, **kwargs)
 
+    @property
+    def engine(self):
+        if self._connection_released:
+            # Check a connection out again, and re-create the temporary table that was dropped with the previous one
+            self._connection_released = False
+            engine, table_name, custom_sql, schema = self._temporary_table_source
+            self._engine = engine.connect()
+            self.create_temporary_table(table_name, custom_sql, schema_name=schema)
+        return self._engine
+
+    @engine.setter
+    def engine(self, engine):
+        self._engine = engine
+
+    def release_connection(self):
+        """Return the connection holding the temporary table of a custom_sql dataset to the pool of its engine.
+
+        The temporary table is dropped with it; both are created again if the dataset is used afterwards. Datasets
+        whose table is shared through a materialization cache, or persists beyond the connection, keep their
+        connection.
+        """
+        if self._temporary_table_source is None or self._connection_released:
+            return
+        _drop_table(self._engine, self._table.name, schema=self._table.schema)
+        self._engine.close()
+        self._connection_released = True
+
+    def validate(self, *args, **kwargs):
+        # The connection is only checked out while the dataset is being validated
+        try:
+            return super().validate(*args, **kwargs)
+        finally:
+            self.release_connection()
+
     @property
     def sql_engine_dialect(self) -> DefaultDialect:
         return self.engine.dialect
@@ -753,8 +1043,30 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         ).scalar()
 
     def get_column_median(self, column):
+        dialect_name = self.sql_engine_dialect.name.lower()
+        if dialect_name in ["postgresql", "redshift", "snowflake"]:
+            # The continuous median averages the two center values, matching the offset-based computation below,
+            # in a single aggregate query.
+            return self.engine.execute(
+                sa.select(
+                    [sa.func.percentile_cont(0.5).within_group(sa.column(column).asc())]
+                ).select_from(self._table)
+            ).scalar()
+        elif dialect_name == "mssql":
+            # mssql requires over(); every row carries the same value, so only fetch one
+            return self.engine.execute(
+                sa.select(
+                    [
+                        sa.func.percentile_cont(0.5)
+                        .within_group(sa.column(column).asc())
+                        .over()
+                    ]
+                )
+                .select_from(self._table)
+                .limit(1)
+            ).scalar()
         # AWS Athena does not support offset
-        if self.sql_engine_dialect.name.lower() == "awsathena":
+        if dialect_name == "awsathena":
             raise NotImplementedError("AWS Athena does not support OFFSET.")
         nonnull_count = self.get_column_nonnull_count(column)
         element_values = self.engine.execute(
@@ -787,14 +1099,38 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def get_column_quantiles(
         self, column: str, quantiles: Iterable, allow_relative_error: bool = False
     ) -> list:
-        if self.sql_engine_dialect.name.lower() == "mssql":
+        dialect_name = self.sql_engine_dialect.name.lower()
+        if dialect_name == "mssql":
             return self._get_column_quantiles_mssql(column=column, quantiles=quantiles)
-        elif self.sql_engine_dialect.name.lower() == "bigquery":
+        elif dialect_name == "bigquery":
+            if allow_relative_error:
+                return self._get_column_quantiles_bigquery_approx(
+                    column=column, quantiles=quantiles
+                )
             return self._get_column_quantiles_bigquery(
                 column=column, quantiles=quantiles
             )
-        elif self.sql_engine_dialect.name.lower() == "mysql":
+        elif dialect_name == "mysql":
             return self._get_column_quantiles_mysql(column=column, quantiles=quantiles)
+        elif dialect_name in ["awsathena", "trino", "presto"]:
+            return self._get_column_quantiles_approx_percentile(
+                column=column,
+                quantiles=quantiles,
+                allow_relative_error=allow_relative_error,
+            )
+        elif dialect_name == "postgresql":
+            try:
+                return self._get_column_quantiles_postgresql(
+                    column=column, quantiles=quantiles
+                )
+            except ProgrammingError:
+                # Redshift, when connected through the postgresql driver, does not support percentile_disc; the
+                # generic method handles falling back to approximate quantiles.
+                return self._get_column_quantiles_generic_sqlalchemy(
+                    column=column,
+                    quantiles=quantiles,
+                    allow_relative_error=allow_relative_error,
+                )
         else:
             return self._get_column_quantiles_generic_sqlalchemy(
                 column=column,
@@ -830,7 +1166,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             sa.func.percentile_disc(sa.column(column), quantile).over()
             for quantile in quantiles
         ]
-        quantiles_query: Select = sa.select(selects).select_from(self._table)
+        # Every row carries the same window values, so only fetch one
+        quantiles_query: Select = sa.select(selects).select_from(self._table).limit(1)
 
         try:
             quantiles_results: RowProxy = self.engine.execute(
@@ -844,6 +1181,84 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             logger.error(exception_message)
             raise pe
 
+    def _get_column_quantiles_bigquery_approx(
+        self, column: str, quantiles: Iterable
+    ) -> list:
+        # APPROX_QUANTILES returns num_buckets + 1 boundaries in one pass; choose the number of buckets so that the
+        # requested quantiles fall on boundaries whenever possible.
+        quantiles = [float(quantile) for quantile in quantiles]
+        denominators = [
+            Fraction(quantile).limit_denominator(1000).denominator
+            for quantile in quantiles
+        ]
+        num_buckets = reduce(lambda a, b: a * b // gcd(a, b), denominators, 1)
+        if num_buckets > 1000:
+            num_buckets = 1000
+        quantiles_query: Select = sa.select(
+            [sa.func.approx_quantiles(sa.column(column), num_buckets)]
+        ).select_from(self._table)
+
+        try:
+            boundaries = self.engine.execute(quantiles_query).scalar()
+            return [
+                boundaries[int(round(quantile * num_buckets))] for quantile in quantiles
+            ]
+        except ProgrammingError as pe:
+            exception_message: str = "An SQL syntax Exception occurred."
+            exception_traceback: str = traceback.format_exc()
+            exception_message += f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
+            logger.error(exception_message)
+            raise pe
+
+    def _get_column_quantiles_approx_percentile(
+        self, column: str, quantiles: Iterable, allow_relative_error: bool
+    ) -> list:
+        # Athena, Trino and Presto only provide approximate percentiles, which accept an array of percentages and
+        # return all of them from a single aggregate.
+        if not allow_relative_error:
+            raise ValueError(
+                f'The SQL engine dialect "{str(self.sql_engine_dialect)}" does not support computing quantiles '
+                "without approximation error; set allow_relative_error to True to allow approximate quantiles."
+            )
+        quantiles_query: Select = sa.select(
+            [
+                sa.func.approx_percentile(
+                    sa.column(column),
+                    sa.text(
+                        "ARRAY[{}]".format(
+                            ", ".join(repr(float(quantile)) for quantile in quantiles)
+                        )
+                    ),
+                )
+            ]
+        ).select_from(self._table)
+
+        try:
+            return list(self.engine.execute(quantiles_query).scalar())
+        except ProgrammingError as pe:
+            exception_message: str = "An SQL syntax Exception occurred."
+            exception_traceback: str = traceback.format_exc()
+            exception_message += f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
+            logger.error(exception_message)
+            raise pe
+
+    def _get_column_quantiles_postgresql(
+        self, column: str, quantiles: Iterable
+    ) -> list:
+        # percentile_disc accepts an array of fractions, so all quantiles are computed from a single sort of the column
+        # instead of one sort per quantile.
+        quantiles_query: Select = sa.select(
+            [
+                sa.func.percentile_disc(
+                    sa.cast(
+                        postgresql.array([float(quantile) for quantile in quantiles]),
+                        postgresql.ARRAY(sa.Float),
+                    )
+                ).within_group(sa.column(column).asc())
+            ]
+        ).select_from(self._table)
+        return list(self.engine.execute(quantiles_query).scalar())
+
     def _get_column_quantiles_mysql(self, column: str, quantiles: Iterable) -> list:
         # MySQL does not support "percentile_disc", so we implement it as a compound query.
         # Please see https://stackoverflow.com/questions/19770026/calculate-percentile-value-using-mysql for reference.
@@ -969,9 +1384,23 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             column: the name of the column for which to get the histogram
             bins: tuple of bin edges for which to get histogram values; *must* be tuple to support caching
         """
+        bins = list(bins)
+        uniform_bin_width = get_uniform_bin_width(bins)
+        if uniform_bin_width is not None and self.sql_engine_dialect.name.lower() in [
+            "sqlite",
+            "postgresql",
+            "redshift",
+            "snowflake",
+            "mssql",
+        ]:
+            # These dialects evaluate the bin arithmetic in double precision; mysql, for example, would use
+            # fixed-precision decimal division for the literal bin edges.
+            return self._get_column_hist_uniform(
+                column=column, bins=bins, bin_width=uniform_bin_width
+            )
+
         case_conditions = []
         idx = 0
-        bins = list(bins)
 
         # If we have an infinte lower bound, don't express that in sql
         if (
@@ -1054,6 +1483,39 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         hist = convert_to_json_serializable(list(self.engine.execute(query).fetchone()))
         return hist
 
+    def _get_column_hist_uniform(self, column, bins, bin_width):
+        """Compute a histogram over evenly spaced bins by grouping on the computed bin index.
+
+        This evaluates one arithmetic expression per row rather than one CASE branch per bin.
+        """
+        n_bins = len(bins) - 1
+        low = float(bins[0])
+        offset = (sa.cast(sa.column(column), sa.Float) - low) / bin_width
+        if self.sql_engine_dialect.name.lower() == "sqlite":
+            # sqlite has no FLOOR; offsets are non-negative, so truncating to an integer is equivalent
+            bin_index = sa.cast(offset, sa.Integer)
+        else:
+            bin_index = sa.func.floor(offset)
+        bin_index = bin_index.label("bin_index")
+        query = (
+            sa.select([bin_index, sa.func.count().label("bin_count")])
+            .where(
+                sa.and_(
+                    sa.column(column) != None,
+                    sa.column(column) >= bins[0],
+                    sa.column(column) <= bins[-1],
+                )
+            )
+            .select_from(self._table)
+            .group_by(bin_index)
+        )
+
+        hist = [0] * n_bins
+        for bin_idx, bin_count in self.engine.execute(query).fetchall():
+            # Values equal to the upper edge belong to the last (closed) bin
+            hist[min(max(int(bin_idx), 0), n_bins - 1)] += int(bin_count)
+        return hist
+
     def get_column_count_in_range(
         self, column, min_val=None, max_val=None, strict_min=False, strict_max=True
     ):
@@ -1185,8 +1647,19 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         ###
 
         if self.sql_engine_dialect.name.lower() == "bigquery":
-            stmt = "CREATE OR REPLACE TABLE `{table_name}` AS {custom_sql}".format(
-                table_name=table_name, custom_sql=custom_sql
+            if (
+                self._materialization_cache is not None
+                and self._materialization_cache.ttl is not None
+            ):
+                # BigQuery tables are not session-scoped; let BigQuery expire the table even if it is never
+                # invalidated explicitly
+                options = " OPTIONS(expiration_timestamp=TIMESTAMP_ADD(CURRENT_TIMESTAMP(), INTERVAL {ttl} SECOND))".format(
+                    ttl=int(self._materialization_cache.ttl)
+                )
+            else:
+                options = ""
+            stmt = "CREATE OR REPLACE TABLE `{table_name}`{options} AS {custom_sql}".format(
+                table_name=table_name, options=options, custom_sql=custom_sql
             )
         elif self.sql_engine_dialect.name.lower() == "snowflake":
             table_type = "TEMPORARY" if self.generated_table_name else "TRANSIENT"
@@ -1348,7 +1821,7 @@ WHERE
             sa.column(col["name"]) for col in self.columns if col["name"] in column_list
         ]
         query = (
-            sa.select([sa.func.count()])
+            sa.select([sa.func.count().label("duplicate_count")])
             .group_by(*columns)
             .having(sa.func.count() > 1)
             .select_from(self._table)
@@ -1365,13 +1838,16 @@ WHERE
                 "ignore_row_if was set to an unexpected value: %s" % ignore_row_if
             )
 
-        unexpected_count = self.engine.execute(query).fetchone()
+        # Count every row belonging to a duplicated group, not just the rows of the first group.
+        # SUM returns a NUMERIC (Decimal) on some backends (e.g. postgresql, mysql), so cast it
+        duplicates = query.alias("duplicates")
+        unexpected_count = self.engine.execute(
+            sa.select([sa.cast(sa.func.sum(duplicates.c.duplicate_count), sa.Integer)])
+        ).scalar()
 
         if unexpected_count is None:
             # This can happen when the condition filters out all rows
             unexpected_count = 0
-        else:
-            unexpected_count = unexpected_count[0]
 
         total_count_query = sa.select([sa.func.count()]).select_from(self._table)
         total_count = self.engine.execute(total_count_query).fetchone()[0]
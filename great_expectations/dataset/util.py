@@ -1,11 +1,14 @@
 # Utility methods for dealing with Dataset objects
 
 import logging
+import math
+import re
 import warnings
 from typing import Any, Dict, List, Union
 
 import numpy as np
 import pandas as pd
+from dateutil.parser import parse
 from scipy import stats
 
 logger = logging.getLogger(__name__)
@@ -614,6 +617,97 @@ def get_approximate_percentile_disc_sql(selects: List, sql_engine_dialect: Any)
     )
 
 
+def get_uniform_bin_width(bins: List) -> Union[float, None]:
+    """Return the common width of evenly spaced, finite bin edges, or None if the edges cannot be bucketed arithmetically.
+
+    A value is assigned to bin FLOOR((value - bins[0]) / width). Since that computation is monotone in value, it places
+    every value in the same bin as explicit comparison against the edges as long as each interior edge (and the value
+    immediately below it) lands in the right bin, which is checked here using the same double-precision arithmetic
+    that the database will use.
+    """
+    if len(bins) < 2:
+        return None
+    try:
+        bins = [float(edge) for edge in bins]
+    except (TypeError, ValueError):
+        return None
+    if not all(np.isfinite(bins)):
+        return None
+    low = bins[0]
+    n_bins = len(bins) - 1
+    width = (bins[-1] - low) / n_bins
+    if not width > 0:
+        return None
+    for idx, edge in enumerate(bins[1:], start=1):
+        below_edge = np.nextafter(edge, -np.inf)
+        if math.floor((below_edge - low) / width) != idx - 1:
+            return None
+        if idx < n_bins and math.floor((edge - low) / width) != idx:
+            return None
+    return width
+
+
+def parse_datetime_series(series: pd.Series) -> pd.Series:
+    """Parse a Series of date strings, as mapping dateutil's parser over it would, but vectorized where possible.
+
+    The strings are first parsed with pd.to_datetime, inferring their format from the first value; only the strings
+    that it cannot parse are passed to dateutil one at a time. Series that already hold datetimes are returned as is,
+    and Series that do not hold only strings are mapped with dateutil's parser directly.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return series
+    inferred_type = pd.api.types.infer_dtype(series, skipna=True)
+    if inferred_type == "datetime":
+        return series
+    if inferred_type != "string":
+        return series.map(parse)
+
+    try:
+        parsed = pd.to_datetime(series, infer_datetime_format=True, errors="coerce")
+    except (ValueError, TypeError, OverflowError):
+        # e.g. strings with different timezone offsets
+        return series.map(parse)
+    if not pd.api.types.is_datetime64_any_dtype(parsed.dtype):
+        return series.map(parse)
+
+    residue = parsed.isnull() & series.notnull()
+    if residue.any():
+        residue_parsed = series[residue].map(parse)
+        if pd.api.types.is_datetime64_any_dtype(residue_parsed.dtype):
+            parsed[residue] = residue_parsed
+        else:
+            # e.g. dates outside the range of datetime64[ns]
+            parsed = parsed.astype(object).where(parsed.notnull(), None)
+            parsed[residue] = residue_parsed
+    return parsed
+
+
+# Constructs whose meaning depends on the position of a pattern within a combined alternation: group references
+# (numbered or named), conditional groups, and inline flags, which apply to the whole expression
+_POSITION_DEPENDENT_REGEX_CONSTRUCTS = re.compile(
+    r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)"
+)
+
+
+def combine_regex_list(regex_list: List[str]) -> Union[str, None]:
+    """Combine regex_list into a single alternation that matches wherever any of the regexes matches.
+
+    Searching with the combined regex scans each value once instead of once per regex. Returns None if the regexes
+    cannot be safely combined, in which case they must be applied one at a time.
+    """
+    if len(regex_list) == 0:
+        return None
+    if any(_POSITION_DEPENDENT_REGEX_CONSTRUCTS.search(regex) for regex in regex_list):
+        return None
+    combined_regex = "|".join("(?:{})".format(regex) for regex in regex_list)
+    try:
+        re.compile(combined_regex)
+    except re.error:
+        # e.g. the same named group appears in more than one regex
+        return None
+    return combined_regex
+
+
 def check_sql_engine_dialect(
     actual_sql_engine_dialect: Any, candidate_sql_engine_dialect: Any,
 ) -> bool:
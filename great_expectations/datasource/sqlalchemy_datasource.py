@@ -6,7 +6,11 @@ from urllib.parse import urlparse
 
 from great_expectations.core.batch import Batch
 from great_expectations.core.util import nested_update
-from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
+from great_expectations.dataset.sqlalchemy_dataset import (
+    SqlAlchemyBatchReference,
+    SqlAlchemyMaterializationCache,
+    SqlAlchemyReflectionCache,
+)
 from great_expectations.datasource import Datasource
 from great_expectations.datasource.types import BatchMarkers
 from great_expectations.exceptions import (
@@ -208,8 +212,22 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
         data_asset_type=None,
         credentials=None,
         batch_kwargs_generators=None,
+        materialization_cache_ttl=None,
+        reflection_cache_ttl=None,
+        pool_size=None,
+        max_overflow=None,
         **kwargs
     ):
+        """
+        Args:
+            materialization_cache_ttl: if provided, tables materialized for query-based batches are reused by later \
+                batches with the same query (and query_parameters) for up to this many seconds
+            reflection_cache_ttl: if provided, the columns reflected for a table are reused by later batches of the \
+                same table for up to this many seconds
+            pool_size: the number of connections the engine keeps open in its pool (ignored if an engine is provided)
+            max_overflow: the number of connections the engine may open beyond pool_size under load (ignored if an \
+                engine is provided)
+        """
         if not sqlalchemy:
             raise DatasourceInitializationError(
                 name, "ModuleNotFoundError: No module named 'sqlalchemy'"
@@ -227,7 +245,7 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
             data_context=data_context,
             data_asset_type=data_asset_type,
             batch_kwargs_generators=batch_kwargs_generators,
-            **configuration_with_defaults
+            **configuration_with_defaults,
         )
 
         if credentials is not None:
@@ -235,6 +253,31 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
         else:
             credentials = {}
 
+        if materialization_cache_ttl is not None:
+            self._datasource_config.update(
+                {"materialization_cache_ttl": materialization_cache_ttl}
+            )
+            self._materialization_cache = SqlAlchemyMaterializationCache(
+                ttl=materialization_cache_ttl
+            )
+        else:
+            self._materialization_cache = None
+
+        if reflection_cache_ttl is not None:
+            self._datasource_config.update(
+                {"reflection_cache_ttl": reflection_cache_ttl}
+            )
+            self._reflection_cache = SqlAlchemyReflectionCache(ttl=reflection_cache_ttl)
+        else:
+            self._reflection_cache = None
+
+        pool_kwargs = {}
+        if pool_size is not None:
+            pool_kwargs["pool_size"] = pool_size
+        if max_overflow is not None:
+            pool_kwargs["max_overflow"] = max_overflow
+        self._datasource_config.update(pool_kwargs)
+
         try:
             # if an engine was provided, use that
             if "engine" in kwargs:
@@ -243,13 +286,23 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
             # if a connection string or url was provided, use that
             elif "connection_string" in kwargs:
                 connection_string = kwargs.pop("connection_string")
-                self.engine = create_engine(connection_string, **kwargs)
-                self.engine.connect()
+                self.engine = create_engine(
+                    connection_string,
+                    **self._get_supported_pool_kwargs(
+                        connection_string, pool_kwargs, kwargs
+                    ),
+                    **kwargs,
+                )
+                self._check_connection()
             elif "url" in credentials:
                 url = credentials.pop("url")
                 self.drivername = urlparse(url).scheme
-                self.engine = create_engine(url, **kwargs)
-                self.engine.connect()
+                self.engine = create_engine(
+                    url,
+                    **self._get_supported_pool_kwargs(url, pool_kwargs, kwargs),
+                    **kwargs,
+                )
+                self._check_connection()
 
             # Otherwise, connect using remaining kwargs
             else:
@@ -259,8 +312,14 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
                     drivername,
                 ) = self._get_sqlalchemy_connection_options(**kwargs)
                 self.drivername = drivername
-                self.engine = create_engine(options, **create_engine_kwargs)
-                self.engine.connect()
+                self.engine = create_engine(
+                    options,
+                    **self._get_supported_pool_kwargs(
+                        options, pool_kwargs, create_engine_kwargs
+                    ),
+                    **create_engine_kwargs,
+                )
+                self._check_connection()
 
             # since we switched to lazy loading of Datasources when we initialise a DataContext,
             # the dialect of SQLAlchemy Datasources cannot be obtained reliably when we send
@@ -286,6 +345,56 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
 
         self._build_generators()
 
+    def _check_connection(self):
+        # Return the connection to the pool right away; batches check out their own connections as they need them
+        self.engine.connect().close()
+
+    @property
+    def reflection_cache(self):
+        """The SqlAlchemyReflectionCache shared by table-based batches, or None if reflection is not cached."""
+        return self._reflection_cache
+
+    @property
+    def materialization_cache(self):
+        """The SqlAlchemyMaterializationCache shared by query-based batches, or None if reuse is not enabled."""
+        return self._materialization_cache
+
+    def invalidate_materialized_queries(self, batch_kwargs=None):
+        """Drop tables materialized for query-based batches so that the next batch re-executes its query.
+
+        Args:
+            batch_kwargs: if provided, only invalidate the table materialized for these batch_kwargs
+        """
+        if self._materialization_cache is None:
+            return
+        if batch_kwargs is None:
+            self._materialization_cache.invalidate()
+        else:
+            batch_reference = self.get_batch(batch_kwargs).data
+            self._materialization_cache.invalidate(batch_reference.query_key)
+
+    @staticmethod
+    def _get_supported_pool_kwargs(url, pool_kwargs, create_engine_kwargs):
+        """Return pool_kwargs, unless the pool the engine will use does not accept them.
+
+        Only QueuePool accepts pool_size and max_overflow; the NullPool and SingletonThreadPool used by default by
+        some dialects, such as sqlite, do not.
+        """
+        if not pool_kwargs:
+            return pool_kwargs
+        poolclass = create_engine_kwargs.get("poolclass")
+        if poolclass is None:
+            url = sqlalchemy.engine.url.make_url(url)
+            poolclass = url.get_dialect().get_pool_class(url)
+        if issubclass(poolclass, sqlalchemy.pool.QueuePool):
+            return pool_kwargs
+        logger.warning(
+            "Ignoring {}, which the {} connection pool of the engine does not support.".format(
+                " and ".join(sorted(pool_kwargs.keys())), poolclass.__name__
+            )
+        )
+        return {}
+
     def _get_sqlalchemy_connection_options(self, **kwargs):
         drivername = None
         if "credentials" in self._datasource_config:
@@ -385,6 +494,11 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
                     "Limit and offset parameters are ignored when using query-based batch_kwargs; consider "
                     "adding limit and offset directly to the generated query."
                 )
+            if "sampling_method" in batch_kwargs:
+                logger.warning(
+                    "Sampling parameters are ignored when using query-based batch_kwargs; consider "
+                    "adding a sampling clause directly to the generated query."
+                )
             if "query_parameters" in batch_kwargs:
                 query = Template(batch_kwargs["query"]).safe_substitute(
                     batch_kwargs["query_parameters"]
@@ -396,6 +510,7 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
                 query=query,
                 table_name=query_support_table_name,
                 schema=batch_kwargs.get("schema"),
+                materialization_cache=self._materialization_cache,
             )
         elif "table" in batch_kwargs:
             table = batch_kwargs["table"]
@@ -404,7 +519,8 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
 
             limit = batch_kwargs.get("limit")
             offset = batch_kwargs.get("offset")
-            if limit is not None or offset is not None:
+            sampling_method = batch_kwargs.get("sampling_method")
+            if limit is not None or offset is not None or sampling_method is not None:
                 # AWS Athena does not support offset
                 if (
                     offset is not None
@@ -412,7 +528,7 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
                 ):
                     raise NotImplementedError("AWS Athena does not support OFFSET.")
                 logger.info(
-                    "Generating query from table batch_kwargs based on limit and offset"
+                    "Generating query from table batch_kwargs based on limit, offset and sampling"
                 )
 
                 # In BigQuery the table name is already qualified with its schema name
@@ -421,32 +537,52 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
 
                 else:
                     schema = batch_kwargs.get("schema")
-                raw_query = (
-                    sqlalchemy.select([sqlalchemy.text("*")])
-                    .select_from(
-                        sqlalchemy.schema.Table(
-                            table, sqlalchemy.MetaData(), schema=schema
-                        )
-                    )
-                    .offset(offset)
-                    .limit(limit)
+                selectable = sqlalchemy.schema.Table(
+                    table, sqlalchemy.MetaData(), schema=schema
                 )
+                raw_query = sqlalchemy.select([sqlalchemy.text("*")])
+                if sampling_method is not None:
+                    raw_query = self._apply_sampling(
+                        raw_query,
+                        selectable,
+                        sampling_method,
+                        batch_kwargs.get("sampling_kwargs", {}),
+                    )
+                else:
+                    raw_query = raw_query.select_from(selectable)
+                raw_query = raw_query.offset(offset).limit(limit)
                 query = str(
                     raw_query.compile(
                         self.engine, compile_kwargs={"literal_binds": True}
                     )
                 )
+                if sampling_method is not None:
+                    # Record exactly how the sample was drawn so that results can be reproduced
+                    batch_markers["sampling"] = {
+                        "sampling_method": sampling_method,
+                        "sampling_kwargs": batch_kwargs.get("sampling_kwargs", {}),
+                        "query": query,
+                    }
+                # An unseeded sample selects different rows each time its query runs, so it is never reused
+                reuse_materialization = sampling_method not in [
+                    "tablesample",
+                    "random",
+                ] or (batch_kwargs.get("sampling_kwargs", {}).get("seed") is not None)
                 batch_reference = SqlAlchemyBatchReference(
                     engine=self.engine,
                     query=query,
                     table_name=query_support_table_name,
                     schema=batch_kwargs.get("schema"),
+                    materialization_cache=self._materialization_cache
+                    if reuse_materialization
+                    else None,
                 )
             else:
                 batch_reference = SqlAlchemyBatchReference(
                     engine=self.engine,
                     table_name=table,
                     schema=batch_kwargs.get("schema"),
+                    reflection_cache=self._reflection_cache,
                 )
         else:
             raise ValueError(
@@ -462,6 +598,182 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
             data_context=self._data_context,
         )
 
+    def _apply_sampling(self, raw_query, table, sampling_method, sampling_kwargs):
+        """Restrict raw_query, which selects from table, to a sample of its rows.
+
+        Supported sampling methods:
+            - "tablesample": sampling_kwargs "percent", and optionally "seed" and "tablesample_method" ("SYSTEM",
+              the default, reads only a fraction of the table's storage blocks; "BERNOULLI" samples individual rows).
+              Uses the dialect's TABLESAMPLE clause. On dialects without one, a "column_name" in sampling_kwargs
+              selects the equivalent deterministic "mod" sample instead.
+            - "mod": sampling_kwargs "column_name", "mod" and optionally "value" (default 0) and "hash" (default
+              True). Keeps rows for which MOD(hash(column_name), mod) == value, which always selects the same rows.
+            - "random": sampling_kwargs "percent" and optionally "seed". Keeps each row with the given probability;
+              a seed is only supported on dialects that can repeat a random sample.
+        """
+        dialect_name = self.engine.dialect.name.lower()
+        if sampling_method == "tablesample":
+            tablesample_clause = self._get_tablesample_clause(sampling_kwargs)
+            if tablesample_clause is not None:
+                table_name = self.engine.dialect.identifier_preparer.format_table(table)
+                return raw_query.select_from(
+                    sqlalchemy.text(table_name + " " + tablesample_clause)
+                )
+            if "column_name" not in sampling_kwargs:
+                raise ValueError(
+                    'The SQL engine dialect "{}" does not support TABLESAMPLE; provide a "column_name" in '
+                    'sampling_kwargs to use a deterministic "mod" sample instead.'.format(
+                        dialect_name
+                    )
+                )
+            sampling_kwargs = {
+                "column_name": sampling_kwargs["column_name"],
+                "mod": int(round(100 / float(sampling_kwargs["percent"]))),
+                "value": 0,
+            }
+            sampling_method = "mod"
+
+        if sampling_method == "mod":
+            column = sqlalchemy.column(sampling_kwargs["column_name"])
+            if sampling_kwargs.get("hash", True):
+                column = self._get_hash_expression(column)
+            mod = int(sampling_kwargs["mod"])
+            if dialect_name == "bigquery":
+                # BigQuery has no % operator
+                bucket = sqlalchemy.func.mod(
+                    sqlalchemy.func.mod(column, mod) + mod, mod
+                )
+            else:
+                # Shift negative remainders so that every bucket is equally likely
+                bucket = ((column % mod) + mod) % mod
+            return raw_query.select_from(table).where(
+                bucket == int(sampling_kwargs.get("value", 0))
+            )
+
+        if sampling_method == "random":
+            fraction = float(sampling_kwargs["percent"]) / 100
+            seed = sampling_kwargs.get("seed")
+            if seed is not None and dialect_name in ["postgresql", "snowflake"]:
+                return self._apply_sampling(
+                    raw_query,
+                    table,
+                    "tablesample",
+                    {
+                        "percent": sampling_kwargs["percent"],
+                        "seed": seed,
+                        "tablesample_method": "BERNOULLI",
+                    },
+                )
+            if seed is not None and dialect_name != "mysql":
+                raise ValueError(
+                    'The SQL engine dialect "{}" does not support seeded random sampling; use the "mod" '
+                    "sampling_method for a reproducible sample.".format(dialect_name)
+                )
+            if dialect_name == "mysql":
+                random_value = (
+                    sqlalchemy.func.rand(int(seed))
+                    if seed is not None
+                    else sqlalchemy.func.rand()
+                )
+            elif dialect_name == "sqlite":
+                # sqlite's random() returns a signed 64-bit integer
+                random_value = (
+                    sqlalchemy.func.abs(sqlalchemy.func.random() % 1000000) / 1000000.0
+                )
+            elif dialect_name == "mssql":
+                # RAND() is evaluated once per query on mssql; NEWID() is evaluated per row
+                random_value = (
+                    sqlalchemy.func.abs(
+                        sqlalchemy.func.checksum(sqlalchemy.func.newid())
+                    )
+                    % 1000000
+                ) / 1000000.0
+            elif dialect_name == "bigquery":
+                random_value = sqlalchemy.func.rand()
+            else:
+                random_value = sqlalchemy.func.random()
+            return raw_query.select_from(table).where(random_value < fraction)
+
+        raise ValueError(
+            'Unrecognized sampling_method "{}"; use one of "tablesample", "mod" or "random".'.format(
+                sampling_method
+            )
+        )
+
+    def _get_tablesample_clause(self, sampling_kwargs):
+        """Return the dialect-specific TABLESAMPLE clause for sampling_kwargs, or None if not supported."""
+        dialect_name = self.engine.dialect.name.lower()
+        percent = float(sampling_kwargs["percent"])
+        seed = sampling_kwargs.get("seed")
+        method = sampling_kwargs.get("tablesample_method", "SYSTEM").upper()
+        if method not in ["SYSTEM", "BERNOULLI"]:
+            raise ValueError('tablesample_method must be "SYSTEM" or "BERNOULLI"')
+        if dialect_name == "postgresql":
+            clause = "TABLESAMPLE {} ({})".format(method, percent)
+            if seed is not None:
+                clause += " REPEATABLE ({})".format(int(seed))
+        elif dialect_name == "mssql":
+            clause = "TABLESAMPLE SYSTEM ({} PERCENT)".format(percent)
+            if seed is not None:
+                clause += " REPEATABLE ({})".format(int(seed))
+        elif dialect_name == "snowflake":
+            clause = "SAMPLE {} ({})".format(method, percent)
+            if seed is not None:
+                clause += " SEED ({})".format(int(seed))
+        elif dialect_name == "oracle":
+            clause = "SAMPLE {}({})".format(
+                "BLOCK " if method == "SYSTEM" else "", percent
+            )
+            if seed is not None:
+                clause += " SEED ({})".format(int(seed))
+        elif dialect_name in ["bigquery", "awsathena", "trino", "presto"]:
+            if seed is not None:
+                raise ValueError(
+                    'The SQL engine dialect "{}" does not support a seed for TABLESAMPLE; use the "mod" '
+                    "sampling_method for a reproducible sample.".format(dialect_name)
+                )
+            if dialect_name == "bigquery":
+                clause = "TABLESAMPLE SYSTEM ({} PERCENT)".format(percent)
+            else:
+                clause = "TABLESAMPLE {} ({})".format(method, percent)
+        else:
+            clause = None
+        return clause
+
+    def _get_hash_expression(self, column):
+        """Return a deterministic integer hash of column using the dialect's built-in hash function."""
+        dialect_name = self.engine.dialect.name.lower()
+        if dialect_name == "postgresql":
+            return sqlalchemy.func.hashtext(sqlalchemy.cast(column, sqlalchemy.Text))
+        elif dialect_name == "redshift":
+            return sqlalchemy.func.fnv_hash(column)
+        elif dialect_name == "snowflake":
+            return sqlalchemy.func.hash(column)
+        elif dialect_name == "bigquery":
+            return sqlalchemy.func.farm_fingerprint(
+                sqlalchemy.cast(column, sqlalchemy.String)
+            )
+        elif dialect_name == "mysql":
+            return sqlalchemy.func.crc32(column)
+        elif dialect_name == "mssql":
+            return sqlalchemy.func.checksum(column)
+        elif dialect_name == "oracle":
+            return sqlalchemy.func.ora_hash(column)
+        elif dialect_name in ["awsathena", "trino", "presto"]:
+            return sqlalchemy.func.from_big_endian_64(
+                sqlalchemy.func.xxhash64(
+                    sqlalchemy.func.to_utf8(sqlalchemy.cast(column, sqlalchemy.String))
+                )
+            )
+        else:
+            # sqlite has no built-in hash function; sample on the (integer) column values directly
+            logger.info(
+                'The SQL engine dialect "{}" has no hash function; sampling on column values directly.'.format(
+                    dialect_name
+                )
+            )
+            return column
+
     def process_batch_parameters(
         self, query_parameters=None, limit=None, dataset_options=None
     ):
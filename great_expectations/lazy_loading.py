@@ -0,0 +1,47 @@
+import importlib
+import sys
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    """A package whose public attributes and subpackages are imported when they are first accessed, rather than
+    when the package is imported.
+
+    Python 3.6 does not support module level __getattr__ (PEP 562), so set_lazy_attributes replaces the class of
+    the package module instead.
+    """
+
+    def __getattr__(self, name):
+        lazy_attributes = self.__dict__.get("_lazy_attributes", {})
+        if name in lazy_attributes:
+            value = getattr(importlib.import_module(lazy_attributes[name]), name)
+            setattr(self, name, value)
+            return value
+        if not name.startswith("__"):
+            # Importing a subpackage also sets it as an attribute of the package
+            submodule_name = self.__name__ + "." + name
+            try:
+                return importlib.import_module(submodule_name)
+            except ModuleNotFoundError as e:
+                if e.name != submodule_name:
+                    raise
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(self.__name__, name)
+        )
+
+    def __dir__(self):
+        return sorted(
+            set(super().__dir__()) | set(self.__dict__.get("_lazy_attributes", {}))
+        )
+
+
+def set_lazy_attributes(module_name, lazy_attributes):
+    """Import the attributes of the package module_name when they are first accessed.
+
+    Args:
+        module_name: the name of the package, which must already be in sys.modules
+        lazy_attributes: a dict mapping attribute names to the name of the module to import each of them from
+    """
+    module = sys.modules[module_name]
+    module._lazy_attributes = lazy_attributes
+    module.__class__ = LazyModule
@@ -801,6 +801,7 @@ class DefaultSiteIndexBuilder:
                         expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
                         run_id=profiling_result_key.run_id,
                         validations_store_name=self.source_stores.get("profiling"),
+                        lazy=True,
                     )
 
                     batch_kwargs = validation.meta.get("batch_kwargs", {})
@@ -853,6 +854,7 @@ class DefaultSiteIndexBuilder:
                         expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
                         run_id=validation_result_key.run_id,
                         validations_store_name=self.source_stores.get("validations"),
+                        lazy=True,
                     )
 
                     validation_success = validation.success
@@ -9,9 +9,6 @@ from pathlib import Path
 from types import ModuleType
 from typing import Callable, Union
 
-import black
-from pkg_resources import Distribution
-
 from great_expectations.core import expectationSuiteSchema
 from great_expectations.exceptions import (
     PluginClassNotFoundError,
@@ -47,8 +44,8 @@ def measure_execution_time(func) -> Callable:
 
 
 # noinspection SpellCheckingInspection
-def get_project_distribution() -> Union[Distribution, None]:
-    ditr: Distribution
+def get_project_distribution() -> Union[importlib_metadata.Distribution, None]:
+    ditr: importlib_metadata.Distribution
     for distr in importlib_metadata.distributions():
         relative_path: Path
         try:
@@ -679,6 +676,9 @@ def gen_directory_tree_str(startpath):
 
 def lint_code(code):
     """Lint strings of code passed in."""
+    # black is only needed when generating code, so it is not imported along with great_expectations
+    import black
+
     black_file_mode = black.FileMode()
     if not isinstance(code, str):
         raise TypeError
@@ -30,6 +30,13 @@ class ValidationAction:
     The Data Context is passed to this class in its constructor.
     """
 
+    # Whether validation operators configured with max_action_workers may run the action concurrently with
+    # other actions. The Data Context is not thread safe, so actions using it must leave this False.
+    thread_safe = False
+    # Whether the action stores values which evaluation parameters may read, so that validation operators
+    # configured with max_action_workers wait for the action before validating the next batch.
+    stores_evaluation_parameters = False
+
     def __init__(self, data_context):
         self.data_context = data_context
 
@@ -60,8 +67,18 @@ class ValidationAction:
     ):
         return NotImplementedError
 
+    def flush(self):
+        """
+        Performs any work the action deferred while it was run on the results of a validation operator run.
+
+        Validation operators call this method once, after the action was run on all of their validation results.
+        """
+        pass
+
 
 class NoOpAction(ValidationAction):
+    thread_safe = True
+
     def __init__(
         self, data_context,
     ):
@@ -97,6 +114,8 @@ SlackNotificationAction sends a Slack notification to a given webhook.
 
     """
 
+    thread_safe = True
+
     def __init__(
         self, data_context, renderer, slack_webhook, notify_on="all", notify_with=None,
     ):
@@ -197,6 +216,8 @@ PagerdutyAlertAction sends a pagerduty event
 
     """
 
+    thread_safe = True
+
     def __init__(
         self, data_context, api_key, routing_key, notify_on="failure",
     ):
@@ -348,6 +369,8 @@ in the process of validating other prior expectations.
 
     """
 
+    stores_evaluation_parameters = True
+
     def __init__(self, data_context, target_store_name=None):
         """
 
@@ -405,6 +428,9 @@ in a metrics store.
 
     """
 
+    # metric stores can be read by urn:great_expectations:stores evaluation parameters
+    stores_evaluation_parameters = True
+
     def __init__(
         self, data_context, requested_metrics, target_store_name="metrics_store"
     ):
@@ -487,12 +513,24 @@ list of sites to update:
       site_names:
         - production_site
 
+When a validation operator validates many batches, you can instruct ``UpdateDataDocsAction`` to build the data docs
+only once, at the end of the operator run, with all the new validation results, by setting ``deferred`` to true:
+
+    - name: update_data_docs
+    action:
+      class_name: UpdateDataDocsAction
+      deferred: true
+
     """
 
-    def __init__(self, data_context, site_names=None, target_site_names=None):
+    def __init__(
+        self, data_context, site_names=None, target_site_names=None, deferred=False
+    ):
         """
         :param data_context: Data Context
         :param site_names: *optional* List of site names for building data docs
+        :param deferred: *optional* If True, build the data docs for all the validation results once, when the \
+        action is flushed at the end of the validation operator run
         """
         super().__init__(data_context)
         if target_site_names:
@@ -507,6 +545,8 @@ list of sites to update:
                 )
             site_names = target_site_names
         self._site_names = site_names
+        self._deferred = deferred
+        self._pending_resource_identifiers = []
 
     def _run(
         self,
@@ -529,16 +569,23 @@ list of sites to update:
                 )
             )
 
-        # build_data_docs will return the index page for the validation results, but we want to return the url for the valiation result using the code below
-        data_docs_index_pages = self.data_context.build_data_docs(
-            site_names=self._site_names,
-            resource_identifiers=[validation_result_suite_identifier],
-        )
+        if self._deferred:
+            # the page of the validation result is built when the action is flushed
+            self._pending_resource_identifiers.append(
+                validation_result_suite_identifier
+            )
+        else:
+            # build_data_docs will return the index page for the validation results, but we want to return the url for the valiation result using the code below
+            data_docs_index_pages = self.data_context.build_data_docs(
+                site_names=self._site_names,
+                resource_identifiers=[validation_result_suite_identifier],
+            )
 
         # get the URL for the validation result
         docs_site_urls_list = self.data_context.get_docs_sites_urls(
             resource_identifier=validation_result_suite_identifier,
             site_names=self._site_names,
+            only_if_exists=not self._deferred,
         )
         # process payload
         data_docs_validation_results = {}
@@ -546,3 +593,13 @@ list of sites to update:
             data_docs_validation_results[sites["site_name"]] = sites["site_url"]
 
         return data_docs_validation_results
+
+    def flush(self):
+        if not self._pending_resource_identifiers:
+            return
+
+        resource_identifiers = self._pending_resource_identifiers
+        self._pending_resource_identifiers = []
+        self.data_context.build_data_docs(
+            site_names=self._site_names, resource_identifiers=resource_identifiers
+        )
@@ -1,12 +1,48 @@
 import logging
+import threading
 
 import requests
 
 logger = logging.getLogger(__name__)
 
+# The HTTP session shared by the notifications, whose connection pool is thread safe, and the number of validation
+# operator runs using it
+_session = None
+_session_users = 0
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Return the HTTP session shared by the notifications, so that the notifications sent for the batches of a
+    validation operator run, from any of its action threads, reuse the same connections.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+        return _session
+
+
+def acquire_session():
+    """Keep the shared HTTP session open until release_session is called."""
+    global _session_users
+    with _session_lock:
+        _session_users += 1
+
+
+def release_session():
+    """Close the shared HTTP session and its connections once no validation operator run uses it anymore."""
+    global _session, _session_users
+    with _session_lock:
+        _session_users -= 1
+        if _session_users == 0 and _session is not None:
+            _session.close()
+            _session = None
+
 
 def send_slack_notification(query, slack_webhook):
-    session = requests.Session()
+    session = get_session()
 
     try:
         response = session.post(url=slack_webhook, json=query)
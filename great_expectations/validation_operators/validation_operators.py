@@ -1,6 +1,9 @@
 import logging
+import threading
+import time
 import warnings
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from dateutil.parser import parse
 
@@ -12,12 +15,12 @@ from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
 from great_expectations.data_context.util import instantiate_class_from_config
-from great_expectations.exceptions import ClassInstantiationError
+from great_expectations.exceptions import ClassInstantiationError, InvalidConfigError
 from great_expectations.validation_operators.types.validation_operator_result import (
     ValidationOperatorResult,
 )
 
-from .util import send_slack_notification
+from .util import acquire_session, release_session, send_slack_notification
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +129,48 @@ An instance of ActionListValidationOperator is included in the default configura
           class_name: UpdateDataDocsAction
 
 
+**Running actions asynchronously**
+
+By default, the operator runs the actions of a validation result one after the other, before validating the next
+batch. With ``max_action_workers`` configured, it runs them on a pool of that many threads instead, and validates the
+next batch while they run. It only waits for the actions storing evaluation parameters, such as
+StoreEvaluationParametersAction and StoreMetricsAction, before validating the next batch, so that the next batch can
+use them. The ``run`` method returns once all the actions have finished.
+
+Actions then run concurrently unless an action lists the names of earlier actions it needs to run after in its
+``depends_on`` key. An action receives the results of the actions it depends on as its ``payload``; for example, a
+SlackNotificationAction linking to Data Docs must depend on the UpdateDataDocsAction. An action whose dependency
+fails is not run, and ``run`` raises the first error once all the actions have finished.
+
+Since the Data Context is not thread safe, only actions marked as ``thread_safe``, such as the notification actions,
+run concurrently with other actions; actions using stores or Data Docs run one at a time. The notifications of a run
+share the connections of a single HTTP session.
+
+.. code-block:: yaml
+
+  perform_action_list_operator:
+    class_name: ActionListValidationOperator
+    max_action_workers: 4
+    action_list:
+      - name: store_validation_result
+        action:
+          class_name: StoreValidationResultAction
+      - name: store_evaluation_params
+        action:
+          class_name: StoreEvaluationParametersAction
+      - name: update_data_docs
+        depends_on:
+          - store_validation_result
+        action:
+          class_name: UpdateDataDocsAction
+      - name: send_slack_notification_on_validation_result
+        depends_on:
+          - update_data_docs
+        action:
+          class_name: SlackNotificationAction
+          slack_webhook: ${validation_notification_slack_webhook}
+
+
 **Invocation**
 
 This is an example of invoking an instance of a Validation Operator from Python:
@@ -182,9 +227,16 @@ The ``run`` method returns a ValidationOperatorResult object:
                     "store_evaluation_params": {},
                     "update_data_docs": {},
                 },
+                "actions_timings": {
+                    "store_validation_result": 0.012,
+                    "store_evaluation_params": 0.001,
+                    "update_data_docs": 0.253,
+                },
             }
         },
     }
+
+``actions_timings`` holds the seconds each action took to run.
     """
 
     def __init__(
@@ -193,10 +245,16 @@ The ``run`` method returns a ValidationOperatorResult object:
         action_list,
         name,
         result_format={"result_format": "SUMMARY"},
+        max_action_workers=None,
     ):
         super().__init__()
         self.data_context = data_context
         self.name = name
+        self.max_action_workers = max_action_workers
+        self._action_executor = None
+        self._pending_action_futures = []
+        # held while running the actions which are not thread safe, see _run_action
+        self._data_context_lock = threading.Lock()
 
         result_format = parse_result_format(result_format)
         assert result_format["result_format"] in [
@@ -212,12 +270,23 @@ The ``run`` method returns a ValidationOperatorResult object:
         for action_config in action_list:
             assert isinstance(action_config, dict)
             # NOTE: Eugene: 2019-09-23: need a better way to validate an action config:
-            if not set(action_config.keys()) == {"name", "action"}:
+            if (
+                not {"name", "action"}
+                <= set(action_config.keys())
+                <= {"name", "action", "depends_on",}
+            ):
                 raise KeyError(
-                    'Action config keys must be ("name", "action"). Instead got {}'.format(
+                    'Action config keys must be ("name", "action") and optionally "depends_on". Instead got {}'.format(
                         action_config.keys()
                     )
                 )
+            for dependency_name in action_config.get("depends_on", []):
+                if dependency_name not in self.actions:
+                    raise InvalidConfigError(
+                        "Action {} can only depend on the actions listed before it, not on {}".format(
+                            action_config["name"], dependency_name
+                        )
+                    )
 
             config = action_config["action"]
             module_name = "great_expectations.validation_operators"
@@ -246,6 +315,10 @@ The ``run`` method returns a ValidationOperatorResult object:
                     "result_format": self.result_format,
                 },
             }
+            if self.max_action_workers is not None:
+                self._validation_operator_config["kwargs"][
+                    "max_action_workers"
+                ] = self.max_action_workers
         return self._validation_operator_config
 
     def _build_batch_from_item(self, item):
@@ -309,33 +382,46 @@ The ``run`` method returns a ValidationOperatorResult object:
 
         run_results = {}
 
-        for item in assets_to_validate:
-            run_result_obj = {}
-            batch = self._build_batch_from_item(item)
-            expectation_suite_identifier = ExpectationSuiteIdentifier(
-                expectation_suite_name=batch._expectation_suite.expectation_suite_name
-            )
-            validation_result_id = ValidationResultIdentifier(
-                batch_identifier=batch.batch_id,
-                expectation_suite_identifier=expectation_suite_identifier,
-                run_id=run_id,
-            )
-            batch_validation_result = batch.validate(
-                run_id=run_id,
-                result_format=result_format if result_format else self.result_format,
-                evaluation_parameters=evaluation_parameters,
-            )
-            run_result_obj["validation_result"] = batch_validation_result
-            batch_actions_results = self._run_actions(
-                batch,
-                expectation_suite_identifier,
-                batch._expectation_suite,
-                batch_validation_result,
-                run_id,
-            )
+        self._start_actions()
+        try:
+            for item in assets_to_validate:
+                run_result_obj = {}
+                batch = self._build_batch_from_item(item)
+                expectation_suite_identifier = ExpectationSuiteIdentifier(
+                    expectation_suite_name=batch._expectation_suite.expectation_suite_name
+                )
+                validation_result_id = ValidationResultIdentifier(
+                    batch_identifier=batch.batch_id,
+                    expectation_suite_identifier=expectation_suite_identifier,
+                    run_id=run_id,
+                )
+                batch_validation_result = batch.validate(
+                    run_id=run_id,
+                    result_format=result_format
+                    if result_format
+                    else self.result_format,
+                    evaluation_parameters=evaluation_parameters,
+                )
+                run_result_obj["validation_result"] = batch_validation_result
+                run_result_obj["actions_timings"] = {}
+                batch_actions_results = self._run_actions(
+                    batch,
+                    expectation_suite_identifier,
+                    batch._expectation_suite,
+                    batch_validation_result,
+                    run_id,
+                    actions_timings=run_result_obj["actions_timings"],
+                )
 
-            run_result_obj["actions_results"] = batch_actions_results
-            run_results[validation_result_id] = run_result_obj
+                run_result_obj["actions_results"] = batch_actions_results
+                run_results[validation_result_id] = run_result_obj
+        except Exception:
+            # The error of the run takes precedence over those of the actions still running
+            self._finish_actions(raise_errors=False)
+            raise
+        self._finish_actions()
+
+        self._flush_actions()
 
         return ValidationOperatorResult(
             run_id=run_id,
@@ -351,6 +437,7 @@ The ``run`` method returns a ValidationOperatorResult object:
         expectation_suite,
         batch_validation_result,
         run_id,
+        actions_timings=None,
     ):
         """
         Runs all actions configured for this operator on the result of validating one
@@ -358,48 +445,188 @@ The ``run`` method returns a ValidationOperatorResult object:
 
         If an action fails with an exception, the method does not continue.
 
+        If max_action_workers is configured, the actions are submitted to the action executor,
+        and the method only waits for the actions storing evaluation parameters, which the next
+        batch may need; the returned dictionary is filled as the other actions finish, which
+        _finish_actions waits for.
+
         :param batch:
         :param expectation_suite:
         :param batch_validation_result:
         :param run_id:
+        :param actions_timings: *optional* a dictionary receiving {action name -> seconds spent running the action}
         :return: a dictionary: {action name -> result returned by the action}
         """
+        if actions_timings is None:
+            actions_timings = {}
+        validation_result_id = ValidationResultIdentifier(
+            expectation_suite_identifier=expectation_suite_identifier,
+            run_id=run_id,
+            batch_identifier=batch.batch_id,
+        )
+
         batch_actions_results = {}
+        if self._action_executor is not None:
+            action_futures = {}
+            for action in self.action_list:
+                # Actions are submitted after the actions they depend on, which the executor starts first,
+                # so waiting for them cannot exhaust its threads
+                action_futures[action["name"]] = self._action_executor.submit(
+                    self._run_action_after_dependencies,
+                    action,
+                    {
+                        dependency_name: action_futures[dependency_name]
+                        for dependency_name in action.get("depends_on", [])
+                    },
+                    validation_result_id,
+                    batch_validation_result,
+                    batch,
+                    batch_actions_results,
+                    actions_timings,
+                )
+            self._pending_action_futures.extend(action_futures.values())
+            # actions which do not extend ValidationAction may store evaluation parameters
+            evaluation_parameter_futures = [
+                action_future
+                for action_name, action_future in action_futures.items()
+                if getattr(
+                    self.actions[action_name], "stores_evaluation_parameters", True
+                )
+            ]
+            wait(evaluation_parameter_futures)
+            for action_future in evaluation_parameter_futures:
+                action_future.result()
+            return batch_actions_results
+
         for action in self.action_list:
-            # NOTE: Eugene: 2019-09-23: log the info about the batch and the expectation suite
-            logger.debug(
-                "Processing validation action with name {}".format(action["name"])
+            self._run_action(
+                action,
+                validation_result_id,
+                batch_validation_result,
+                batch,
+                batch_actions_results,
+                batch_actions_results,
+                actions_timings,
+            )
+
+        return batch_actions_results
+
+    def _run_action_after_dependencies(
+        self,
+        action,
+        dependency_futures,
+        validation_result_id,
+        batch_validation_result,
+        batch,
+        batch_actions_results,
+        actions_timings,
+    ):
+        for dependency_name, dependency_future in dependency_futures.items():
+            # re-raises the error of a failed dependency, so that the action is not run
+            dependency_future.result()
+        self._run_action(
+            action,
+            validation_result_id,
+            batch_validation_result,
+            batch,
+            {
+                dependency_name: batch_actions_results[dependency_name]
+                for dependency_name in dependency_futures
+            },
+            batch_actions_results,
+            actions_timings,
+        )
+
+    def _run_action(
+        self,
+        action,
+        validation_result_id,
+        batch_validation_result,
+        batch,
+        payload,
+        batch_actions_results,
+        actions_timings,
+    ):
+        # NOTE: Eugene: 2019-09-23: log the info about the batch and the expectation suite
+        logger.debug("Processing validation action with name {}".format(action["name"]))
+
+        action_obj = self.actions[action["name"]]
+        # actions which do not extend ValidationAction are not known to be thread safe
+        thread_safe = getattr(action_obj, "thread_safe", False)
+
+        if not thread_safe:
+            self._data_context_lock.acquire()
+        # Started once the lock is acquired, so that the timing does not include waiting for other actions
+        start = time.perf_counter()
+        try:
+            action_result = action_obj.run(
+                validation_result_suite_identifier=validation_result_id,
+                validation_result_suite=batch_validation_result,
+                data_asset=batch,
+                payload=payload,
             )
 
-            validation_result_id = ValidationResultIdentifier(
-                expectation_suite_identifier=expectation_suite_identifier,
-                run_id=run_id,
-                batch_identifier=batch.batch_id,
+            # add action_result
+            action_result = {} if action_result is None else action_result
+            action_result["class"] = action["action"]["class_name"]
+            batch_actions_results[action["name"]] = action_result
+
+        except Exception as e:
+            logger.exception("Error running action with name {}".format(action["name"]))
+            raise e
+        finally:
+            actions_timings[action["name"]] = time.perf_counter() - start
+            if not thread_safe:
+                self._data_context_lock.release()
+
+    def _start_actions(self):
+        """
+        Prepares running the actions of a run: the action executor running them asynchronously if
+        max_action_workers is configured, and the HTTP session shared by the notifications.
+        """
+        acquire_session()
+        if self.max_action_workers is not None:
+            self._action_executor = ThreadPoolExecutor(
+                max_workers=self.max_action_workers
             )
-            try:
-                action_result = self.actions[action["name"]].run(
-                    validation_result_suite_identifier=validation_result_id,
-                    validation_result_suite=batch_validation_result,
-                    data_asset=batch,
-                    payload=batch_actions_results,
-                )
 
-                # add action_result
-                batch_actions_results[action["name"]] = (
-                    {} if action_result is None else action_result
-                )
-                batch_actions_results[action["name"]]["class"] = action["action"][
-                    "class_name"
-                ]
+    def _finish_actions(self, raise_errors=True):
+        """
+        Waits for the actions running asynchronously, then shuts the action executor down and
+        releases the HTTP session of the run.
 
+        :param raise_errors: whether to raise the first error among the actions running asynchronously
+        """
+        try:
+            wait(self._pending_action_futures)
+            if raise_errors:
+                for action_future in self._pending_action_futures:
+                    action_future.result()
+        finally:
+            self._pending_action_futures = []
+            if self._action_executor is not None:
+                self._action_executor.shutdown()
+                self._action_executor = None
+            release_session()
+
+    def _flush_actions(self):
+        """
+        Lets all actions configured for this operator perform the work they deferred until all
+        the batches of the run were validated.
+        """
+        for action in self.action_list:
+            # actions which do not extend ValidationAction may not implement flush
+            flush = getattr(self.actions[action["name"]], "flush", None)
+            if flush is None:
+                continue
+            try:
+                flush()
             except Exception as e:
                 logger.exception(
-                    "Error running action with name {}".format(action["name"])
+                    "Error flushing action with name {}".format(action["name"])
                 )
                 raise e
 
-        return batch_actions_results
-
 
 class WarningAndFailureExpectationSuitesValidationOperator(
     ActionListValidationOperator
@@ -551,8 +778,11 @@ The value of "success" is True if no critical expectation suites ("failure") fai
         notify_on="all",
         notify_with=None,
         result_format={"result_format": "SUMMARY"},
+        max_action_workers=None,
     ):
-        super().__init__(data_context, action_list, name)
+        super().__init__(
+            data_context, action_list, name, max_action_workers=max_action_workers
+        )
 
         if expectation_suite_name_suffixes is None:
             expectation_suite_name_suffixes = [".failure", ".warning"]
@@ -595,6 +825,10 @@ The value of "success" is True if no critical expectation suites ("failure") fai
                     "result_format": self.result_format,
                 },
             }
+            if self.max_action_workers is not None:
+                self._validation_operator_config["kwargs"][
+                    "max_action_workers"
+                ] = self.max_action_workers
         return self._validation_operator_config
 
     def _build_slack_query(self, validation_operator_result: ValidationOperatorResult):
@@ -730,108 +964,131 @@ The value of "success" is True if no critical expectation suites ("failure") fai
 
         run_results = {}
 
-        for item in assets_to_validate:
-            batch = self._build_batch_from_item(item)
-
-            batch_id = batch.batch_id
-            run_id = run_id
-
-            assert not batch_id is None
-            assert not run_id is None
+        self._start_actions()
+        try:
+            for item in assets_to_validate:
+                batch = self._build_batch_from_item(item)
 
-            failure_expectation_suite_identifier = ExpectationSuiteIdentifier(
-                expectation_suite_name=base_expectation_suite_name
-                + self.expectation_suite_name_suffixes[0]
-            )
+                batch_id = batch.batch_id
+                run_id = run_id
 
-            failure_validation_result_id = ValidationResultIdentifier(
-                expectation_suite_identifier=failure_expectation_suite_identifier,
-                run_id=run_id,
-                batch_identifier=batch_id,
-            )
+                assert not batch_id is None
+                assert not run_id is None
 
-            failure_expectation_suite = None
-            try:
-                failure_expectation_suite = self.data_context.stores[
-                    self.data_context.expectations_store_name
-                ].get(failure_expectation_suite_identifier)
-
-            # NOTE : Abe 2019/09/17 : I'm concerned that this may be too permissive, since
-            # it will catch any error in the Store, not just KeyErrors. In the longer term, a better
-            # solution will be to have the Stores catch other known errors and raise KeyErrors,
-            # so that methods like this can catch and handle a single error type.
-            except Exception:
-                logger.debug(
-                    "Failure expectation suite not found: {}".format(
-                        failure_expectation_suite_identifier
-                    )
+                failure_expectation_suite_identifier = ExpectationSuiteIdentifier(
+                    expectation_suite_name=base_expectation_suite_name
+                    + self.expectation_suite_name_suffixes[0]
                 )
 
-            if failure_expectation_suite:
-                failure_run_result_obj = {"expectation_suite_severity_level": "failure"}
-                failure_validation_result = batch.validate(
-                    failure_expectation_suite,
-                    result_format=result_format
-                    if result_format
-                    else self.result_format,
-                    evaluation_parameters=evaluation_parameters,
+                failure_validation_result_id = ValidationResultIdentifier(
+                    expectation_suite_identifier=failure_expectation_suite_identifier,
+                    run_id=run_id,
+                    batch_identifier=batch_id,
                 )
-                failure_run_result_obj["validation_result"] = failure_validation_result
-                failure_actions_results = self._run_actions(
-                    batch,
-                    failure_expectation_suite_identifier,
-                    failure_expectation_suite,
-                    failure_validation_result,
-                    run_id,
-                )
-                failure_run_result_obj["actions_results"] = failure_actions_results
-                run_results[failure_validation_result_id] = failure_run_result_obj
-
-                if not failure_validation_result.success and self.stop_on_first_error:
-                    break
 
-            warning_expectation_suite_identifier = ExpectationSuiteIdentifier(
-                expectation_suite_name=base_expectation_suite_name
-                + self.expectation_suite_name_suffixes[1]
-            )
-
-            warning_validation_result_id = ValidationResultIdentifier(
-                expectation_suite_identifier=warning_expectation_suite_identifier,
-                run_id=run_id,
-                batch_identifier=batch.batch_id,
-            )
+                failure_expectation_suite = None
+                try:
+                    failure_expectation_suite = self.data_context.stores[
+                        self.data_context.expectations_store_name
+                    ].get(failure_expectation_suite_identifier)
+
+                # NOTE : Abe 2019/09/17 : I'm concerned that this may be too permissive, since
+                # it will catch any error in the Store, not just KeyErrors. In the longer term, a better
+                # solution will be to have the Stores catch other known errors and raise KeyErrors,
+                # so that methods like this can catch and handle a single error type.
+                except Exception:
+                    logger.debug(
+                        "Failure expectation suite not found: {}".format(
+                            failure_expectation_suite_identifier
+                        )
+                    )
 
-            warning_expectation_suite = None
-            try:
-                warning_expectation_suite = self.data_context.stores[
-                    self.data_context.expectations_store_name
-                ].get(warning_expectation_suite_identifier)
-            except Exception:
-                logger.debug(
-                    "Warning expectation suite not found: {}".format(
-                        warning_expectation_suite_identifier
+                if failure_expectation_suite:
+                    failure_run_result_obj = {
+                        "expectation_suite_severity_level": "failure"
+                    }
+                    failure_validation_result = batch.validate(
+                        failure_expectation_suite,
+                        result_format=result_format
+                        if result_format
+                        else self.result_format,
+                        evaluation_parameters=evaluation_parameters,
                     )
+                    failure_run_result_obj[
+                        "validation_result"
+                    ] = failure_validation_result
+                    failure_run_result_obj["actions_timings"] = {}
+                    failure_actions_results = self._run_actions(
+                        batch,
+                        failure_expectation_suite_identifier,
+                        failure_expectation_suite,
+                        failure_validation_result,
+                        run_id,
+                        actions_timings=failure_run_result_obj["actions_timings"],
+                    )
+                    failure_run_result_obj["actions_results"] = failure_actions_results
+                    run_results[failure_validation_result_id] = failure_run_result_obj
+
+                    if (
+                        not failure_validation_result.success
+                        and self.stop_on_first_error
+                    ):
+                        break
+
+                warning_expectation_suite_identifier = ExpectationSuiteIdentifier(
+                    expectation_suite_name=base_expectation_suite_name
+                    + self.expectation_suite_name_suffixes[1]
                 )
 
-            if warning_expectation_suite:
-                warning_run_result_obj = {"expectation_suite_severity_level": "warning"}
-                warning_validation_result = batch.validate(
-                    warning_expectation_suite,
-                    result_format=result_format
-                    if result_format
-                    else self.result_format,
-                    evaluation_parameters=evaluation_parameters,
+                warning_validation_result_id = ValidationResultIdentifier(
+                    expectation_suite_identifier=warning_expectation_suite_identifier,
+                    run_id=run_id,
+                    batch_identifier=batch.batch_id,
                 )
-                warning_run_result_obj["validation_result"] = warning_validation_result
-                warning_actions_results = self._run_actions(
-                    batch,
-                    warning_expectation_suite_identifier,
-                    warning_expectation_suite,
-                    warning_validation_result,
-                    run_id,
-                )
-                warning_run_result_obj["actions_results"] = warning_actions_results
-                run_results[warning_validation_result_id] = warning_run_result_obj
+
+                warning_expectation_suite = None
+                try:
+                    warning_expectation_suite = self.data_context.stores[
+                        self.data_context.expectations_store_name
+                    ].get(warning_expectation_suite_identifier)
+                except Exception:
+                    logger.debug(
+                        "Warning expectation suite not found: {}".format(
+                            warning_expectation_suite_identifier
+                        )
+                    )
+
+                if warning_expectation_suite:
+                    warning_run_result_obj = {
+                        "expectation_suite_severity_level": "warning"
+                    }
+                    warning_validation_result = batch.validate(
+                        warning_expectation_suite,
+                        result_format=result_format
+                        if result_format
+                        else self.result_format,
+                        evaluation_parameters=evaluation_parameters,
+                    )
+                    warning_run_result_obj[
+                        "validation_result"
+                    ] = warning_validation_result
+                    warning_run_result_obj["actions_timings"] = {}
+                    warning_actions_results = self._run_actions(
+                        batch,
+                        warning_expectation_suite_identifier,
+                        warning_expectation_suite,
+                        warning_validation_result,
+                        run_id,
+                        actions_timings=warning_run_result_obj["actions_timings"],
+                    )
+                    warning_run_result_obj["actions_results"] = warning_actions_results
+                    run_results[warning_validation_result_id] = warning_run_result_obj
+        except Exception:
+            self._finish_actions(raise_errors=False)
+            raise
+        self._finish_actions()
+
+        self._flush_actions()
 
         validation_operator_result = ValidationOperatorResult(
             run_id=run_id,
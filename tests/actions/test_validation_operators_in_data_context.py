@@ -1,11 +1,18 @@
 import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from unittest import mock
 
 import pytest
 
 from great_expectations.core import expectationSuiteSchema
 from great_expectations.data_context import BaseDataContext
 from great_expectations.data_context.util import file_relative_path
-from great_expectations.exceptions import DataContextError
+from great_expectations.exceptions import DataContextError, InvalidConfigError
+from great_expectations.validation_operators import ActionListValidationOperator
+from great_expectations.validation_operators import util as validation_operators_util
 
 
 @pytest.fixture()
@@ -278,3 +285,419 @@ def test_warning_and_failure_validation_operator(validation_operators_data_conte
     ]
     assert "f1.warning" in suite_names
     assert "f1.failure" in suite_names
+
+
+def test_action_list_operator_builds_deferred_data_docs_once(
+    validation_operators_data_context,
+):
+    data_context = validation_operators_data_context
+    validator_batch_kwargs = data_context.build_batch_kwargs(
+        "my_datasource", "subdir_reader", "f1"
+    )
+    operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=[
+            {
+                "name": "update_data_docs",
+                "action": {"class_name": "UpdateDataDocsAction", "deferred": True},
+            }
+        ],
+        name="deferred_data_docs_operator",
+    )
+
+    with mock.patch.object(
+        data_context, "build_data_docs"
+    ) as build_data_docs, mock.patch.object(
+        data_context, "get_docs_sites_urls", return_value=[]
+    ) as get_docs_sites_urls:
+        operator_result = operator.run(
+            assets_to_validate=[
+                (validator_batch_kwargs, "f1.failure"),
+                (validator_batch_kwargs, "f1.warning"),
+            ],
+            run_id="test-100",
+        )
+
+    validation_result_ids = list(operator_result.run_results.keys())
+    assert len(validation_result_ids) == 2
+    build_data_docs.assert_called_once_with(
+        site_names=None, resource_identifiers=validation_result_ids
+    )
+    assert get_docs_sites_urls.call_count == 2
+    assert all(
+        not call[1]["only_if_exists"] for call in get_docs_sites_urls.call_args_list
+    )
+
+
+class WebhookRequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        time.sleep(self.server.response_delay)
+        content_length = int(self.headers["Content-Length"])
+        self.server.requests.append(
+            (self.path, json.loads(self.rfile.read(content_length)))
+        )
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class WebhookServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def webhook_server():
+    server = WebhookServer(("127.0.0.1", 0), WebhookRequestHandler)
+    server.requests = []
+    server.response_delay = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _build_async_action_list(webhook_server):
+    url = "http://{}:{}".format(*webhook_server.server_address)
+    return [
+        {
+            "name": "store_validation_result",
+            "action": {"class_name": "StoreValidationResultAction"},
+        },
+        {
+            "name": "notify_team",
+            "depends_on": ["store_validation_result"],
+            "action": {
+                "class_name": "SlackNotificationAction",
+                "slack_webhook": url + "/team",
+                "renderer": {
+                    "module_name": "great_expectations.render.renderer.slack_renderer",
+                    "class_name": "SlackRenderer",
+                },
+            },
+        },
+        {
+            "name": "notify_oncall",
+            "action": {
+                "class_name": "SlackNotificationAction",
+                "slack_webhook": url + "/oncall",
+                "renderer": {
+                    "module_name": "great_expectations.render.renderer.slack_renderer",
+                    "class_name": "SlackRenderer",
+                },
+            },
+        },
+    ]
+
+
+def test_action_list_operator_runs_actions_asynchronously(
+    validation_operators_data_context, webhook_server
+):
+    data_context = validation_operators_data_context
+    webhook_server.response_delay = 0.5
+    validator_batch_kwargs = data_context.build_batch_kwargs(
+        "my_datasource", "subdir_reader", "f1"
+    )
+    operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=_build_async_action_list(webhook_server),
+        name="async_operator",
+        max_action_workers=4,
+    )
+    assert operator.validation_operator_config["kwargs"]["max_action_workers"] == 4
+
+    start = time.perf_counter()
+    operator_result = operator.run(
+        assets_to_validate=[
+            (validator_batch_kwargs, "f1.failure"),
+            (validator_batch_kwargs, "f1.warning"),
+        ],
+        run_id="test-100",
+    )
+    # Run one after the other, the four notifications would take two seconds
+    assert time.perf_counter() - start < 1.5
+
+    assert len(webhook_server.requests) == 4
+    assert len(data_context.validations_store.list_keys()) == 2
+    for run_result in operator_result.run_results.values():
+        assert set(run_result["actions_results"]) == {
+            "store_validation_result",
+            "notify_team",
+            "notify_oncall",
+        }
+        assert (
+            run_result["actions_results"]["notify_team"]["slack_notification_result"]
+            == "Slack notification succeeded."
+        )
+        assert set(run_result["actions_timings"]) == set(run_result["actions_results"])
+        assert run_result["actions_timings"]["notify_oncall"] >= 0.5
+
+
+def test_action_list_operator_does_not_run_actions_after_failed_dependencies(
+    validation_operators_data_context, webhook_server
+):
+    data_context = validation_operators_data_context
+    validator_batch_kwargs = data_context.build_batch_kwargs(
+        "my_datasource", "subdir_reader", "f1"
+    )
+    operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=_build_async_action_list(webhook_server),
+        name="async_operator",
+        max_action_workers=2,
+    )
+
+    with mock.patch.object(
+        operator.actions["store_validation_result"],
+        "run",
+        side_effect=ValueError("Store unavailable"),
+    ):
+        with pytest.raises(ValueError, match="Store unavailable"):
+            operator.run(
+                assets_to_validate=[(validator_batch_kwargs, "f1.failure")],
+                run_id="test-100",
+            )
+    assert [path for path, _ in webhook_server.requests] == ["/oncall"]
+
+
+def test_action_list_operator_rejects_unknown_action_dependencies(
+    validation_operators_data_context,
+):
+    with pytest.raises(InvalidConfigError):
+        ActionListValidationOperator(
+            data_context=validation_operators_data_context,
+            action_list=[
+                {
+                    "name": "update_data_docs",
+                    "depends_on": ["store_validation_result"],
+                    "action": {"class_name": "UpdateDataDocsAction"},
+                },
+                {
+                    "name": "store_validation_result",
+                    "action": {"class_name": "StoreValidationResultAction"},
+                },
+            ],
+            name="async_operator",
+        )
+
+
+def test_action_list_operator_validates_next_batch_while_notifications_run(
+    validation_operators_data_context, webhook_server
+):
+    data_context = validation_operators_data_context
+    webhook_server.response_delay = 0.2
+    validator_batch_kwargs = data_context.build_batch_kwargs(
+        "my_datasource", "subdir_reader", "f1"
+    )
+    operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=_build_async_action_list(webhook_server),
+        name="async_operator",
+        max_action_workers=4,
+    )
+
+    requests_sent_before_batches = []
+    build_batch_from_item = operator._build_batch_from_item
+
+    def _build_batch_from_item(item):
+        requests_sent_before_batches.append(len(webhook_server.requests))
+        return build_batch_from_item(item)
+
+    with mock.patch.object(
+        operator, "_build_batch_from_item", side_effect=_build_batch_from_item
+    ):
+        operator.run(
+            assets_to_validate=[
+                (validator_batch_kwargs, "f1.failure"),
+                (validator_batch_kwargs, "f1.warning"),
+            ],
+            run_id="test-100",
+        )
+    assert requests_sent_before_batches == [0, 0]
+    assert len(webhook_server.requests) == 4
+
+
+def test_action_list_operator_waits_for_evaluation_parameters_before_validating_next_batch(
+    validation_operators_data_context, webhook_server
+):
+    data_context = validation_operators_data_context
+    webhook_server.response_delay = 0.2
+    validator_batch_kwargs = data_context.build_batch_kwargs(
+        "my_datasource", "subdir_reader", "f1"
+    )
+    operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=_build_async_action_list(webhook_server)
+        + [
+            {
+                "name": "store_evaluation_params",
+                "action": {"class_name": "StoreEvaluationParametersAction"},
+            }
+        ],
+        name="async_operator",
+        max_action_workers=4,
+    )
+
+    stored_evaluation_parameters = []
+    store_evaluation_parameters = operator.actions["store_evaluation_params"].run
+
+    def _store_evaluation_parameters(**kwargs):
+        time.sleep(0.1)
+        store_evaluation_parameters(**kwargs)
+        stored_evaluation_parameters.append(None)
+
+    stored_evaluation_parameters_before_batches = []
+    build_batch_from_item = operator._build_batch_from_item
+
+    def _build_batch_from_item(item):
+        stored_evaluation_parameters_before_batches.append(
+            len(stored_evaluation_parameters)
+        )
+        return build_batch_from_item(item)
+
+    with mock.patch.object(
+        operator.actions["store_evaluation_params"],
+        "run",
+        side_effect=_store_evaluation_parameters,
+    ), mock.patch.object(
+        operator, "_build_batch_from_item", side_effect=_build_batch_from_item
+    ):
+        operator_result = operator.run(
+            assets_to_validate=[
+                (validator_batch_kwargs, "f1.failure"),
+                (validator_batch_kwargs, "f1.warning"),
+            ],
+            run_id="test-100",
+        )
+    assert stored_evaluation_parameters_before_batches == [0, 1]
+    assert len(webhook_server.requests) == 4
+    for run_result in operator_result.run_results.values():
+        assert set(run_result["actions_results"]) == {
+            "store_validation_result",
+            "notify_team",
+            "notify_oncall",
+            "store_evaluation_params",
+        }
+
+
+def test_action_list_operator_shuts_action_executor_down_when_validation_fails(
+    validation_operators_data_context, webhook_server
+):
+    data_context = validation_operators_data_context
+    validator_batch_kwargs = data_context.build_batch_kwargs(
+        "my_datasource", "subdir_reader", "f1"
+    )
+    operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=_build_async_action_list(webhook_server),
+        name="async_operator",
+        max_action_workers=2,
+    )
+
+    build_batch_from_item = operator._build_batch_from_item
+    batches = []
+
+    def _build_batch_from_item(item):
+        batch = build_batch_from_item(item)
+        if batches:
+            batch.validate = mock.Mock(side_effect=ValueError("Validation failed"))
+        batches.append(batch)
+        return batch
+
+    with mock.patch.object(
+        operator, "_build_batch_from_item", side_effect=_build_batch_from_item
+    ):
+        with pytest.raises(ValueError, match="Validation failed"):
+            operator.run(
+                assets_to_validate=[
+                    (validator_batch_kwargs, "f1.failure"),
+                    (validator_batch_kwargs, "f1.warning"),
+                ],
+                run_id="test-100",
+            )
+    assert operator._action_executor is None
+    assert operator._pending_action_futures == []
+    # The actions of the first batch still ran
+    assert len(webhook_server.requests) == 2
+    assert validation_operators_util._session_users == 0
+    assert validation_operators_util._session is None
+
+
+def test_action_list_operator_notifications_share_one_http_session(
+    validation_operators_data_context, webhook_server
+):
+    data_context = validation_operators_data_context
+    validator_batch_kwargs = data_context.build_batch_kwargs(
+        "my_datasource", "subdir_reader", "f1"
+    )
+    operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=_build_async_action_list(webhook_server),
+        name="async_operator",
+        max_action_workers=4,
+    )
+
+    with mock.patch.object(
+        validation_operators_util.requests, "Session"
+    ) as session_class:
+        session_class.return_value.post.return_value.status_code = 200
+        operator.run(
+            assets_to_validate=[
+                (validator_batch_kwargs, "f1.failure"),
+                (validator_batch_kwargs, "f1.warning"),
+            ],
+            run_id="test-100",
+        )
+    session_class.assert_called_once_with()
+    assert session_class.return_value.post.call_count == 4
+    session_class.return_value.close.assert_called_once_with()
+
+
+def test_action_list_operator_runs_data_context_actions_one_at_a_time(
+    validation_operators_data_context,
+):
+    data_context = validation_operators_data_context
+    validator_batch_kwargs = data_context.build_batch_kwargs(
+        "my_datasource", "subdir_reader", "f1"
+    )
+    operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {"class_name": "StoreValidationResultAction"},
+            },
+            {
+                "name": "store_evaluation_params",
+                "action": {"class_name": "StoreEvaluationParametersAction"},
+            },
+        ],
+        name="async_operator",
+        max_action_workers=2,
+    )
+
+    running_actions = []
+    max_running_actions = []
+
+    def _run_action(**kwargs):
+        running_actions.append(None)
+        max_running_actions.append(len(running_actions))
+        time.sleep(0.2)
+        running_actions.pop()
+
+    with mock.patch.object(
+        operator.actions["store_validation_result"], "run", side_effect=_run_action
+    ), mock.patch.object(
+        operator.actions["store_evaluation_params"], "run", side_effect=_run_action
+    ):
+        operator_result = operator.run(
+            assets_to_validate=[(validator_batch_kwargs, "f1.failure")],
+            run_id="test-100",
+        )
+    assert max_running_actions == [1, 1]
+    # The timings do not include the time an action waited for the other one
+    (run_result,) = operator_result.run_results.values()
+    assert all(timing < 0.35 for timing in run_result["actions_timings"].values())
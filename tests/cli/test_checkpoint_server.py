@@ -0,0 +1,133 @@
+import os
+import socket
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from great_expectations import DataContext
+from great_expectations.cli import cli
+from great_expectations.cli.checkpoint_server import (
+    CheckpointRunner,
+    CheckpointServer,
+    run_checkpoint_on_server,
+)
+from great_expectations.exceptions import CheckpointError, DataContextError
+from tests.cli.test_checkpoint import (  # noqa: F401
+    titanic_checkpoint,
+    titanic_data_context_with_checkpoint_suite_and_stats_enabled,
+)
+
+
+@pytest.fixture
+def checkpoint_server(titanic_data_context_with_checkpoint_suite_and_stats_enabled):
+    context = titanic_data_context_with_checkpoint_suite_and_stats_enabled
+    server = CheckpointServer(
+        CheckpointRunner(context.root_directory, data_context=context), port=0
+    )
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_checkpoint_run_on_server_reuses_the_data_context(
+    checkpoint_server, titanic_data_context_with_checkpoint_suite_and_stats_enabled
+):
+    context = titanic_data_context_with_checkpoint_suite_and_stats_enabled
+    runner = CliRunner(mix_stderr=False)
+    for _ in range(2):
+        result = runner.invoke(
+            cli,
+            f"checkpoint run my_checkpoint --server {checkpoint_server.url}",
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "Validation succeeded!" in result.stdout
+        assert "Titanic.warning" in result.stdout
+    assert checkpoint_server.checkpoint_runner.get_data_context() is context
+    assert len(context.validations_store.list_keys()) == 2
+
+
+def test_checkpoint_run_on_server_with_unknown_checkpoint(checkpoint_server):
+    with pytest.raises(CheckpointError, match="Could not find checkpoint `foo`"):
+        run_checkpoint_on_server("foo", checkpoint_server.url)
+
+    runner = CliRunner(mix_stderr=False)
+    result = runner.invoke(
+        cli,
+        f"checkpoint run foo --server {checkpoint_server.url}",
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 1
+    assert "Could not find checkpoint `foo`" in result.stdout
+
+
+def test_run_checkpoint_on_unreachable_server_raises_error(checkpoint_server):
+    url = checkpoint_server.url
+    checkpoint_server.shutdown()
+    checkpoint_server.server_close()
+    with pytest.raises(DataContextError, match="Could not reach the checkpoint server"):
+        run_checkpoint_on_server("my_checkpoint", url)
+
+
+def test_checkpoint_run_on_server_with_unexpected_error(checkpoint_server, monkeypatch):
+    def run_checkpoint(checkpoint_name):
+        raise KeyError("batch_kwargs")
+
+    monkeypatch.setattr(
+        checkpoint_server.checkpoint_runner, "run_checkpoint", run_checkpoint
+    )
+    with pytest.raises(
+        DataContextError, match="Unexpected error running checkpoint my_checkpoint"
+    ):
+        run_checkpoint_on_server("my_checkpoint", checkpoint_server.url)
+
+    runner = CliRunner(mix_stderr=False)
+    result = runner.invoke(
+        cli,
+        f"checkpoint run my_checkpoint --server {checkpoint_server.url}",
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 1
+    assert "Unexpected error running checkpoint my_checkpoint" in result.stdout
+
+
+def test_run_checkpoint_on_server_closing_the_connection_raises_error():
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+
+    def close_first_connection():
+        connection, _ = listener.accept()
+        connection.recv(65536)
+        connection.close()
+
+    thread = threading.Thread(target=close_first_connection)
+    thread.start()
+    try:
+        with pytest.raises(DataContextError, match="did not send a valid response"):
+            run_checkpoint_on_server(
+                "my_checkpoint", "http://127.0.0.1:{}".format(listener.getsockname()[1])
+            )
+    finally:
+        thread.join()
+        listener.close()
+
+
+def test_checkpoint_runner_reloads_data_context_when_its_config_changes(
+    titanic_data_context_with_checkpoint_suite_and_stats_enabled,
+):
+    context = titanic_data_context_with_checkpoint_suite_and_stats_enabled
+    checkpoint_runner = CheckpointRunner(context.root_directory, data_context=context)
+    assert checkpoint_runner.get_data_context() is context
+    assert checkpoint_runner.run_checkpoint("my_checkpoint").success
+
+    config_path = os.path.join(context.root_directory, DataContext.GE_YML)
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    reloaded_context = checkpoint_runner.get_data_context()
+    assert reloaded_context is not context
+    assert checkpoint_runner.get_data_context() is reloaded_context
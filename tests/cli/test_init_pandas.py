@@ -117,6 +117,7 @@ def test_cli_init_on_new_project(
                     Titanic/
                         warning.html
                 static/
+                    static_assets_manifest.json
                     fonts/
                         HKGrotesk/
                             HKGrotesk-Bold.otf
@@ -592,6 +593,7 @@ def test_cli_init_on_new_project_with_broken_excel_file_try_again_with_different
                     Titanic/
                         warning.html
                 static/
+                    static_assets_manifest.json
                     fonts/
                         HKGrotesk/
                             HKGrotesk-Bold.otf
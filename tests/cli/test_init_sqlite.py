@@ -130,6 +130,7 @@ great_expectations/
                 expectations/
                     warning.html
                 static/
+                    static_assets_manifest.json
                     fonts/
                         HKGrotesk/
                             HKGrotesk-Bold.otf
@@ -3,6 +3,11 @@ from click.testing import CliRunner
 
 from great_expectations import DataContext
 from great_expectations.cli import cli
+from great_expectations.core import ExpectationSuiteValidationResult, RunIdentifier
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
 from great_expectations.exceptions import InvalidConfigurationYamlError
 from tests.cli.utils import assert_no_logging_messages_or_tracebacks
 
@@ -86,3 +91,56 @@ def test_store_list_with_multiple_stores(caplog, empty_data_context):
     assert result.output.strip() == expected_result
 
     assert_no_logging_messages_or_tracebacks(caplog, result)
+
+
+def test_store_apply_retention(caplog, empty_data_context):
+    project_dir = empty_data_context.root_directory
+    context = DataContext(project_dir)
+    context._project_config.stores["validations_store"]["retention_policy"] = {
+        "delete_after_days": 30
+    }
+    context._save_project_config()
+    context = DataContext(project_dir)
+    key = ValidationResultIdentifier(
+        ExpectationSuiteIdentifier("my_suite"),
+        RunIdentifier(run_name="old_run", run_time="2019-01-01T00:00:00"),
+        "batch_id",
+    )
+    context.validations_store.set(key, ExpectationSuiteValidationResult(success=True))
+    runner = CliRunner(mix_stderr=False)
+
+    result = runner.invoke(
+        cli,
+        "store apply-retention --dry-run -d {}".format(project_dir),
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    assert "Would delete 1 validation result" in result.output
+    assert "my_suite/old_run/20190101T000000.000000Z/batch_id" in result.output
+    assert context.validations_store.list_keys() == [key]
+
+    result = runner.invoke(
+        cli, "store apply-retention -d {}".format(project_dir), catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    assert "Deleted 1 validation result" in result.output
+    assert "Archived the full validation results in 1 bundle" in result.output
+    assert context.validations_store.list_keys() == []
+    assert context.validations_store.get_archived(key) == (
+        ExpectationSuiteValidationResult(success=True)
+    )
+
+    assert_no_logging_messages_or_tracebacks(caplog, result)
+
+
+def test_store_apply_retention_without_retention_policy(caplog, empty_data_context):
+    project_dir = empty_data_context.root_directory
+    runner = CliRunner(mix_stderr=False)
+
+    result = runner.invoke(
+        cli, "store apply-retention -d {}".format(project_dir), catch_exceptions=False,
+    )
+    assert result.exit_code == 1
+    assert "The store validations_store has no retention_policy" in result.output
+
+    assert_no_logging_messages_or_tracebacks(caplog, result)
@@ -1,3 +1,5 @@
+from copy import deepcopy
+
 import pytest
 
 from great_expectations.core import ExpectationConfiguration, ExpectationSuite
@@ -410,3 +412,79 @@ def test_remove_all_expectations_of_type(
     assert suite_with_table_and_column_expectations.isEquivalentTo(
         suite_with_column_pair_and_table_expectations
     )
+
+
+@pytest.fixture
+def column_c_expectation():
+    return ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "c", "value_set": [1]},
+    )
+
+
+def test_find_expectation_indexes_tracks_direct_list_mutation(
+    exp1, exp2, column_c_expectation, empty_suite
+):
+    for expectation in [exp1, exp2]:
+        empty_suite.add_expectation(expectation)
+    assert empty_suite.find_expectation_indexes(exp2, "domain") == [1]
+
+    # Mutating or reassigning the public expectations list must not leave a stale index
+    empty_suite.expectations.pop(0)
+    assert empty_suite.find_expectation_indexes(exp2, "domain") == [0]
+    assert empty_suite.find_expectation_indexes(exp1, "domain") == []
+
+    empty_suite.expectations = [column_c_expectation, exp2]
+    assert empty_suite.find_expectation_indexes(exp2, "domain") == [1]
+    assert empty_suite.find_expectation_indexes(column_c_expectation, "domain") == [0]
+
+    empty_suite.expectations.insert(0, exp1)
+    assert empty_suite.find_expectation_indexes(exp2, "domain") == [2]
+    empty_suite.expectations[2] = exp1
+    assert empty_suite.find_expectation_indexes(exp1, "domain") == [0, 2]
+
+
+def test_add_expectation_updates_domain_index_in_place(
+    exp1, exp2, column_c_expectation, empty_suite
+):
+    empty_suite.add_expectation(exp1)
+    index = empty_suite._get_expectation_index()
+
+    # Additions through the CRUD methods update the index rather than rebuilding it
+    empty_suite.add_expectation(column_c_expectation)
+    empty_suite.add_expectation(exp2)
+    assert empty_suite._get_expectation_index() is index
+    assert empty_suite.find_expectation_indexes(exp1, "domain") == [0]
+    assert empty_suite.find_expectation_indexes(exp2, "domain") == [2]
+
+
+def test_patch_and_overwrite_update_domain_index(
+    exp1, exp2, exp4, column_c_expectation, empty_suite
+):
+    empty_suite.add_expectation(deepcopy(exp1))
+    empty_suite.patch_expectation(exp1, "replace", "/column", "b", "domain")
+    assert empty_suite.find_expectation_indexes(exp1, "domain") == []
+    # exp2 has the same domain as the stored expectation after the patch
+    assert empty_suite.find_expectation_indexes(exp2, "domain") == [0]
+
+    empty_suite.add_expectation(column_c_expectation)
+    empty_suite.add_expectation(exp4)
+    assert empty_suite.find_expectations(exp2, "domain") == [exp4]
+    assert empty_suite.find_expectation_indexes(column_c_expectation, "domain") == [1]
+    assert len(empty_suite.expectations) == 2
+
+
+def test_find_expectation_indexes_with_list_domain_kwargs(empty_suite):
+    expectation = ExpectationConfiguration(
+        expectation_type="expect_compound_columns_to_be_unique",
+        kwargs={"column_list": ["a", "b"]},
+    )
+    empty_suite.add_expectation(expectation)
+    empty_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_compound_columns_to_be_unique",
+            kwargs={"column_list": ["a", "c"]},
+        )
+    )
+    assert empty_suite.find_expectation_indexes(expectation, "domain") == [0]
+    assert len(empty_suite.expectations) == 2
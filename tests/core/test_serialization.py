@@ -1,7 +1,11 @@
+import json
 import logging
 from decimal import Decimal
 
+import pytest
+
 from great_expectations.core import convert_to_json_serializable
+from great_expectations.core.util import iter_json_array_spans, iter_json_object_members
 
 
 def test_lossy_serialization_warning(caplog):
@@ -34,3 +38,37 @@ def test_lossy_serialization_warning(caplog):
     assert -1e-55 < Decimal.from_float(f_2) - d < 1e-55
     convert_to_json_serializable(d)
     assert len(caplog.messages) == 0
+
+
+def test_iter_json_members_and_array_spans():
+    serialized = json.dumps(
+        {
+            "success": True,
+            "results": [{"a": ']}\\"', "b": [1, {"c": None}]}, 2.5, "x", []],
+            "meta": {"run_id": {"run_name": "{["}},
+        }
+    )
+    members = {
+        key: (start, end) for key, start, end in iter_json_object_members(serialized)
+    }
+    assert set(members.keys()) == {"success", "results", "meta"}
+    assert json.loads(serialized[slice(*members["meta"])]) == {
+        "run_id": {"run_name": "{["}
+    }
+
+    spans = list(iter_json_array_spans(serialized, members["results"][0]))
+    assert [json.loads(serialized[start:end]) for start, end in spans] == [
+        {"a": ']}\\"', "b": [1, {"c": None}]},
+        2.5,
+        "x",
+        [],
+    ]
+    assert list(iter_json_array_spans("[ ]")) == []
+    assert list(iter_json_object_members(" {}")) == []
+
+
+def test_iter_json_members_and_array_spans_reject_malformed_json():
+    with pytest.raises(ValueError, match="Expected ',' or '}' at index 8"):
+        list(iter_json_object_members('{"a": 1 "b": 2}'))
+    with pytest.raises(ValueError, match="Expected ',' or ']' at index 3"):
+        list(iter_json_array_spans("[1 2]"))
@@ -1,7 +1,11 @@
 import configparser
+import json
 import os
 import shutil
+import threading
+import time
 from copy import deepcopy
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest import mock
 
 import jsonschema
@@ -15,6 +19,7 @@ from great_expectations.core.usage_statistics.schemas import (
     usage_statistics_record_schema,
 )
 from great_expectations.core.usage_statistics.usage_statistics import (
+    UsageStatisticsHandler,
     add_datasource_usage_statistics,
     run_validation_operator_usage_statistics,
 )
@@ -61,6 +66,90 @@ def in_memory_data_context_config_usage_stats_enabled():
     )
 
 
+class UsageStatisticsRequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        time.sleep(self.server.response_delay)
+        content_length = int(self.headers["Content-Length"])
+        self.server.messages.append(json.loads(self.rfile.read(content_length)))
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def usage_statistics_server():
+    server = HTTPServer(("127.0.0.1", 0), UsageStatisticsRequestHandler)
+    server.messages = []
+    server.response_delay = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _build_usage_statistics_handler(server, monkeypatch, **kwargs):
+    # Keep the signal handlers of the test runner
+    monkeypatch.setattr("signal.signal", mock.Mock(side_effect=ValueError))
+    return UsageStatisticsHandler(
+        mock.Mock(instance_id="00000000-0000-0000-0000-000000000002"),
+        "00000000-0000-0000-0000-000000000001",
+        "http://{}:{}/usage_statistics".format(*server.server_address),
+        **kwargs
+    )
+
+
+def _send_usage_messages(handler, count):
+    for _ in range(count):
+        handler.send_usage_message(
+            "data_context.save_expectation_suite",
+            event_payload={
+                "anonymized_expectation_suite_name": "4b6bf73298fcc2db6da929a8f18173f7"
+            },
+            success=True,
+        )
+
+
+def test_usage_statistics_handler_sends_queued_messages(
+    usage_statistics_server, monkeypatch
+):
+    handler = _build_usage_statistics_handler(usage_statistics_server, monkeypatch)
+    _send_usage_messages(handler, 3)
+    # Invalid messages are dropped by the worker
+    handler.send_usage_message("unknown_event")
+    handler._close_worker()
+
+    assert not handler._worker.is_alive()
+    assert len(usage_statistics_server.messages) == 3
+    for message in usage_statistics_server.messages:
+        assert message["event"] == "data_context.save_expectation_suite"
+        assert message["data_context_id"] == "00000000-0000-0000-0000-000000000001"
+        jsonschema.validate(message, usage_statistics_record_schema)
+
+
+def test_usage_statistics_handler_never_waits_for_a_slow_endpoint(
+    usage_statistics_server, monkeypatch
+):
+    usage_statistics_server.response_delay = 0.5
+    handler = _build_usage_statistics_handler(
+        usage_statistics_server,
+        monkeypatch,
+        max_queued_messages=5,
+        shutdown_timeout=0.2,
+    )
+    start = time.monotonic()
+    # Messages beyond the size of the queue are dropped instead of waiting
+    _send_usage_messages(handler, 20)
+    assert time.monotonic() - start < 0.5
+
+    handler._close_worker()
+    assert time.monotonic() - start < 1
+    assert len(usage_statistics_server.messages) < 20
+
+
 def test_consistent_name_anonymization(
     in_memory_data_context_config_usage_stats_enabled, monkeypatch
 ):
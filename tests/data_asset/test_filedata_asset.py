@@ -1,4 +1,9 @@
+import bz2
+import gzip
+import hashlib
+import lzma
 import warnings
+from unittest import mock
 
 import pytest
 
@@ -7,6 +12,7 @@ from great_expectations.core import (
     ExpectationConfiguration,
     ExpectationValidationResult,
 )
+from great_expectations.data_asset import file_data_asset
 from great_expectations.data_context.util import file_relative_path
 
 
@@ -208,3 +214,185 @@ def test_file_format_map_output():
             result_format="JOKE",
             include_config=False,
         )
+
+
+def test_file_lines_map_expectation_evaluates_lines_in_chunks(tmp_path, monkeypatch):
+    file_path = str(tmp_path / "lines.txt")
+    with open(file_path, "w") as f:
+        f.write("header\n" + "a,b\n" * 5 + "\n" + "a\n" * 3)
+    file_dat = ge.data_asset.FileDataAsset(file_path)
+
+    monkeypatch.setattr(ge.data_asset.file_data_asset, "LINES_CHUNK_SIZE", 2)
+    result = file_dat.expect_file_line_regex_match_count_to_equal(
+        regex=",", expected_count=1, skip=1, result_format="COMPLETE"
+    )
+    assert result.result["element_count"] == 9
+    assert result.result["missing_count"] == 1
+    assert result.result["unexpected_list"] == ["a\n"] * 3
+    assert result.result["unexpected_index_list"] == [5, 6, 7]
+
+    # Lines are not skipped if the file has fewer than skip lines
+    result = file_dat.expect_file_line_regex_match_count_to_equal(
+        regex=",", expected_count=1, skip=11, result_format="BASIC"
+    )
+    assert result.result["element_count"] == 10
+    assert result.result["unexpected_count"] == 4
+    assert result.result["partial_unexpected_list"] == ["header\n"] + ["a\n"] * 3
+
+
+def test_validate_reads_file_once_for_line_and_hash_expectations(tmp_path):
+    file_path = str(tmp_path / "lines.txt")
+    with open(file_path, "w") as f:
+        f.write("a,b\n" * 5 + "a\n")
+    file_dat = ge.data_asset.FileDataAsset(file_path)
+    expected_results = [
+        file_dat.expect_file_line_regex_match_count_to_equal(
+            regex=",", expected_count=1
+        ).result,
+        file_dat.expect_file_line_regex_match_count_to_be_between(
+            regex="a", expected_min_count=1, result_format="COMPLETE"
+        ).result,
+        file_dat.expect_file_hash_to_equal(
+            value="0c2a9e2a2fec5ac4e8db8b24f3e7b3c3", hash_alg="md5"
+        ).result,
+    ]
+
+    feed_file = ge.data_asset.FileDataAsset._feed_file
+    with mock.patch.object(
+        ge.data_asset.FileDataAsset, "_feed_file", autospec=True, side_effect=feed_file
+    ) as mock_feed_file, mock.patch("hashlib.new", wraps=hashlib.new) as mock_hash:
+        results = file_dat.validate(catch_exceptions=False).results
+    assert mock_feed_file.call_count == 1
+    assert mock_hash.call_count == 1
+    assert [result.result for result in results] == expected_results
+    assert results[0].result["unexpected_count"] == 1
+    assert results[1].success
+
+
+@pytest.mark.parametrize(
+    "extension,compress",
+    [("gz", gzip.compress), ("bz2", bz2.compress), ("xz", lzma.compress)],
+)
+def test_file_expectations_read_compressed_files(tmp_path, extension, compress):
+    content = b'{"a": 1}\n\n12,ab\n3\n'
+    file_path = str(tmp_path / ("data.json." + extension))
+    with open(file_path, "wb") as f:
+        f.write(compress(content))
+    with open(file_path, "rb") as f:
+        md5 = hashlib.md5(f.read()).hexdigest()
+
+    for compression in ["infer", extension if extension != "gz" else "gzip"]:
+        file_dat = ge.data_asset.FileDataAsset(file_path, compression=compression)
+        result = file_dat.expect_file_line_regex_match_count_to_be_between(
+            regex=r"\d", expected_max_count=1, result_format="COMPLETE"
+        )
+        assert result.result["element_count"] == 4
+        assert result.result["unexpected_list"] == ["12,ab\n"]
+        assert file_dat.expect_file_to_have_valid_table_header(
+            regex=",", skip=2
+        ).success
+        assert not file_dat.expect_file_to_be_valid_json().success
+        # Hashes are computed over the file as stored
+        assert file_dat.expect_file_hash_to_equal(value=md5).success
+        assert [result.success for result in file_dat.validate().results] == [
+            False,
+            True,
+            False,
+            True,
+        ]
+
+    with pytest.raises(ValueError):
+        ge.data_asset.FileDataAsset(file_path, compression="zip")
+
+
+def test_file_lines_map_expectation_block_lines_match_text_lines(tmp_path, monkeypatch):
+    lines = ["a1,b22\n", "  \t\n", "333 a\n", "\n", "é 4\n", "5\r\n", "b, c\r", "6"]
+    file_path = str(tmp_path / "lines.txt")
+    with open(file_path, "w", encoding="utf-8", newline="") as f:
+        f.write("".join(lines))
+    monkeypatch.setattr(file_data_asset, "BLOCK_SIZE", 8)
+    monkeypatch.setattr(
+        file_data_asset.locale, "getpreferredencoding", lambda do_setlocale: "utf-8"
+    )
+
+    def evaluate():
+        file_dat = ge.data_asset.FileDataAsset(file_path)
+        return [
+            file_dat.expect_file_line_regex_match_count_to_be_between(
+                regex=regex,
+                expected_min_count=1,
+                expected_max_count=1,
+                skip=skip,
+                result_format="COMPLETE",
+            ).result
+            for regex in [r"\d+", r"\d", r"[a-c]", r"\w+\s", r"^\d", r"b|\d$"]
+            for skip in [None, 1, 20]
+        ]
+
+    # Lines split from memory mapped blocks match the lines of the file read in text mode
+    results = evaluate()
+    monkeypatch.setattr(file_data_asset, "_LINE_SPLITTABLE_ENCODINGS", [])
+    assert results == evaluate()
+    assert results[0]["unexpected_list"] == ["a1,b22\n", "b, c\n"]
+    assert results[0]["element_count"] == 8
+
+
+@pytest.mark.parametrize(
+    "regex",
+    [
+        r"\d",
+        r"\bab\b",
+        r"^a",
+        r"x*",
+        r"\s+",
+        r"[^,]+",
+        r"b\n?",
+        r"ab\n$|a|b",
+        r"b(?=\n)",
+        r"a\Z",
+        r"(?i)A",
+        "é",
+    ],
+)
+def test_file_line_regex_match_counts_over_blocks_match_counts_over_lines(
+    tmp_path, monkeypatch, regex
+):
+    file_path = str(tmp_path / "lines.txt")
+    with open(file_path, "w", newline="") as f:
+        f.write("ab 12\n  \nb\nab\nxx,a1\n\nb a\n3 ab")
+    monkeypatch.setattr(file_data_asset, "BLOCK_SIZE", 16)
+    monkeypatch.setattr(
+        file_data_asset.locale, "getpreferredencoding", lambda do_setlocale: "utf-8"
+    )
+
+    def evaluate():
+        file_dat = ge.data_asset.FileDataAsset(file_path)
+        return [
+            file_dat.expect_file_line_regex_match_count_to_equal(
+                regex=regex, expected_count=expected_count, result_format="COMPLETE"
+            ).result
+            for expected_count in [0, 1, 2]
+        ]
+
+    results = evaluate()
+    monkeypatch.setattr(file_data_asset, "_LINE_SPLITTABLE_ENCODINGS", [])
+    assert results == evaluate()
+
+
+def test_file_line_regex_match_counts_do_not_decode_ascii_lines(tmp_path, monkeypatch):
+    file_path = str(tmp_path / "lines.txt")
+    with open(file_path, "w") as f:
+        f.write("a1,b22\n  \n333 a\n4")
+    monkeypatch.setattr(
+        file_data_asset.locale, "getpreferredencoding", lambda do_setlocale: "utf-8"
+    )
+    monkeypatch.setattr(file_data_asset, "_decode_lines", None)
+
+    result = ge.data_asset.FileDataAsset(
+        file_path
+    ).expect_file_line_regex_match_count_to_be_between(
+        regex=r"\d+", expected_max_count=1, result_format="COMPLETE"
+    )
+    assert result.result["element_count"] == 4
+    assert result.result["unexpected_list"] == ["a1,b22\n"]
+    assert result.result["unexpected_index_list"] == [0]
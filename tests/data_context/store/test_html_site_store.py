@@ -1,4 +1,6 @@
 import datetime
+import os
+from unittest import mock
 
 import boto3
 import pytest
@@ -164,3 +166,44 @@ def test_HtmlSiteStore_S3_backend():
         .decode("utf-8")
     )
     assert index_content == "index_html_string_content"
+
+
+def test_HtmlSiteStore_copy_static_assets_only_copies_changed_assets(tmp_path_factory,):
+    path = str(tmp_path_factory.mktemp("test_HtmlSiteStore_copy_static_assets__dir"))
+    source_dir = os.path.join(path, "source", "static")
+    os.makedirs(os.path.join(source_dir, "styles"))
+    with open(os.path.join(source_dir, "styles", "a.css"), "w") as f:
+        f.write("a {}")
+    with open(os.path.join(source_dir, "styles", "b.css"), "w") as f:
+        f.write("b {}")
+
+    my_store = HtmlSiteStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "my_store",
+        },
+        runtime_environment={"root_directory": path},
+    )
+    static_assets_store_backend = my_store.store_backends["static_assets"]
+
+    with mock.patch.object(
+        static_assets_store_backend, "set", wraps=static_assets_store_backend.set,
+    ) as set_static_asset:
+        my_store.copy_static_assets(source_dir)
+        # Both assets and the manifest of their hashes are written
+        assert set_static_asset.call_count == 3
+
+        set_static_asset.reset_mock()
+        my_store.copy_static_assets(source_dir)
+        assert set_static_asset.call_count == 0
+
+        with open(os.path.join(source_dir, "styles", "b.css"), "w") as f:
+            f.write("b { color: red; }")
+        my_store.copy_static_assets(source_dir)
+        assert [call[0][0] for call in set_static_asset.call_args_list] == [
+            ("static", "styles", "b.css"),
+            HtmlSiteStore.STATIC_ASSETS_MANIFEST_KEY,
+        ]
+
+    with open(os.path.join(path, "my_store", "static", "styles", "b.css")) as f:
+        assert f.read() == "b { color: red; }"
@@ -1,6 +1,14 @@
+import datetime
+from unittest import mock
+
 import pytest
 
+from great_expectations.core import RunIdentifier
+from great_expectations.core.evaluation_parameters import parse_evaluation_parameter
+from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.data_context.store import MetricStore
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.exceptions import StoreError
 
 
 @pytest.fixture(
@@ -41,3 +49,103 @@ def param_store(request, test_backends):
         config_defaults={"module_name": "great_expectations.data_context.store",},
         runtime_environment={},
     )
+
+
+@pytest.fixture(params=["InMemoryStoreBackend", "DatabaseMetricStoreBackend"])
+def metric_store_with_series(request, sa):
+    store_backend = {"class_name": request.param}
+    if request.param == "DatabaseMetricStoreBackend":
+        store_backend["credentials"] = {"url": "sqlite://"}
+    store = MetricStore(store_backend=store_backend)
+    for day, value in enumerate([10, 20, 30, 40], start=1):
+        for expectation_suite_name in ["events.warning", "users.warning"]:
+            store.set(
+                ValidationMetricIdentifier(
+                    run_id=RunIdentifier(
+                        run_name="run_{}".format(day),
+                        run_time=datetime.datetime(2020, 1, day),
+                    ),
+                    data_asset_name="events",
+                    expectation_suite_identifier=expectation_suite_name,
+                    metric_name="expect_table_row_count_to_be_between.result.observed_value",
+                    metric_kwargs_id=None,
+                ),
+                value if expectation_suite_name == "events.warning" else -value,
+            )
+    return store
+
+
+def test_metric_store_get_metric_series(metric_store_with_series):
+    store = metric_store_with_series
+    metric_name = "expect_table_row_count_to_be_between.result.observed_value"
+    series = store.get_metric_series(
+        metric_name, expectation_suite_name="events.warning"
+    )
+    assert [value for _, value in series] == [10, 20, 30, 40]
+    assert [key.run_id.run_name for key, _ in series] == [
+        "run_1",
+        "run_2",
+        "run_3",
+        "run_4",
+    ]
+    assert series[0][0].expectation_suite_identifier.expectation_suite_name == (
+        "events.warning"
+    )
+
+    assert [
+        value
+        for _, value in store.get_metric_series(
+            metric_name, expectation_suite_name="events.warning", limit=2
+        )
+    ] == [30, 40]
+    assert [
+        value
+        for _, value in store.get_metric_series(
+            metric_name,
+            expectation_suite_name="users.warning",
+            start_time="2020-01-02",
+            end_time=datetime.datetime(2020, 1, 3),
+        )
+    ] == [-20, -30]
+    assert len(store.get_metric_series(metric_name)) == 8
+    assert store.get_metric_series("statistics.evaluated_expectations") == []
+
+    # The metric values are still available to the key-value API of the store
+    key = series[0][0]
+    assert store.has_key(key)
+    assert store.get(key) == 10
+    assert len(store.list_keys()) == 8
+
+
+def test_metric_store_get_query_result(metric_store_with_series):
+    store = metric_store_with_series
+    metric_name = "expect_table_row_count_to_be_between.result.observed_value"
+    assert store.get_query_result(
+        metric_name, "expectation_suite_name=events.warning&limit=3"
+    ) == [20, 30, 40]
+    assert (
+        store.get_query_result(
+            metric_name,
+            {
+                "expectation_suite_name": "events.warning",
+                "limit": 2,
+                "aggregate": "mean",
+            },
+        )
+        == 35
+    )
+    with pytest.raises(StoreError):
+        store.get_query_result(metric_name, "aggregate=median")
+
+
+def test_store_urn_evaluation_parameter_reads_metric_series(metric_store_with_series):
+    context = mock.Mock(stores={"metric_store": metric_store_with_series})
+    assert (
+        parse_evaluation_parameter(
+            "urn:great_expectations:stores:metric_store:"
+            "expect_table_row_count_to_be_between.result.observed_value:"
+            "expectation_suite_name=events.warning&data_asset_name=events&aggregate=max",
+            data_context=context,
+        )
+        == 40
+    )
@@ -5,12 +5,19 @@ import pytest
 from freezegun import freeze_time
 from moto import mock_s3
 
-from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core import (
+    ExpectationConfiguration,
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+    LazyExpectationSuiteValidationResult,
+    RunIdentifier,
+)
 from great_expectations.data_context.store import ValidationsStore
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
+from great_expectations.exceptions import StoreConfigurationError, StoreError
 from great_expectations.util import gen_directory_tree_str
 
 
@@ -240,3 +247,182 @@ def test_ValidationsStore_with_DatabaseStoreBackend(sa):
         ns_1,
         ns_2,
     }
+
+
+def test_ValidationsStore_lazy_get():
+    my_store = ValidationsStore()
+    ns_1 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-100",
+        batch_identifier="batch_id",
+    )
+    validation_result = ExpectationSuiteValidationResult(
+        success=False,
+        results=[
+            ExpectationValidationResult(
+                success=True,
+                expectation_config=ExpectationConfiguration(
+                    expectation_type="expect_table_row_count_to_equal",
+                    kwargs={"value": 3},
+                ),
+                result={"observed_value": 3},
+                exception_info={"raised_exception": False},
+            ),
+            ExpectationValidationResult(
+                success=False,
+                expectation_config=ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_be_in_set",
+                    kwargs={"column": "a", "value_set": ["x", 'y, \\"z]']},
+                ),
+                result={"unexpected_count": 1, "partial_unexpected_list": ["}"]},
+                exception_info={"raised_exception": False},
+            ),
+        ],
+        statistics={"evaluated_expectations": 2, "successful_expectations": 1},
+        meta={"batch_kwargs": {"data_asset_name": "my_asset"}},
+    )
+    my_store.set(ns_1, validation_result)
+
+    lazy_result = my_store.get(ns_1, lazy=True)
+    assert isinstance(lazy_result, LazyExpectationSuiteValidationResult)
+    assert lazy_result.success is False
+    assert lazy_result.meta["batch_kwargs"]["data_asset_name"] == "my_asset"
+    assert lazy_result.get_metric("statistics.evaluated_expectations") == 2
+    assert (
+        lazy_result.get_metric(
+            "expect_column_values_to_be_in_set.result.unexpected_count", column="a"
+        )
+        == 1
+    )
+    # Only the result needed for the metric has been decoded
+    assert list(lazy_result._decoded_results.keys()) == [1]
+    assert lazy_result._results is None
+
+    assert lazy_result == validation_result
+    assert lazy_result == my_store.get(ns_1)
+    assert lazy_result.to_json_dict() == validation_result.to_json_dict()
+
+
+def test_ValidationsStore_apply_retention_policy(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_ValidationsStore_apply_retention_policy"))
+    my_store = ValidationsStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "validations/",
+        },
+        runtime_environment={"root_directory": path},
+        retention_policy={
+            "max_results_per_batch": 1,
+            "delete_after_days": 100,
+            "keep_unsuccessful": True,
+        },
+    )
+    with pytest.raises(StoreError):
+        my_store.get_archived(
+            ValidationResultIdentifier(
+                ExpectationSuiteIdentifier("asset.quarantine"), "prod-0", "batch_id"
+            )
+        )
+
+    def make_validation_result(success):
+        return ExpectationSuiteValidationResult(
+            success=success,
+            results=[
+                ExpectationValidationResult(
+                    success=True,
+                    expectation_config=ExpectationConfiguration(
+                        expectation_type="expect_table_row_count_to_equal",
+                        kwargs={"value": 3},
+                    ),
+                    result={"observed_value": 3},
+                    exception_info={"raised_exception": False},
+                ),
+                ExpectationValidationResult(
+                    success=success,
+                    expectation_config=ExpectationConfiguration(
+                        expectation_type="expect_column_values_to_not_be_null",
+                        kwargs={"column": "a"},
+                    ),
+                    result={"unexpected_count": 0 if success else 1},
+                    exception_info={"raised_exception": False},
+                ),
+            ],
+            statistics={"evaluated_expectations": 2},
+        )
+
+    keys = {}
+    validation_results = {}
+    for run_name, run_time, success in [
+        ("old", "2019-01-01T00:00:00", True),
+        ("old_failed", "2019-01-02T00:00:00", False),
+        ("recent_failed", "2019-09-01T00:00:00", False),
+        ("latest", "2019-09-20T00:00:00", True),
+    ]:
+        keys[run_name] = ValidationResultIdentifier(
+            ExpectationSuiteIdentifier("asset.quarantine"),
+            RunIdentifier(run_name=run_name, run_time=run_time),
+            "batch_id",
+        )
+        validation_results[run_name] = make_validation_result(success)
+        my_store.set(keys[run_name], validation_results[run_name])
+    now = datetime.datetime(2019, 9, 26, tzinfo=datetime.timezone.utc)
+
+    report = my_store.apply_retention_policy(dry_run=True, now=now)
+    assert report["summarized"] == []
+    assert report["deleted"] == [keys["old"]]
+
+    my_store._retention_policy["keep_unsuccessful"] = False
+    report = my_store.apply_retention_policy(dry_run=True, now=now)
+    assert report["summarized"] == [keys["recent_failed"]]
+    assert report["deleted"] == [keys["old"], keys["old_failed"]]
+    assert len(my_store.list_keys()) == 4
+    assert not my_store.archive_store_backend.list_keys()
+
+    report = my_store.apply_retention_policy(max_results=1, now=now)
+    assert report["summarized"] == []
+    assert report["deleted"] == [keys["old"]]
+    assert set(my_store.list_keys()) == {
+        keys["old_failed"],
+        keys["recent_failed"],
+        keys["latest"],
+    }
+    assert my_store.get_archived(keys["old"]) == validation_results["old"]
+
+    report = my_store.apply_retention_policy(now=now)
+    assert report["summarized"] == [keys["recent_failed"]]
+    assert report["deleted"] == [keys["old_failed"]]
+    assert len(report["bundles"]) == 1
+    assert set(my_store.list_keys()) == {keys["recent_failed"], keys["latest"]}
+    assert my_store.get_archived(keys["old_failed"]) == validation_results["old_failed"]
+    summary = my_store.get(keys["recent_failed"])
+    assert summary.success is False
+    assert summary.statistics == {"evaluated_expectations": 2}
+    assert [
+        result.expectation_config.expectation_type for result in summary.results
+    ] == ["expect_column_values_to_not_be_null"]
+    assert summary.meta["validation_result_retention"]["archive_bundle"] == list(
+        report["bundles"][0]
+    )
+    assert (
+        my_store.get_archived(keys["recent_failed"])
+        == validation_results["recent_failed"]
+    )
+    assert my_store.get(keys["latest"]) == validation_results["latest"]
+
+    # The summaries are not read again, and there is nothing left to do
+    assert my_store.apply_retention_policy(now=now) == {
+        "summarized": [],
+        "deleted": [],
+        "bundles": [],
+    }
+    assert len(my_store.archive_store_backend.list_keys()) == 3
+    assert my_store.get_archived(keys["old"]) == validation_results["old"]
+
+
+def test_ValidationsStore_retention_policy_config():
+    with pytest.raises(StoreConfigurationError):
+        ValidationsStore(retention_policy={"max_age": 30})
+
+    my_store = ValidationsStore(retention_policy={"max_age_days": 30})
+    with pytest.raises(StoreError):
+        my_store.apply_retention_policy()
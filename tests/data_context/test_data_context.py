@@ -216,6 +216,188 @@ def test_compile_evaluation_parameter_dependencies(
     )
 
 
+def _add_evaluation_parameter_dependency_store(context):
+    return context.add_store(
+        "evaluation_parameter_dependency_store",
+        {
+            "class_name": "EvaluationParameterDependencyStore",
+            "store_backend": {
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": "uncommitted/evaluation_parameter_dependencies/",
+            },
+        },
+    )
+
+
+def test_evaluation_parameter_dependency_index_is_maintained_incrementally(
+    data_context_parameterized_expectation_suite,
+):
+    context = data_context_parameterized_expectation_suite
+    _add_evaluation_parameter_dependency_store(context)
+    context._compile_evaluation_parameter_dependencies()
+    expected_dependencies = context._evaluation_parameter_dependencies
+    assert "source_patient_data.default" in expected_dependencies
+
+    # A new context loads the stored index instead of loading every expectation suite
+    context = DataContext(context.root_directory)
+    evaluation_parameter_dependency_store = _add_evaluation_parameter_dependency_store(
+        context
+    )
+    expectations_store = context.stores[context.expectations_store_name]
+    with mock.patch.object(
+        expectations_store, "get", wraps=expectations_store.get
+    ) as get_expectation_suite:
+        context._compile_evaluation_parameter_dependencies()
+    assert get_expectation_suite.call_count == 0
+    assert context._evaluation_parameter_dependencies == expected_dependencies
+
+    # Saved and deleted expectation suites update the stored index
+    suite = ExpectationSuite(expectation_suite_name="my_dag_node.downstream")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={
+                "min_value": {
+                    "$PARAMETER": "urn:great_expectations:validations:upstream.default:statistics.evaluated_expectations"
+                }
+            },
+        )
+    )
+    context.save_expectation_suite(suite)
+    index = evaluation_parameter_dependency_store.get_index()
+    assert index["expectation_suites"]["my_dag_node.downstream"]["dependencies"] == {
+        "upstream.default": ["statistics.evaluated_expectations"]
+    }
+    assert context._evaluation_parameter_dependencies["upstream.default"] == [
+        "statistics.evaluated_expectations"
+    ]
+
+    # An expectation suite changed outside of the context is indexed again when the context loads it
+    suite.expectations[0].kwargs["min_value"][
+        "$PARAMETER"
+    ] = "urn:great_expectations:validations:other_upstream.default:statistics.evaluated_expectations"
+    expectations_store.set(ExpectationSuiteIdentifier("my_dag_node.downstream"), suite)
+    context.get_expectation_suite("my_dag_node.downstream")
+    assert "upstream.default" not in context._evaluation_parameter_dependencies
+    assert (
+        "other_upstream.default"
+        in evaluation_parameter_dependency_store.get_index()["expectation_suites"][
+            "my_dag_node.downstream"
+        ]["dependencies"]
+    )
+
+    context.delete_expectation_suite("my_dag_node.downstream")
+    assert "my_dag_node.downstream" not in (
+        evaluation_parameter_dependency_store.get_index()["expectation_suites"]
+    )
+    assert context._evaluation_parameter_dependencies == expected_dependencies
+
+
+def test_evaluation_parameter_dependency_index_is_checked_against_expectation_suite_etags(
+    data_context_parameterized_expectation_suite,
+):
+    context = data_context_parameterized_expectation_suite
+    _add_evaluation_parameter_dependency_store(context)
+    context._compile_evaluation_parameter_dependencies()
+    assert "other_upstream.default" not in context._evaluation_parameter_dependencies
+
+    # Edit an expectation suite outside of the context
+    suite = context.get_expectation_suite("my_dag_node.default")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={
+                "min_value": {
+                    "$PARAMETER": "urn:great_expectations:validations:other_upstream.default:statistics.evaluated_expectations"
+                }
+            },
+        )
+    )
+    context.stores[context.expectations_store_name].set(
+        ExpectationSuiteIdentifier("my_dag_node.default"), suite
+    )
+
+    context = DataContext(context.root_directory)
+    expectations_store = context.stores[context.expectations_store_name]
+    with mock.patch.object(
+        expectations_store, "get", wraps=expectations_store.get
+    ) as get_expectation_suite:
+        context._compile_evaluation_parameter_dependencies()
+    assert get_expectation_suite.call_args_list == [
+        mock.call(ExpectationSuiteIdentifier("my_dag_node.default"))
+    ]
+    assert context._evaluation_parameter_dependencies["other_upstream.default"] == [
+        "statistics.evaluated_expectations"
+    ]
+
+
+def test_saving_expectation_suite_updates_stored_index_without_listing_expectation_suites(
+    data_context_parameterized_expectation_suite,
+):
+    context = data_context_parameterized_expectation_suite
+    _add_evaluation_parameter_dependency_store(context)
+    context._compile_evaluation_parameter_dependencies()
+
+    context = DataContext(context.root_directory)
+    evaluation_parameter_dependency_store = context.stores[
+        "evaluation_parameter_dependency_store"
+    ]
+    expectations_store = context.stores[context.expectations_store_name]
+    suite = ExpectationSuite(expectation_suite_name="my_dag_node.downstream")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={
+                "min_value": {
+                    "$PARAMETER": "urn:great_expectations:validations:upstream.default:statistics.evaluated_expectations"
+                }
+            },
+        )
+    )
+    with mock.patch.object(
+        expectations_store.store_backend,
+        "list_keys",
+        wraps=expectations_store.store_backend.list_keys,
+    ) as list_keys:
+        context.save_expectation_suite(suite)
+    assert list_keys.call_count == 0
+    assert context._evaluation_parameter_dependencies_compiled is False
+
+    indexed_expectation_suite = evaluation_parameter_dependency_store.get_index()[
+        "expectation_suites"
+    ]["my_dag_node.downstream"]
+    assert indexed_expectation_suite["etag"] == expectations_store.get_etag(
+        ExpectationSuiteIdentifier("my_dag_node.downstream")
+    )
+    assert indexed_expectation_suite["dependencies"] == {
+        "upstream.default": ["statistics.evaluated_expectations"]
+    }
+
+
+def test_loading_expectation_suites_reads_stored_index_once(
+    data_context_parameterized_expectation_suite,
+):
+    context = data_context_parameterized_expectation_suite
+    _add_evaluation_parameter_dependency_store(context)
+    context._compile_evaluation_parameter_dependencies()
+    expected_dependencies = context._evaluation_parameter_dependencies
+
+    context = DataContext(context.root_directory)
+    evaluation_parameter_dependency_store = context.stores[
+        "evaluation_parameter_dependency_store"
+    ]
+    with mock.patch.object(
+        evaluation_parameter_dependency_store,
+        "get_index",
+        wraps=evaluation_parameter_dependency_store.get_index,
+    ) as get_index:
+        for _ in range(3):
+            context.get_expectation_suite("my_dag_node.default")
+        context._compile_evaluation_parameter_dependencies()
+    assert get_index.call_count == 1
+    assert context._evaluation_parameter_dependencies == expected_dependencies
+
+
 def test_list_datasources(data_context_parameterized_expectation_suite):
     datasources = data_context_parameterized_expectation_suite.list_datasources()
 
@@ -510,6 +692,7 @@ data_docs/
                     Titanic/
                         BasicDatasetProfiler.html
         static/
+            static_assets_manifest.json
             fonts/
                 HKGrotesk/
                     HKGrotesk-Bold.otf
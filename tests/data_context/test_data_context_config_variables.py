@@ -486,3 +486,61 @@ def test_escape_all_config_variables(empty_data_context_with_config_variables):
         )
         == escaped_value_str_custom_escape_string2
     )
+
+
+def test_config_with_variables_substituted_is_cached_until_its_inputs_change(
+    data_context_with_variables_in_config, monkeypatch
+):
+    context = data_context_with_variables_in_config
+
+    def reader_options():
+        return context._project_config_with_variables_substituted.datasources[
+            "mydatasource"
+        ]["batch_kwargs_generators"]["mygenerator"]["reader_options"]
+
+    substituted_config = context._project_config_with_variables_substituted
+    load_config_variables_file = context._load_config_variables_file
+    load_count = 0
+
+    def counting_load_config_variables_file():
+        nonlocal load_count
+        load_count += 1
+        return load_config_variables_file()
+
+    monkeypatch.setattr(
+        context, "_load_config_variables_file", counting_load_config_variables_file
+    )
+    assert context._project_config_with_variables_substituted is substituted_config
+    assert context.expectations_store_name == substituted_config.expectations_store_name
+    context.instance_id
+    assert load_count == 0
+
+    # changes to the project config made by the data context
+    datasource_config = dataContextConfigSchema.dump(context.get_config())[
+        "datasources"
+    ]["mydatasource"]
+    datasource_config["batch_kwargs_generators"]["mygenerator"]["reader_options"][
+        "test_variable_sub1"
+    ] = "${cached_config_variable}"
+    context.add_datasource("mydatasource", initialize=False, **datasource_config)
+    with pytest.raises(MissingConfigVariableError):
+        reader_options()
+
+    # changes to the config variables file
+    context.save_config_variable("cached_config_variable", "from_file")
+    assert reader_options()["test_variable_sub1"] == "from_file"
+    # once to save the variable, once to read the saved file
+    assert load_count == 2
+
+    # changes to the environment
+    monkeypatch.setenv("cached_config_variable", "from_env")
+    assert reader_options()["test_variable_sub1"] == "from_env"
+    assert load_count == 2
+    context.runtime_environment["cached_config_variable"] = "from_runtime_environment"
+    assert reader_options()["test_variable_sub1"] == "from_runtime_environment"
+
+    # substituting another config is never cached
+    config = DataContextConfig(**dataContextConfigSchema.dump(context.get_config()))
+    assert context.get_config_with_variables_substituted(
+        config
+    ) is not context.get_config_with_variables_substituted(config)
@@ -1,11 +1,19 @@
+import copy
 import datetime
 import json
+from unittest import mock
 
+import dateutil.parser
+import numpy as np
 import pandas as pd
 import pytest
 
 import great_expectations as ge
-from great_expectations.core import ExpectationConfiguration, expectationSuiteSchema
+from great_expectations.core import (
+    ExpectationConfiguration,
+    ExpectationSuite,
+    expectationSuiteSchema,
+)
 from great_expectations.profile import ColumnsExistProfiler
 from tests.test_utils import expectationValidationResultSchema
 
@@ -901,3 +909,166 @@ def test_expect_values_quantiles_to_be_between():
             "A", {"quantiles": quantiles, "value_ranges": value_ranges,}
         )
         assert validation.success is success
+
+
+def test_string_expectations_share_string_conversion():
+    df = ge.dataset.PandasDataset({"a": [1, 12, 123, 1234], "b": ["x", "y", "z", "w"]})
+    assert df.expect_column_values_to_match_regex("a", r"^1").success
+    converted = df._column_str_cache["a"][1]
+    assert df.expect_column_value_lengths_to_be_between("a", 3, 5).result[
+        "partial_unexpected_list"
+    ] == [1, 12]
+    assert df._column_str_cache["a"][1] is converted
+
+    res = df.expect_column_values_to_match_regex_list(
+        "a", [r"^1", r"2"], match_on="all"
+    )
+    assert res.result["partial_unexpected_list"] == [1]
+    res = df.expect_column_values_to_not_match_regex_list("a", [r"3", r"(\d)\1"])
+    assert res.result["partial_unexpected_list"] == [123, 1234]
+    assert df._column_str_cache["a"][1] is converted
+
+    # Modifying the column invalidates its cached conversion
+    df["a"] = ["x", "xy", "xyz", "xyzw"]
+    assert df.expect_column_values_to_match_regex("a", r"^x").success
+    assert df._column_str_cache["a"][1] is not converted
+
+
+def test_map_expectations_evaluate_distinct_values_once():
+    # Each column has at most 4 distinct values in 70 rows
+    values = ["a", "bb", None, "a", "ccc", "bb", "a"] * 10
+    df = ge.dataset.PandasDataset(
+        {
+            "str": values,
+            "cat": pd.Series(values, dtype="category"),
+            "int": [1, 22, 1, 1, 333, 22, 1] * 10,
+            "mixed": [1, 1.0, True, "1", None, 1, "1"] * 10,
+        }
+    )
+    for column in ["str", "cat"]:
+        res = df.expect_column_values_to_be_in_set(
+            column, ["a", "ccc"], result_format="COMPLETE"
+        )
+        assert res.result["unexpected_list"] == ["bb"] * 20
+        assert res.result["unexpected_index_list"][:4] == [1, 5, 8, 12]
+        assert res.result["partial_unexpected_counts"] == [{"value": "bb", "count": 20}]
+        res = df.expect_column_value_lengths_to_be_between(column, 2, 3)
+        assert res.result["unexpected_count"] == 30
+
+    res = df.expect_column_values_to_match_regex("int", r"^\d{1,2}$")
+    assert res.result["partial_unexpected_list"] == [333] * 10
+    # The distinct values are converted to str, not the column
+    assert "int" not in df._column_str_cache
+
+    # Equal values with different string representations are evaluated separately
+    res = df.expect_column_values_to_match_regex(
+        "mixed", r"^1$", result_format="COMPLETE"
+    )
+    assert res.result["unexpected_list"] == [1.0, True] * 10
+
+    with mock.patch("json.loads", wraps=json.loads) as mock_loads:
+        df.expect_column_values_to_be_json_parseable("str")
+        assert mock_loads.call_count == 3
+
+
+def test_map_expectations_evaluate_high_cardinality_columns_row_by_row():
+    df = ge.dataset.PandasDataset({"id": ["id_{}".format(i) for i in range(100)]})
+    with mock.patch("pandas.factorize", wraps=pd.factorize) as mock_factorize:
+        res = df.expect_column_values_to_match_regex("id", r"^id_\d$")
+        assert mock_factorize.call_count == 0
+    assert res.result["unexpected_count"] == 90
+    # The row by row path shares the string conversion of the column
+    assert "id" in df._column_str_cache
+
+    with mock.patch("json.loads", wraps=json.loads) as mock_loads:
+        df.expect_column_values_to_be_json_parseable("id")
+        assert mock_loads.call_count == 100
+
+
+def test_datetime_expectations_share_parsed_column():
+    df = ge.dataset.PandasDataset(
+        {
+            "a": ["2020-01-01", "2020-01-02", None, "January 5, 2020"],
+            "b": ["2019-12-31", "2020-01-01", "2020-01-03", "2020-01-04"],
+        }
+    )
+    with mock.patch(
+        "great_expectations.dataset.util.parse", wraps=dateutil.parser.parse
+    ) as mock_parse:
+        assert df.expect_column_values_to_be_increasing(
+            "a", parse_strings_as_datetimes=True
+        ).success
+        parsed = df._column_datetime_cache["a"][1]
+        assert df.expect_column_values_to_be_between(
+            "a", "2020-01-01", "2020-01-04", parse_strings_as_datetimes=True
+        ).result["partial_unexpected_list"] == ["January 5, 2020"]
+        assert df.get_column_max("a", parse_strings_as_datetimes=True) == pd.Timestamp(
+            "2020-01-05"
+        )
+        res = df.expect_column_pair_values_A_to_be_greater_than_B(
+            "a", "b", parse_strings_as_datetimes=True
+        )
+        assert res.result["partial_unexpected_list"] == [(None, "2020-01-03")]
+        assert df._column_datetime_cache["a"][1] is parsed
+        # pandas parsed every value, so none were left for dateutil
+        assert mock_parse.call_count == 0
+
+
+def test_expect_column_pair_values_to_be_in_set_with_missing_values():
+    df = ge.dataset.PandasDataset(
+        {"a": [1, 2, None, 1, 3], "b": ["x", None, "y", "y", None]}
+    )
+    res = df.expect_column_pair_values_to_be_in_set(
+        "a",
+        "b",
+        [(1, "x"), (2, None), (None, "y"), (1, "x")],
+        ignore_row_if="never",
+        result_format="COMPLETE",
+    )
+    assert res.result["unexpected_index_list"] == [3, 4]
+
+
+def test_expect_select_column_values_to_be_unique_within_record_compares_all_columns():
+    df = ge.dataset.PandasDataset(
+        {"a": [1, 1, None, 1], "b": [2, 1, None, 2], "c": [1, 3, 3, 3]}
+    )
+    res = df.expect_select_column_values_to_be_unique_within_record(
+        ["a", "b", "c"], result_format="COMPLETE"
+    )
+    # Missing values are equal to each other
+    assert res.result["unexpected_index_list"] == [0, 1, 2]
+
+
+def test_row_condition_does_not_copy_expectation_suite():
+    df = ge.dataset.PandasDataset({"a": [1, 2, 3, 4], "b": [1, 1, 2, 2]})
+    for value in range(50):
+        df.expect_column_values_to_be_in_set("a", [1, 2, 3, 4, value])
+
+    with mock.patch(
+        "great_expectations.data_asset.data_asset.copy.deepcopy", wraps=copy.deepcopy,
+    ) as mock_deepcopy:
+        assert df.expect_column_values_to_be_in_set(
+            "a", [1, 2], row_condition="b==1", condition_parser="pandas",
+        ).success
+        assert df.expect_column_pair_values_A_to_be_greater_than_B(
+            "a", "b", or_equal=True, row_condition="b==2"
+        ).success
+        assert df.expect_column_max_to_be_between(
+            "a", 1, 2, row_condition="b==1", condition_parser="pandas"
+        ).success
+        assert not any(
+            isinstance(call[0][0], ExpectationSuite)
+            for call in mock_deepcopy.call_args_list
+        )
+
+    # Subsets created by users still carry the expectations
+    assert len(df[df["b"] == 1].get_expectation_suite().expectations) == len(
+        df.get_expectation_suite().expectations
+    )
+
+
+def test_pandas_dataset_does_not_copy_data():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [1.0, 2.0, 3.0]})
+    dataset = ge.dataset.PandasDataset(df)
+    assert np.shares_memory(dataset["a"].values, df["a"].values)
+    assert np.shares_memory(dataset["b"].values, df["b"].values)
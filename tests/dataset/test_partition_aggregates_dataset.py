@@ -0,0 +1,241 @@
+import datetime
+import os
+
+import pandas as pd
+import pytest
+
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from great_expectations.data_context.store import PartitionAggregateStore
+from great_expectations.data_context.types.resource_identifiers import (
+    PartitionAggregatesIdentifier,
+)
+from great_expectations.dataset import PandasDataset, PartitionAggregatesDataset
+
+
+@pytest.fixture
+def partitions():
+    return {
+        "20200101": pd.DataFrame({"x": [1, 2, 3, None], "s": ["a", "b", "a", "c"]}),
+        "20200102": pd.DataFrame({"x": [4, 5, 60], "s": ["a", "zz", "b"]}),
+    }
+
+
+def _build_partition_aggregates_dataset(partitions, store, loaded_partition_ids):
+    def load_partition_batch(partition_id):
+        loaded_partition_ids.append(partition_id)
+        return PandasDataset(partitions[partition_id])
+
+    partition_ids = sorted(partitions)
+    return PartitionAggregatesDataset(
+        partition_ids,
+        load_partition_batch,
+        partition_aggregate_store=store,
+        partition_aggregate_keys=[
+            PartitionAggregatesIdentifier("ds", "generator", "asset", partition_id)
+            for partition_id in partition_ids
+        ],
+    )
+
+
+def _add_expectations(dataset):
+    dataset.expect_table_row_count_to_be_between(5, 10)
+    dataset.expect_table_columns_to_match_ordered_list(["x", "s"])
+    dataset.expect_column_mean_to_be_between("x", 0, 100)
+    dataset.expect_column_max_to_be_between("x", 0, 10)
+    dataset.expect_column_sum_to_be_between("x", 0, 100)
+    dataset.expect_column_values_to_be_in_set("s", ["a", "b"], mostly=0.5)
+    dataset.expect_column_values_to_not_be_null("x")
+    dataset.expect_column_unique_value_count_to_be_between("s", 1, 10)
+    dataset.expect_column_most_common_value_to_be_in_set("s", ["a"])
+    dataset.expect_column_distinct_values_to_equal_set("s", ["a", "b", "c", "zz"])
+
+
+def test_partition_aggregates_dataset_matches_dataset_of_all_partitions(partitions):
+    partitions["20200101"]["t"] = pd.to_datetime(
+        ["2020-01-01", "2020-01-02", "2020-01-01", None]
+    )
+    partitions["20200102"]["t"] = pd.to_datetime(
+        ["2020-01-02", "2020-01-03", "2020-01-01"]
+    )
+    partition_aggregates_dataset = _build_partition_aggregates_dataset(
+        partitions, None, []
+    )
+    dataset = PandasDataset(pd.concat(partitions.values(), ignore_index=True))
+    for validated_dataset in [partition_aggregates_dataset, dataset]:
+        validated_dataset.set_default_expectation_argument("result_format", "SUMMARY")
+        _add_expectations(validated_dataset)
+        validated_dataset.expect_column_distinct_values_to_be_in_set(
+            "t",
+            [
+                datetime.datetime(2020, 1, 1),
+                datetime.datetime(2020, 1, 2),
+                datetime.datetime(2020, 1, 3),
+            ],
+            parse_strings_as_datetimes=True,
+        )
+        validated_dataset.expect_column_distinct_values_to_equal_set(
+            "t",
+            [datetime.datetime(2020, 1, 1), datetime.datetime(2020, 1, 3)],
+            parse_strings_as_datetimes=True,
+        )
+        validated_dataset.expect_column_unique_value_count_to_be_between("t", 3, 3)
+        validated_dataset.expect_column_min_to_be_between(
+            "t",
+            min_value=datetime.datetime(2020, 1, 1),
+            max_value=datetime.datetime(2020, 1, 1),
+            parse_strings_as_datetimes=True,
+        )
+
+    expected_results = dataset.validate().results
+    results = partition_aggregates_dataset.validate().results
+    assert len(results) == len(expected_results) == 14
+    assert [result.success for result in results[-4:]] == [True, False, True, True]
+    for result, expected_result in zip(results, expected_results):
+        assert result.expectation_config == expected_result.expectation_config
+        assert result.success == expected_result.success
+        for key in ["observed_value", "unexpected_count", "partial_unexpected_list"]:
+            assert result.result.get(key) == expected_result.result.get(key)
+
+
+def test_partition_aggregates_dataset_merges_moments_ranges_and_histograms(partitions,):
+    partitions["20200103"] = pd.DataFrame(
+        {"x": pd.Series([None, None], dtype="float64"), "s": ["a", "b"]}
+    )
+    partition_aggregates_dataset = _build_partition_aggregates_dataset(
+        partitions, None, []
+    )
+    dataset = PandasDataset(pd.concat(partitions.values(), ignore_index=True))
+
+    assert partition_aggregates_dataset.get_column_stdev("x") == pytest.approx(
+        dataset.get_column_stdev("x")
+    )
+    for kwargs in [
+        {"min_val": 2, "max_val": 5},
+        {"min_val": 2, "max_val": 5, "strict_min": True, "strict_max": False},
+        {"max_val": 4},
+    ]:
+        assert partition_aggregates_dataset.get_column_count_in_range(
+            "x", **kwargs
+        ) == dataset.get_column_count_in_range("x", **kwargs)
+    bins = [0, 2.5, 5, 100]
+    assert partition_aggregates_dataset.get_column_hist(
+        "x", bins
+    ) == dataset.get_column_hist("x", bins)
+    assert partition_aggregates_dataset.expect_column_stdev_to_be_between(
+        "x", 20, 30
+    ).success
+
+
+def test_partition_aggregates_dataset_parses_datetime_extrema():
+    partitions = {
+        "20200101": pd.DataFrame(
+            {"t": pd.to_datetime(["2020-01-01 10:00", "2020-01-01 12:00"])}
+        ),
+        "20200102": pd.DataFrame({"t": pd.to_datetime(["2020-01-02 08:00", None])}),
+        "20200103": pd.DataFrame({"t": pd.to_datetime([None])}),
+    }
+    dataset = _build_partition_aggregates_dataset(partitions, None, [])
+    assert dataset.get_column_min("t") == datetime.datetime(2020, 1, 1, 10)
+    assert dataset.get_column_max("t") == datetime.datetime(2020, 1, 2, 8)
+    assert dataset.expect_column_max_to_be_between(
+        "t",
+        min_value=datetime.datetime(2020, 1, 2),
+        max_value=datetime.datetime(2020, 1, 3),
+    ).success
+
+
+def test_partition_aggregates_dataset_only_loads_new_partitions(partitions):
+    store = PartitionAggregateStore()
+    loaded_partition_ids = []
+    dataset = _build_partition_aggregates_dataset(
+        partitions, store, loaded_partition_ids
+    )
+    _add_expectations(dataset)
+    suite = dataset.get_expectation_suite(discard_failed_expectations=False)
+    assert not dataset.validate().success
+    assert loaded_partition_ids == ["20200101", "20200102"]
+    assert len(store.list_keys()) == 2
+
+    partitions["20200103"] = pd.DataFrame({"x": [-100, 5], "s": ["b", "b"]})
+    loaded_partition_ids.clear()
+    dataset = _build_partition_aggregates_dataset(
+        partitions, store, loaded_partition_ids
+    )
+    results = {
+        result.expectation_config.expectation_type: result.result
+        for result in dataset.validate(
+            expectation_suite=suite, result_format="SUMMARY"
+        ).results
+    }
+    assert loaded_partition_ids == ["20200103"]
+    assert results["expect_table_row_count_to_be_between"]["observed_value"] == 9
+    assert results["expect_column_sum_to_be_between"]["observed_value"] == -20
+    assert results["expect_column_values_to_be_in_set"]["unexpected_count"] == 2
+
+    # The aggregates needed by a new expectation are computed over every partition
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_min_to_be_between",
+            kwargs={"column": "x", "min_value": -200, "max_value": 0},
+        )
+    )
+    loaded_partition_ids.clear()
+    dataset = _build_partition_aggregates_dataset(
+        partitions, store, loaded_partition_ids
+    )
+    assert dataset.validate(expectation_suite=suite).results[-1].success
+    assert loaded_partition_ids == ["20200101", "20200102", "20200103"]
+
+
+def test_partition_aggregates_dataset_raises_for_unmergeable_aggregates(partitions):
+    dataset = _build_partition_aggregates_dataset(partitions, None, [])
+    with pytest.raises(NotImplementedError):
+        dataset.expect_column_median_to_be_between("x", 0, 10)
+    with pytest.raises(NotImplementedError):
+        dataset.expect_column_values_to_be_unique("x")
+
+    # Value counts are only merged for values which can be serialized and parsed back
+    dataset = _build_partition_aggregates_dataset(
+        {"20200101": pd.DataFrame({"d": pd.to_timedelta(["1 day", "2 days"])})},
+        None,
+        [],
+    )
+    with pytest.raises(NotImplementedError):
+        dataset.get_column_value_counts("d")
+
+
+def test_get_incremental_batch(empty_data_context, tmp_path_factory):
+    context = empty_data_context
+    base_directory = str(tmp_path_factory.mktemp("test_get_incremental_batch"))
+    os.makedirs(os.path.join(base_directory, "events"))
+    for partition_id, values in [("20200101", [1, 2]), ("20200102", [3])]:
+        pd.DataFrame({"x": values}).to_csv(
+            os.path.join(base_directory, "events", partition_id + ".csv"), index=False
+        )
+    context.add_datasource(
+        "files",
+        class_name="PandasDatasource",
+        batch_kwargs_generators={
+            "subdir_reader": {
+                "class_name": "SubdirReaderBatchKwargsGenerator",
+                "base_directory": base_directory,
+            }
+        },
+    )
+    context.add_store(
+        "partition_aggregate_store", {"class_name": "PartitionAggregateStore"}
+    )
+    suite = ExpectationSuite(expectation_suite_name="events.warning")
+
+    batch = context.get_incremental_batch("files", "subdir_reader", "events", suite)
+    assert batch.partition_ids == ["20200101", "20200102"]
+    assert batch.expect_table_row_count_to_equal(3).success
+    assert batch.expect_column_sum_to_be_between("x", 6, 6).success
+    results = context.run_validation_operator(
+        "action_list_operator", assets_to_validate=[batch]
+    )
+    assert results.success
+    assert [
+        key.partition_id
+        for key in context.stores["partition_aggregate_store"].list_keys()
+    ] == ["20200101", "20200102"]
@@ -424,3 +424,69 @@ def test_expect_column_values_to_be_json_parseable(spark_session):
         out = D.expect_column_values_to_be_json_parseable(**t["in"])
         assert t["out"]["success"] == out.success
         assert t["out"]["unexpected_list"] == out.result["unexpected_list"]
+
+
+def test_string_parsing_expectations_on_repeated_and_non_string_values(spark_session,):
+    schema = {"json_schema": {"type": "object", "required": ["a"]}}
+    df = spark_session.createDataFrame(
+        pd.DataFrame(
+            {
+                "dates": ["2020-01-01"] * 9 + ["2020-13-01"],
+                "json_col": ['{"a": 1}'] * 9 + ['{"b": 1}'],
+                "ints": list(range(10)),
+            }
+        )
+    )
+    D = SparkDFDataset(df)
+    D.set_default_expectation_argument("result_format", "COMPLETE")
+
+    out = D.expect_column_values_to_match_strftime_format("dates", "%Y-%m-%d")
+    assert not out.success
+    assert out.result["unexpected_list"] == ["2020-13-01"]
+
+    out = D.expect_column_values_to_match_json_schema("json_col", **schema)
+    assert not out.success
+    assert out.result["unexpected_list"] == ['{"b": 1}']
+
+    out = D.expect_column_values_to_be_json_parseable("ints")
+    assert not out.success
+    assert out.result["unexpected_count"] == 10
+
+    out = D.expect_column_values_to_match_strftime_format(
+        "ints", "%Y", catch_exceptions=True
+    )
+    assert out.exception_info["raised_exception"]
+
+
+def test_validate_prefetches_column_aggregates_in_one_job(spark_session):
+    df = spark_session.createDataFrame(
+        pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "y", None]})
+    )
+    D = SparkDFDataset(df)
+    D.expect_column_mean_to_be_between("a", 2, 3)
+    D.expect_column_max_to_be_between("a", 4, 4)
+    D.expect_column_quantile_values_to_be_between(
+        "a",
+        {"quantiles": [0.0, 1.0], "value_ranges": [[1, 1], [4, 4]]},
+        allow_relative_error=0.01,
+    )
+    D.expect_column_unique_value_count_to_be_between("b", 2, 2)
+    D.expect_column_values_to_not_be_null("b", mostly=0.5)
+
+    # A fresh dataset, so that the getters have not cached anything yet
+    D = SparkDFDataset(df, expectation_suite=D.get_expectation_suite())
+    D._prefetch_expectation_metrics(D.get_expectation_suite().expectations)
+    assert D._batched_aggregates[("row_count",)] == 4
+    assert D._batched_aggregates[("nonnull_count", "b")] == 3
+    assert D._batched_aggregates[("mean", "a")] == 2.5
+    assert D._batched_aggregates[("max", "a")] == 4
+    assert D._batched_aggregates[("unique_count", "b")] == 2
+    assert D._batched_aggregates[("quantiles", "a", (0.0, 1.0), 0.01)] == [1.0, 4.0]
+
+    results = D.validate()
+    assert results.success
+    assert results.statistics["evaluated_expectations"] == 5
+
+    D = SparkDFDataset(df, caching=False)
+    D._prefetch_expectation_metrics(D.get_expectation_suite().expectations)
+    assert D._batched_aggregates == {}
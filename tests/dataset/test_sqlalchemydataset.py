@@ -2,6 +2,7 @@ try:
     from unittest import mock
 except ImportError:
     from unittest import mock
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -341,3 +342,134 @@ def test_expect_compound_columns_to_be_unique(sa):
     assert dataset.expect_compound_columns_to_be_unique(
         ["col1", "col2", "col4"]
     ).success
+    # Every row of every duplicated group is unexpected
+    assert dataset.expect_compound_columns_to_be_unique(["col1"]).result[
+        "unexpected_percent"
+    ] == pytest.approx(100.0 * 6 / 8)
+
+
+def test_expect_compound_columns_to_be_unique_postgresql(sa, test_backends):
+    if "postgresql" not in test_backends:
+        pytest.skip("Skipping test designed for postgresql on non-postgresql backend.")
+
+    engine = sa.create_engine("postgresql://postgres@localhost/test_ci")
+    data = pd.DataFrame(
+        {"col1": [1, 2, 3, 1, 2, 3, 4, 5], "col2": [1, 2, 3, 1, 2, 3, 4, 5]}
+    )
+    data.to_sql(
+        name="test_compound_unique_data", con=engine, index=False, if_exists="replace"
+    )
+    dataset = SqlAlchemyDataset("test_compound_unique_data", engine=engine)
+
+    result = dataset.expect_compound_columns_to_be_unique(["col1", "col2"])
+    assert not result.success
+    # SUM is a NUMERIC on postgresql; the count must still combine with the float percentage
+    assert isinstance(result.result["unexpected_percent"], float)
+    assert result.result["unexpected_percent"] == pytest.approx(100.0 * 6 / 8)
+
+
+def test_get_column_hist_uniform_bins_matches_numpy(sa):
+    engine = sa.create_engine("sqlite://")
+    values = [0, 0.1, 0.2, 0.3, 1, 2, 2.5, 3, 4, 5, 6, 7, 8, 9, 9.99, 10]
+    data = pd.DataFrame({"a": values + [None, -1, 11]})
+    data.to_sql(name="test_hist_data", con=engine, index=False)
+    dataset = SqlAlchemyDataset("test_hist_data", engine=engine)
+
+    for bins in [
+        tuple(np.linspace(0, 10, 11)),
+        tuple(np.linspace(0, 10, 4)),
+        tuple(np.linspace(0.1, 0.7, 7)),
+        (0, 1, 5, 10),
+    ]:
+        expected_hist, _ = np.histogram(values, bins=bins)
+        assert dataset.get_column_hist("a", bins) == list(expected_hist)
+
+
+@pytest.fixture
+def quantiles_query_dataset(sa):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql(
+        name="test_quantiles_data", con=engine, index=False
+    )
+    return SqlAlchemyDataset("test_quantiles_data", engine=engine)
+
+
+def _get_compiled_query(dataset, quantiles_method, dialect, scalar, **kwargs):
+    """Run a quantiles method against a mocked engine and compile the query it executes for dialect."""
+    dataset.engine = mock.MagicMock()
+    dataset.engine.execute.return_value.scalar.return_value = scalar
+    result = quantiles_method(**kwargs)
+    query = dataset.engine.execute.call_args[0][0]
+    compiled = str(
+        query.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    )
+    return result, " ".join(compiled.split())
+
+
+def test_get_column_quantiles_postgresql_query(quantiles_query_dataset):
+    from sqlalchemy.dialects import postgresql
+
+    result, compiled = _get_compiled_query(
+        quantiles_query_dataset,
+        quantiles_query_dataset._get_column_quantiles_postgresql,
+        postgresql.dialect(),
+        scalar=[1, 2, 3],
+        column="a",
+        quantiles=(0.25, 0.5, 0.75),
+    )
+    assert result == [1, 2, 3]
+    assert compiled == (
+        "SELECT percentile_disc(CAST(ARRAY[0.25, 0.5, 0.75] AS FLOAT[])) "
+        "WITHIN GROUP (ORDER BY a ASC) AS anon_1 "
+        "FROM test_quantiles_data"
+    )
+
+
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pybigquery"),
+    reason="pybigquery is not installed",
+)
+def test_get_column_quantiles_bigquery_approx_query(quantiles_query_dataset):
+    from pybigquery.sqlalchemy_bigquery import BigQueryDialect
+
+    result, compiled = _get_compiled_query(
+        quantiles_query_dataset,
+        quantiles_query_dataset._get_column_quantiles_bigquery_approx,
+        BigQueryDialect(),
+        # The boundaries of 4 buckets
+        scalar=[0, 10, 20, 30, 40],
+        column="a",
+        quantiles=(0.25, 0.5, 0.75),
+    )
+    assert result == [10, 20, 30]
+    assert compiled == (
+        "SELECT approx_quantiles(`a`, 4) AS `approx_quantiles_1` "
+        "FROM `test_quantiles_data`"
+    )
+
+
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pyhive"), reason="pyhive is not installed",
+)
+def test_get_column_quantiles_approx_percentile_query(quantiles_query_dataset):
+    from pyhive.sqlalchemy_presto import PrestoDialect
+
+    result, compiled = _get_compiled_query(
+        quantiles_query_dataset,
+        quantiles_query_dataset._get_column_quantiles_approx_percentile,
+        PrestoDialect(),
+        scalar=[1, 2, 3],
+        column="a",
+        quantiles=(0.25, 0.5, 0.75),
+        allow_relative_error=True,
+    )
+    assert result == [1, 2, 3]
+    assert compiled == (
+        'SELECT approx_percentile("a", ARRAY[0.25, 0.5, 0.75]) AS "approx_percentile_1" '
+        'FROM "test_quantiles_data"'
+    )
+
+    with pytest.raises(ValueError):
+        quantiles_query_dataset._get_column_quantiles_approx_percentile(
+            column="a", quantiles=(0.5,), allow_relative_error=False
+        )
@@ -1,10 +1,16 @@
+import datetime
+
 import numpy as np
+import pandas as pd
 import pytest
 
 from great_expectations.dataset import SqlAlchemyDataset
 from great_expectations.dataset.util import (
     build_continuous_partition_object,
+    combine_regex_list,
+    get_uniform_bin_width,
     is_valid_continuous_partition_object,
+    parse_datetime_series,
 )
 
 
@@ -50,3 +56,46 @@ def test_build_continuous_partition_object(
     assert np.allclose(partition["weights"], weights / n)
     assert np.allclose(partition["bins"], bin_edges)
     assert is_valid_continuous_partition_object(partition)
+
+
+def test_get_uniform_bin_width():
+    assert get_uniform_bin_width(list(np.linspace(0, 10, 11))) == 1.0
+    assert get_uniform_bin_width((0, 2, 4)) == 2.0
+    assert get_uniform_bin_width(list(np.linspace(0.1, 0.7, 7))) is not None
+    # Uneven, infinite, or degenerate edges must fall back to explicit comparisons
+    assert get_uniform_bin_width((0, 1, 5, 10)) is None
+    assert get_uniform_bin_width((-np.inf, 0, 1)) is None
+    assert get_uniform_bin_width((0, 1, np.inf)) is None
+    assert get_uniform_bin_width((1, 1)) is None
+    assert get_uniform_bin_width((1,)) is None
+
+
+def test_combine_regex_list():
+    assert combine_regex_list(["^a", "b$"]) == "(?:^a)|(?:b$)"
+    assert combine_regex_list([]) is None
+    # Group references, conditionals, and inline flags depend on their position in the combined expression
+    assert combine_regex_list(["(a)\\1", "b"]) is None
+    assert combine_regex_list(["(?P<x>a)(?P=x)", "b"]) is None
+    assert combine_regex_list(["(?i)a", "b"]) is None
+    assert combine_regex_list(["(?P<x>a)", "(?P<x>b)"]) is None
+
+
+def test_parse_datetime_series():
+    parsed = parse_datetime_series(
+        pd.Series(["2020-01-01", "2020-01-02 10:00", None, "5 Jan 2020"])
+    )
+    assert list(parsed.dropna()) == [
+        pd.Timestamp("2020-01-01"),
+        pd.Timestamp("2020-01-02 10:00"),
+        pd.Timestamp("2020-01-05"),
+    ]
+    assert parse_datetime_series(parsed) is parsed
+
+    # Dates outside of the datetime64 range are parsed by dateutil
+    parsed = parse_datetime_series(pd.Series(["2020-01-01", "0001-01-01"]))
+    assert list(parsed) == [datetime.datetime(2020, 1, 1), datetime.datetime(1, 1, 1)]
+
+    with pytest.raises(ValueError):
+        parse_datetime_series(pd.Series(["2020-01-01", "covfefe"]))
+    with pytest.raises(TypeError):
+        parse_datetime_series(pd.Series(["2020-01-01", 20200101]))
@@ -1,3 +1,4 @@
+import gc
 import os
 from unittest import mock
 
@@ -9,6 +10,7 @@ import great_expectations.dataset.sqlalchemy_dataset
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.batch import Batch
 from great_expectations.dataset import SqlAlchemyDataset
+from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyMaterializationCache
 from great_expectations.datasource import SqlAlchemyDatasource
 from great_expectations.validator.validator import Validator
 
@@ -211,6 +213,82 @@ def test_sqlalchemy_source_limit(sqlitedb_engine):
     assert limited_dataset.head(10)["col_1"][0] == 3  # offset should have been applied
 
 
+def test_sqlalchemy_source_mod_sampling(sqlitedb_engine):
+    df1 = pd.DataFrame({"col_1": range(20), "col_2": ["a"] * 20})
+    df1.to_sql("table_1", con=sqlitedb_engine, index=True)
+    datasource = SqlAlchemyDatasource("SqlAlchemy", engine=sqlitedb_engine)
+    batch_kwargs = {
+        "table": "table_1",
+        "sampling_method": "mod",
+        "sampling_kwargs": {"column_name": "col_1", "mod": 5, "value": 2},
+    }
+    sampled_batch = datasource.get_batch(batch_kwargs)
+    assert sampled_batch.batch_markers["sampling"]["sampling_method"] == "mod"
+    assert "WHERE" in sampled_batch.batch_markers["sampling"]["query"]
+    sampled_dataset = Validator(
+        sampled_batch,
+        expectation_suite=ExpectationSuite("test"),
+        expectation_engine=SqlAlchemyDataset,
+    ).get_dataset()
+    assert sorted(sampled_dataset.head(10)["col_1"]) == [2, 7, 12, 17]
+
+    # The same sample is drawn every time
+    resampled_batch = datasource.get_batch(batch_kwargs)
+    assert (
+        resampled_batch.batch_markers["sampling"]["query"]
+        == sampled_batch.batch_markers["sampling"]["query"]
+    )
+
+
+def test_sqlalchemy_source_tablesample_falls_back_to_mod(sqlitedb_engine):
+    df1 = pd.DataFrame({"col_1": range(20), "col_2": ["a"] * 20})
+    df1.to_sql("table_1", con=sqlitedb_engine, index=True)
+    datasource = SqlAlchemyDatasource("SqlAlchemy", engine=sqlitedb_engine)
+    sampled_batch = datasource.get_batch(
+        {
+            "table": "table_1",
+            "sampling_method": "tablesample",
+            "sampling_kwargs": {"percent": 25, "column_name": "col_1"},
+        }
+    )
+    sampled_dataset = Validator(
+        sampled_batch,
+        expectation_suite=ExpectationSuite("test"),
+        expectation_engine=SqlAlchemyDataset,
+    ).get_dataset()
+    assert sorted(sampled_dataset.head(10)["col_1"]) == [0, 4, 8, 12, 16]
+
+    # Without a column to partition on, sqlite cannot sample
+    with pytest.raises(ValueError):
+        datasource.get_batch(
+            {
+                "table": "table_1",
+                "sampling_method": "tablesample",
+                "sampling_kwargs": {"percent": 25},
+            }
+        )
+
+
+def test_sqlalchemy_source_tablesample_clause(sqlitedb_engine):
+    datasource = SqlAlchemyDatasource("SqlAlchemy", engine=sqlitedb_engine)
+    datasource.engine.dialect.name = "postgresql"
+    assert (
+        datasource._get_tablesample_clause(
+            {"percent": 10, "seed": 42, "tablesample_method": "bernoulli"}
+        )
+        == "TABLESAMPLE BERNOULLI (10.0) REPEATABLE (42)"
+    )
+    datasource.engine.dialect.name = "bigquery"
+    assert (
+        datasource._get_tablesample_clause({"percent": 10})
+        == "TABLESAMPLE SYSTEM (10.0 PERCENT)"
+    )
+    with pytest.raises(ValueError):
+        datasource._get_tablesample_clause({"percent": 10, "seed": 42})
+    datasource.engine.dialect.name = "sqlite"
+    assert datasource._get_tablesample_clause({"percent": 10}) is None
+
+
 def test_sqlalchemy_datasource_query_and_table_handling(sqlitedb_engine):
     # MANUALLY SET DIALECT NAME FOR TEST
     datasource = SqlAlchemyDatasource("SqlAlchemy", engine=sqlitedb_engine)
@@ -220,7 +298,11 @@ def test_sqlalchemy_datasource_query_and_table_handling(sqlitedb_engine):
     ) as mock_batch:
         datasource.get_batch({"query": "select * from foo;"})
     mock_batch.assert_called_once_with(
-        engine=sqlitedb_engine, schema=None, query="select * from foo;", table_name=None
+        engine=sqlitedb_engine,
+        schema=None,
+        query="select * from foo;",
+        table_name=None,
+        materialization_cache=None,
     )
 
     # Normally, we do not allow both query and table_name
@@ -230,7 +312,11 @@ def test_sqlalchemy_datasource_query_and_table_handling(sqlitedb_engine):
     ) as mock_batch:
         datasource.get_batch({"query": "select * from foo;", "table_name": "bar"})
     mock_batch.assert_called_once_with(
-        engine=sqlitedb_engine, schema=None, query="select * from foo;", table_name=None
+        engine=sqlitedb_engine,
+        schema=None,
+        query="select * from foo;",
+        table_name=None,
+        materialization_cache=None,
     )
 
     # Snowflake should require query *and* snowflake_transient_table
@@ -247,6 +333,7 @@ def test_sqlalchemy_datasource_query_and_table_handling(sqlitedb_engine):
         schema=None,
         query="select * from foo;",
         table_name="bar",
+        materialization_cache=None,
     )
 
 
@@ -280,3 +367,231 @@ def test_sqlalchemy_datasource_processes_dataset_options(test_db_connection_stri
     validator = Validator(batch, ExpectationSuite(expectation_suite_name="foo"))
     dataset = validator.get_dataset()
     assert dataset.caching is False
+
+
+def test_sqlalchemy_datasource_reuses_materialized_queries(test_db_connection_string):
+    datasource = SqlAlchemyDatasource(
+        "SqlAlchemy",
+        credentials={"url": test_db_connection_string},
+        materialization_cache_ttl=3600,
+    )
+    assert datasource.config["materialization_cache_ttl"] == 3600
+
+    def get_dataset(query):
+        batch = datasource.get_batch({"query": query})
+        return Validator(
+            batch, ExpectationSuite(expectation_suite_name="foo")
+        ).get_dataset()
+
+    with mock.patch.object(
+        SqlAlchemyDataset,
+        "create_temporary_table",
+        autospec=True,
+        side_effect=SqlAlchemyDataset.create_temporary_table,
+    ) as mock_create:
+        dataset_1 = get_dataset("select * from table_1 where col_1 > 1;")
+        # Whitespace differences do not change the identity of the query
+        dataset_2 = get_dataset("select *\n  from table_1 where col_1 > 1")
+        dataset_3 = get_dataset("select * from table_1 where col_1 > 2;")
+
+    assert mock_create.call_count == 2
+    assert dataset_1._table.name == dataset_2._table.name
+    assert dataset_1._table.name != dataset_3._table.name
+    assert dataset_2.get_row_count() == 4
+    assert dataset_3.get_row_count() == 3
+
+    datasource.invalidate_materialized_queries(
+        {"query": "select * from table_1 where col_1 > 1;"}
+    )
+    with mock.patch.object(
+        SqlAlchemyDataset,
+        "create_temporary_table",
+        autospec=True,
+        side_effect=SqlAlchemyDataset.create_temporary_table,
+    ) as mock_create:
+        dataset_4 = get_dataset("select * from table_1 where col_1 > 1;")
+        dataset_5 = get_dataset("select * from table_1 where col_1 > 2;")
+    assert mock_create.call_count == 1
+    assert dataset_4._table.name != dataset_1._table.name
+    # The invalidated table is only dropped once the datasets using it are gone
+    assert dataset_1.get_row_count() == 4
+    assert dataset_5._table.name == dataset_3._table.name
+    assert dataset_4.get_row_count() == 4
+
+
+def test_sqlalchemy_datasource_materialization_cache_expires(
+    test_db_connection_string,
+):
+    datasource = SqlAlchemyDatasource(
+        "SqlAlchemy",
+        credentials={"url": test_db_connection_string},
+        materialization_cache_ttl=0,
+    )
+    batch_kwargs = {"query": "select * from table_1;"}
+    dataset_1 = Validator(
+        datasource.get_batch(batch_kwargs),
+        ExpectationSuite(expectation_suite_name="foo"),
+    ).get_dataset()
+    dataset_2 = Validator(
+        datasource.get_batch(batch_kwargs),
+        ExpectationSuite(expectation_suite_name="foo"),
+    ).get_dataset()
+    assert dataset_1._table.name != dataset_2._table.name
+    assert dataset_2.get_row_count() == 5
+    # The expired table is kept while a dataset still uses it
+    assert dataset_1.get_row_count() == 5
+
+    # Collect the datasets of other tests first
+    gc.collect()
+    with mock.patch.object(
+        SqlAlchemyMaterializationCache, "_drop_table"
+    ) as mock_drop_table:
+        del dataset_1
+        gc.collect()
+        assert mock_drop_table.call_count == 1
+        assert mock_drop_table.call_args[0][0]["table_name"] != dataset_2._table.name
+
+
+def test_sqlalchemy_datasource_does_not_reuse_unseeded_samples(
+    test_db_connection_string,
+):
+    datasource = SqlAlchemyDatasource(
+        "SqlAlchemy",
+        credentials={"url": test_db_connection_string},
+        materialization_cache_ttl=3600,
+    )
+
+    def get_dataset(sampling_kwargs):
+        batch = datasource.get_batch(
+            {
+                "table": "table_1",
+                "sampling_method": "random",
+                "sampling_kwargs": sampling_kwargs,
+            }
+        )
+        return Validator(
+            batch, ExpectationSuite(expectation_suite_name="foo")
+        ).get_dataset()
+
+    dataset_1 = get_dataset({"percent": 50})
+    dataset_2 = get_dataset({"percent": 50})
+    assert dataset_1._table.name != dataset_2._table.name
+
+
+def test_sqlalchemy_datasource_reuses_reflection_and_pooled_connections(
+    test_db_connection_string, sa
+):
+    datasource = SqlAlchemyDatasource(
+        "SqlAlchemy",
+        connection_string=test_db_connection_string,
+        reflection_cache_ttl=60,
+        pool_size=1,
+        max_overflow=0,
+        poolclass=sa.pool.QueuePool,
+        pool_timeout=1,
+    )
+    assert datasource.config["reflection_cache_ttl"] == 60
+    assert datasource.config["pool_size"] == 1
+    assert datasource.config["max_overflow"] == 0
+    assert datasource.engine.pool.size() == 1
+
+    with mock.patch(
+        "great_expectations.dataset.sqlalchemy_dataset.reflection.Inspector.from_engine",
+        wraps=great_expectations.dataset.sqlalchemy_dataset.reflection.Inspector.from_engine,
+    ) as mock_from_engine:
+        for _ in range(3):
+            dataset = Validator(
+                datasource.get_batch({"table": "table_1"}),
+                expectation_suite=ExpectationSuite("test"),
+                expectation_engine=SqlAlchemyDataset,
+            ).get_dataset()
+            # Table batches do not hold on to a connection, so the single pooled connection is always available
+            assert dataset.expect_column_values_to_not_be_null("col_1").success
+        assert mock_from_engine.call_count == 1
+    assert dataset.get_table_columns() == ["index", "col_1", "col_2"]
+    assert datasource.engine.pool.checkedout() == 0
+
+    datasource.reflection_cache.invalidate("table_1")
+    assert datasource.reflection_cache.get("table_1") is None
+
+
+def test_sqlalchemy_datasource_ignores_pool_size_for_pools_without_one(
+    test_db_connection_string,
+):
+    # sqlite uses a NullPool for files, which has no size
+    datasource = SqlAlchemyDatasource(
+        "SqlAlchemy",
+        connection_string=test_db_connection_string,
+        pool_size=1,
+        max_overflow=0,
+    )
+    assert datasource.config["pool_size"] == 1
+    assert datasource.engine.pool.__class__.__name__ == "NullPool"
+    assert datasource.get_batch({"table": "table_1"}) is not None
+
+
+def test_sqlalchemy_query_batch_releases_connection_after_validation(
+    test_db_connection_string, sa
+):
+    datasource = SqlAlchemyDatasource(
+        "SqlAlchemy",
+        connection_string=test_db_connection_string,
+        pool_size=1,
+        max_overflow=0,
+        poolclass=sa.pool.QueuePool,
+        pool_timeout=1,
+    )
+    dataset = Validator(
+        datasource.get_batch({"query": "select * from table_1 where col_1 > 1"}),
+        expectation_suite=ExpectationSuite("test"),
+        expectation_engine=SqlAlchemyDataset,
+    ).get_dataset()
+    assert datasource.engine.pool.checkedout() == 1
+    dataset.expect_column_values_to_not_be_null("col_1")
+
+    assert dataset.validate().success
+    assert datasource.engine.pool.checkedout() == 0
+    # The single pooled connection is available to other batches
+    other_dataset = Validator(
+        datasource.get_batch({"table": "table_1"}),
+        expectation_suite=ExpectationSuite("test"),
+        expectation_engine=SqlAlchemyDataset,
+    ).get_dataset()
+    assert other_dataset.get_row_count() == 5
+
+    # The temporary table is re-created when the dataset is used again
+    assert dataset.get_row_count() == 4
+    assert datasource.engine.pool.checkedout() == 1
+    assert dataset.validate().success
+    assert datasource.engine.pool.checkedout() == 0
+
+
+def test_sqlalchemy_query_batch_keeps_table_named_by_caller_after_validation(
+    test_db_connection_string, sa
+):
+    engine = sa.create_engine(test_db_connection_string)
+    created_tables = []
+
+    def create_temporary_table(self, table_name, custom_sql, schema_name=None):
+        # snowflake creates the tables named by the caller as TRANSIENT tables, which persist
+        created_tables.append(table_name)
+        self.engine.execute(
+            "CREATE TABLE {table_name} AS {custom_sql}".format(
+                table_name=table_name, custom_sql=custom_sql
+            )
+        )
+
+    with mock.patch.object(engine.dialect, "name", "snowflake"), mock.patch.object(
+        SqlAlchemyDataset, "create_temporary_table", create_temporary_table
+    ):
+        dataset = SqlAlchemyDataset(
+            table_name="my_query_table",
+            custom_sql="select * from table_1 where col_1 > 1",
+            engine=engine,
+        )
+        dataset.expect_column_values_to_not_be_null("col_1")
+        assert dataset.validate().success
+
+        assert dataset.get_row_count() == 4
+        assert created_tables == ["my_query_table"]
+    assert "my_query_table" in sa.inspect(engine).get_table_names()
@@ -0,0 +1,120 @@
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Dependencies which should only be imported when the parts of great_expectations needing them are used
+HEAVY_DEPENDENCIES = [
+    "altair",
+    "black",
+    "IPython",
+    "jinja2",
+    "pandas",
+    "scipy",
+    "sqlalchemy",
+]
+
+# Run the subprocesses from the root of the repository, since other tests may change the working directory
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _get_imported_modules(statement):
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            statement + "; import json, sys; print(json.dumps(sorted(sys.modules)))",
+        ],
+        cwd=ROOT_DIR,
+    )
+    return set(json.loads(output.decode().splitlines()[-1]))
+
+
+def _get_cumulative_import_times(statement):
+    """Return the cumulative import time in microseconds of each top level module imported by statement."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stderr=subprocess.PIPE,
+        check=True,
+        cwd=ROOT_DIR,
+    ).stderr.decode()
+    import_times = {}
+    for line in output.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\S+)$", line)
+        if match:
+            import_times[match.group(2)] = int(match.group(1))
+    return import_times
+
+
+def test_import_great_expectations_does_not_import_heavy_dependencies():
+    modules = _get_imported_modules("import great_expectations")
+    assert not modules & set(HEAVY_DEPENDENCIES)
+    assert "great_expectations.data_context.data_context" not in modules
+
+
+def test_import_data_context_does_not_import_renderers():
+    modules = _get_imported_modules(
+        "from great_expectations.data_context import DataContext"
+    )
+    assert "great_expectations.render.renderer" not in modules
+    assert not modules & {"altair", "black", "IPython"}
+
+
+def test_import_great_expectations_is_faster_than_import_pandas():
+    # If great_expectations imported pandas, the import time of pandas would be counted in great_expectations
+    import_times = _get_cumulative_import_times(
+        "import great_expectations; import pandas"
+    )
+    assert import_times["great_expectations"] < import_times["pandas"]
+
+
+def test_lazy_attributes_are_imported_on_first_access():
+    import great_expectations as ge
+    from great_expectations.data_context.data_context import DataContext
+    from great_expectations.util import read_csv
+
+    assert ge.DataContext is DataContext
+    assert ge.data_context.DataContext is DataContext
+    assert ge.read_csv is read_csv
+    assert ge.dataset.PandasDataset.__name__ == "PandasDataset"
+    assert {"DataContext", "read_csv"} <= set(dir(ge))
+    with pytest.raises(AttributeError):
+        ge.not_an_attribute
+
+
+def test_import_cli_does_not_import_subcommands():
+    modules = _get_imported_modules("import great_expectations.cli")
+    assert not modules & set(HEAVY_DEPENDENCIES)
+    assert "great_expectations.cli.checkpoint" not in modules
+    assert "great_expectations.cli.toolkit" not in modules
+
+
+def test_import_cli_checkpoint_does_not_import_data_context():
+    # Running a checkpoint on a checkpoint server only needs the client
+    modules = _get_imported_modules("import great_expectations.cli.checkpoint")
+    # sqlalchemy.exc is imported to catch database errors
+    assert not modules & (set(HEAVY_DEPENDENCIES) - {"sqlalchemy"})
+    assert "nbformat" not in modules
+    assert "great_expectations.cli.toolkit" not in modules
+    assert "great_expectations.data_context.data_context" not in modules
+
+
+def test_cli_subcommands_are_imported_on_first_use():
+    from great_expectations.cli import cli
+    from great_expectations.cli.checkpoint import checkpoint
+
+    assert cli.get_command(None, "checkpoint") is checkpoint
+    assert cli.get_command(None, "not-a-command") is None
+    assert cli.list_commands(None) == [
+        "checkpoint",
+        "datasource",
+        "docs",
+        "init",
+        "project",
+        "store",
+        "suite",
+        "validation-operator",
+    ]